@@ -10,6 +10,8 @@ import time
 from typing import Optional, Callable, Tuple
 import logging
 
+from core.phonetic import PhoneticIndex
+
 logger = logging.getLogger(__name__)
 
 # Check PyAudio availability
@@ -55,17 +57,19 @@ class STTEngine:
         
         # Wake word state
         self._wake_words: list = []
+        self._wake_index: Optional[PhoneticIndex] = None
+        self._mishearings: list = []
         self._listening_for_command = False
         self._last_wake_time = 0
         self._command_timeout = 30
-        
+    
     def initialize(self) -> bool:
         """Initialize the STT engine"""
         if not PYAUDIO_AVAILABLE:
             logger.error("PyAudio not installed - voice input unavailable")
             logger.error("Run: python main.py --text  for text mode")
             return False
-            
+        
         try:
             # Configure recognizer
             self._recognizer.energy_threshold = self._energy_threshold
@@ -80,14 +84,23 @@ class STTEngine:
             
             logger.info(f"STT Engine initialized. Energy threshold: {self._recognizer.energy_threshold}")
             return True
-            
+        
         except Exception as e:
             logger.error(f"Failed to initialize STT: {e}")
             return False
     
-    def set_wake_words(self, wake_words: list):
-        """Set wake words for activation"""
+    def set_wake_words(self, wake_words: list, mishearings: Optional[list] = None):
+        """
+        Set wake words for activation
+        
+        Args:
+            wake_words: Wake words and phrases
+            mishearings: Words the recognizer hears instead of a wake word
+                ("service"), accepted only when spelled exactly so
+        """
         self._wake_words = [w.lower() for w in wake_words]
+        self._wake_index = PhoneticIndex(self._wake_words)
+        self._mishearings = [m.lower().split() for m in mishearings or []]
         logger.info(f"Wake words set: {self._wake_words}")
     
     def set_callback(self, callback: Callable[[str], None]):
@@ -114,6 +127,20 @@ class STTEngine:
                 command = text_lower[idx + len(wake_word):].strip()
                 return True, command
         
+        # Wake word spelled as it sounds ("jarvas, open chrome"). Only the
+        # exact sound is accepted: a loose match would also wake on
+        # "nervous about the exam" or "curves ahead"
+        words = text_lower.replace(",", " ").split()
+        if self._wake_index is not None:
+            match = self._wake_index.match_prefix(" ".join(words))
+            if match:
+                return True, match[1]
+        
+        # Known mishearing opening the utterance ("service, open chrome")
+        for mishearing in self._mishearings:
+            if words[:len(mishearing)] == mishearing:
+                return True, " ".join(words[len(mishearing):])
+        
         return False, text
     
     def _listen_worker(self):
@@ -147,7 +174,7 @@ class STTEngine:
                     args=(audio,),
                     daemon=True
                 ).start()
-                
+            
             except Exception as e:
                 logger.error(f"Listen worker error: {e}")
                 time.sleep(1)  # Prevent rapid error loops
@@ -160,7 +187,7 @@ class STTEngine:
             
             if not text:
                 return
-                
+            
             logger.debug(f"Heard: {text}")
             
             # Check for wake word
@@ -185,7 +212,7 @@ class STTEngine:
                     self._dispatch_command(text)
                 else:
                     self._listening_for_command = False
-                    
+        
         except sr.UnknownValueError:
             logger.debug("Could not understand audio")
         except sr.RequestError as e:
@@ -211,7 +238,7 @@ class STTEngine:
         """Dispatch recognized command"""
         if not command:
             return
-            
+        
         logger.info(f"Command: {command}")
         self._command_queue.put(("COMMAND", command))
         
@@ -222,7 +249,7 @@ class STTEngine:
         """Start continuous background listening"""
         if self._running:
             return
-            
+        
         self._running = True
         self._listen_thread = threading.Thread(target=self._listen_worker, daemon=True)
         self._listen_thread.start()
@@ -303,7 +330,8 @@ def get_stt() -> STTEngine:
     if _stt_instance is None:
         from config import (
             SR_ENERGY_THRESHOLD, SR_PAUSE_THRESHOLD,
-            SR_PHRASE_TIME_LIMIT, SR_TIMEOUT, SR_LANGUAGE, WAKE_WORDS
+            SR_PHRASE_TIME_LIMIT, SR_TIMEOUT, SR_LANGUAGE, WAKE_WORDS,
+            WAKE_WORD_MISHEARINGS
         )
         _stt_instance = STTEngine(
             energy_threshold=SR_ENERGY_THRESHOLD,
@@ -313,5 +341,5 @@ def get_stt() -> STTEngine:
             language=SR_LANGUAGE
         )
         _stt_instance.initialize()
-        _stt_instance.set_wake_words(WAKE_WORDS)
+        _stt_instance.set_wake_words(WAKE_WORDS, WAKE_WORD_MISHEARINGS)
     return _stt_instance
@@ -25,6 +25,9 @@ DATA_DIR.mkdir(exist_ok=True)
 
 ASSISTANT_NAME = "Jarvis"
 WAKE_WORDS = ["jarvis", "hey jarvis", "ok jarvis", "yo jarvis"]
+# Words the recognizer is known to hear instead of the wake word; matched
+# exactly as the first word(s), never by sound ("serves" is not "service")
+WAKE_WORD_MISHEARINGS = ["service"]
 USER_NAME = "Sir"  # Can be personalized
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -47,12 +50,115 @@ TTS_VOICE_INDEX = 0  # 0 = default, change based on available voices
 # BRAIN CONFIGURATION
 # ══════════════════════════════════════════════════════════════════════════════
 
+# Intent pattern database ("category.action" -> trigger phrases); edits
+# are picked up while running, checked every N seconds (0 = no reload)
+INTENT_PATTERNS_FILE = DATA_DIR / "intent_patterns.json"
+INTENT_PATTERNS_RELOAD_INTERVAL = 2.0
+
+# Compiled pattern indexes are cached here so warm starts skip compiling;
+# rebuilt automatically when the patterns or classifier change (None = off)
+INTENT_SNAPSHOT_CACHE_DIR = DATA_DIR / "cache"
+
 # Intent matching threshold (0-100, higher = stricter)
 INTENT_CONFIDENCE_THRESHOLD = 65
 
+# Classification cache size (repeated commands skip pattern matching, 0 = off)
+INTENT_CACHE_SIZE = 0
+
+# Classifier cascade, cheapest first; each tier stops the cascade on a
+# confident hit. Tiers: learned (utterances resolved before), exact (phrase
+# hash), token (word index), phonetic (misheard words respelled by sound),
+# fuzzy, app
+INTENT_CLASSIFIER_TIERS = ["learned", "exact", "token", "phonetic", "fuzzy", "app"]
+
+# Learn utterance -> intent from resolved conversation turns (0 = off).
+# Entries expire after the TTL and are dropped when a command fails or
+# is cancelled straight away
+INTENT_LEARNED_SIZE = 2000
+INTENT_LEARNED_TTL = 7 * 24 * 3600  # seconds
+INTENT_LEARNED_HISTORY = 500  # conversation rows read at startup
+
+# Scoring engine: "rules" (word/phonetic/fuzzy tiers above) or "tfidf"
+# (char n-gram TF-IDF similarity, needs numpy). Compare the two with:
+#   python main.py --compare-engines
+INTENT_CLASSIFIER_ENGINE = "rules"
+
+# Minimum cosine similarity (0-1) for a TF-IDF match
+INTENT_TFIDF_MIN_SIMILARITY = 0.4
+
+# Runner-up intents kept for single commands (0 = off); the dispatcher
+# tries them in order when the best one has no handler
+INTENT_ALTERNATIVES = 2
+
+# Follow-ups ("close it", "again", "what about firefox") resolve against
+# the previous command of the same session for this long (seconds);
+# sessions beyond the limit are dropped least recently used first
+DIALOGUE_CONTEXT_TTL = 120
+DIALOGUE_MAX_SESSIONS = 256
+
+# Split compound commands ("open chrome and mute") into separate intents
+INTENT_SPLIT_COMPOUND = True
+
 # Conversation mode timeout (seconds)
 CONVERSATION_TIMEOUT = 30
 
+# ══════════════════════════════════════════════════════════════════════════════
+# DISPATCH CONFIGURATION
+# ══════════════════════════════════════════════════════════════════════════════
+
+# Worker threads (normal lane) for running skills off the caller's thread, and
+# independent commands concurrently
+DISPATCH_WORKERS = 4
+
+# Workers reserved for express-lane skills (stop, volume, power), so they
+# never queue behind others
+DISPATCH_EXPRESS_WORKERS = 1
+
+# Workers for bulk-lane skills (AI replies, process scans): at most this
+# many run at once, however many are requested
+DISPATCH_BULK_WORKERS = 2
+
+# Worker processes for skills declared cpu_bound
+DISPATCH_PROCESS_WORKERS = 2
+
+# Circuit breaker: after this many consecutive errors or timeouts a skill
+# is skipped (fails fast) for DISPATCH_BREAKER_RESET seconds
+DISPATCH_BREAKER_FAILURES = 3
+DISPATCH_BREAKER_RESET = 30.0
+
+# Seconds a command may run before Jarvis acknowledges it ("One moment...")
+COMMAND_ACK_DELAY = 1.0
+
+# Results kept per skill that declares a cache_ttl
+SKILL_RESULT_CACHE_SIZE = 32
+
+# Skills that declare max_concurrency: calls that may wait for a slot
+# (unless the skill sets max_queue), and seconds each may wait; calls
+# beyond that are answered "busy" (HTTP 429 from the web API)
+SKILL_QUEUE_SIZE = 4
+SKILL_QUEUE_WAIT = 5.0
+
+# Middleware wrapped around every skill call, outermost first: "timing"
+# (end-to-end latency per skill) and "result_size" (JSON size of results).
+# None by default - an empty chain adds no per-call cost
+DISPATCH_MIDDLEWARE = []
+
+# Skill modules, registered at startup
+SKILL_MODULES = [
+    "skills.system",
+    "skills.apps",
+    "skills.time_date",
+    "skills.web",
+    "skills.conversation",
+]
+
+# Route skills from a manifest parsed from their source and import each
+# module on its first dispatch (False imports every module at startup)
+SKILL_LAZY_LOADING = True
+
+# Where the parsed skill manifest is cached (None = parse on every start)
+SKILL_MANIFEST_CACHE_DIR = DATA_DIR / "cache"
+
 # ══════════════════════════════════════════════════════════════════════════════
 # SYSTEM COMMANDS
 # ══════════════════════════════════════════════════════════════════════════════
@@ -83,6 +189,55 @@ import getpass
 _username = getpass.getuser()
 APP_PATHS = {k: v.replace("{username}", _username) for k, v in APP_PATHS.items()}
 
+# Web-based applications that open in the browser (names also feed the
+# brain's phonetic index, so misheard site names like "you tube" resolve)
+WEB_APPS = {
+    "youtube": "https://www.youtube.com",
+    "netflix": "https://www.netflix.com",
+    "prime video": "https://www.primevideo.com",
+    "amazon prime": "https://www.primevideo.com",
+    "hotstar": "https://www.hotstar.com",
+    "disney plus": "https://www.disneyplus.com",
+    "facebook": "https://www.facebook.com",
+    "instagram": "https://www.instagram.com",
+    "twitter": "https://www.twitter.com",
+    "x": "https://www.x.com",
+    "whatsapp": "https://web.whatsapp.com",
+    "whatsapp web": "https://web.whatsapp.com",
+    "telegram": "https://web.telegram.org",
+    "gmail": "https://mail.google.com",
+    "google mail": "https://mail.google.com",
+    "google drive": "https://drive.google.com",
+    "drive": "https://drive.google.com",
+    "google docs": "https://docs.google.com",
+    "google sheets": "https://sheets.google.com",
+    "google photos": "https://photos.google.com",
+    "github": "https://www.github.com",
+    "linkedin": "https://www.linkedin.com",
+    "reddit": "https://www.reddit.com",
+    "amazon": "https://www.amazon.in",
+    "flipkart": "https://www.flipkart.com",
+    "chatgpt": "https://chat.openai.com",
+    "claude": "https://claude.ai",
+    "google": "https://www.google.com",
+    "wikipedia": "https://www.wikipedia.org",
+    "stackoverflow": "https://stackoverflow.com",
+    "stack overflow": "https://stackoverflow.com",
+    "outlook": "https://outlook.live.com",
+    "spotify web": "https://open.spotify.com",
+    "twitch": "https://www.twitch.tv",
+    "pinterest": "https://www.pinterest.com",
+    "tiktok": "https://www.tiktok.com",
+    "snapchat": "https://www.snapchat.com",
+    "google meet": "https://meet.google.com",
+    "zoom web": "https://zoom.us/join",
+    "notion": "https://www.notion.so",
+    "trello": "https://trello.com",
+    "slack": "https://slack.com",
+    "canva": "https://www.canva.com",
+    "figma": "https://www.figma.com",
+}
+
 # ══════════════════════════════════════════════════════════════════════════════
 # LOGGING CONFIGURATION
 # ══════════════════════════════════════════════════════════════════════════════
@@ -3,13 +3,25 @@ JARVIS AI Brain
 Intent classification, decision making, and response generation
 """
 
-import re
+import hashlib
+import json
 import random
-from typing import Optional, Dict, List, Tuple, Any
-from dataclasses import dataclass
+import re
+import threading
+import time
+from typing import Optional, Dict, List, Set, Tuple, Any
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
 from enum import Enum, auto
 import logging
 
+from .cache import LRUCache, PickleCache
+from .context import DialogueContext, REFERENCE_RE, follow_up, elided_subject, substitute_reference
+from .entities import extract_entities
+from .matcher import IntentMatcher, PhraseHits, MATCHER_VERSION
+from .tfidf import NUMPY_AVAILABLE as TFIDF_AVAILABLE
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -19,6 +31,12 @@ except ImportError:
     FUZZY_AVAILABLE = False
     logger.warning("rapidfuzz not available, using basic matching")
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 
 class IntentCategory(Enum):
     """High-level intent categories"""
@@ -40,6 +58,125 @@ class Intent:
     confidence: float
     entities: Dict[str, Any]
     raw_text: str
+    # Runner-up readings of the same text, best first (see classify_ranked)
+    alternatives: List["Intent"] = field(default_factory=list, repr=False, compare=False)
+
+
+# Web-based apps that should open in browser, not as .exe
+WEB_APP_NAMES = [
+    "youtube", "netflix", "spotify web", "facebook", "instagram",
+    "twitter", "whatsapp", "telegram", "gmail", "google drive",
+    "github", "linkedin", "reddit", "amazon", "flipkart",
+    "chatgpt", "google", "wikipedia", "stackoverflow"
+]
+
+# Common desktop app names
+DESKTOP_APP_NAMES = [
+    "chrome", "firefox", "edge", "browser",
+    "notepad", "calculator", "word", "excel", "powerpoint",
+    "spotify", "discord", "vscode", "code",
+    "file explorer", "explorer", "command prompt", "cmd",
+    "powershell", "terminal", "task manager", "settings",
+    "control panel", "paint", "photos", "camera", "teams",
+    "zoom", "vlc", "media player", "snipping tool"
+]
+
+APP_OPEN_TRIGGERS = ["open", "launch", "start", "run"]
+
+
+# Intent pattern database (overridable via config INTENT_PATTERNS_FILE)
+DEFAULT_PATTERNS_FILE = Path(__file__).resolve().parent.parent / "data" / "intent_patterns.json"
+
+# Modules whose code shapes a compiled snapshot; editing any of them
+# invalidates snapshots cached on disk
+SNAPSHOT_SOURCES = ["matcher.py", "phonetic.py", "tfidf.py"]
+
+# Cached snapshots kept on disk (one per pattern/name/engine combination,
+# e.g. before and after skills register extra app names)
+SNAPSHOT_CACHE_KEEP = 4
+
+# Classification tiers, cheapest first
+CLASSIFIER_TIERS = ["learned", "exact", "token", "phonetic", "fuzzy", "app"]
+
+# Scoring engines: "rules" runs the scoring tiers above; "tfidf" replaces
+# them with one char n-gram TF-IDF similarity tier
+CLASSIFIER_ENGINES = ["rules", "tfidf"]
+RULE_SCORING_TIERS = ("token", "phonetic", "fuzzy")
+
+# Confidence of an utterance resolved the same way before
+LEARNED_CONFIDENCE = 95.0
+
+# Characters ignored when matching an utterance against learned ones
+LEARN_KEY_STRIP_RE = re.compile(r"[^\w\s']")
+
+# Confidence of a follow-up resolved from the previous command ("again")
+CONTEXT_CONFIDENCE = 80.0
+
+# Longest subject accepted in an elliptical follow-up ("what about X")
+MAX_ELIDED_WORDS = 3
+
+# Confidence given up when a match needed misheard words respelled
+PHONETIC_PENALTY = 5.0
+
+# Boundaries between commands in a compound utterance: sentence punctuation,
+# commas and joining conjunctions (captured so segments can be glued back)
+COMPOUND_SPLIT_RE = re.compile(
+    r"(\s*(?:[.;!?]+(?:\s+|$)|,\s*)(?:(?:and then|and|then|also)\s+)?"
+    r"|\s+(?:and then|and|then|also)\s+)",
+    re.IGNORECASE
+)
+
+# Intents whose last slot is free text ("search for black and white
+# photos"): a compound utterance is not split after them
+FREE_TEXT_INTENTS = frozenset([
+    (IntentCategory.WEB, "search"),
+    (IntentCategory.WEB, "youtube"),
+    (IntentCategory.MEMORY, "remember"),
+])
+
+
+class _ClassifyState:
+    """Per-utterance scratch state threaded through the classifier tiers"""
+    
+    __slots__ = (
+        "matcher", "text", "text_lower", "words", "is_short", "candidates",
+        "_hits", "scored", "fuzzy_match", "resume_at", "ranked"
+    )
+    
+    def __init__(
+        self,
+        matcher: IntentMatcher,
+        text: str,
+        text_lower: str,
+        hits: Optional[PhraseHits] = None,
+        candidates: Optional[Dict[int, Set[int]]] = None
+    ):
+        # Pinned so one classification never mixes pattern databases
+        self.matcher = matcher
+        self.text = text
+        self.text_lower = text_lower
+        self.words = text_lower.split()
+        # For very short inputs (1-2 words), be strict with matching
+        self.is_short = len(self.words) <= 2 and len(text_lower) <= 10
+        # Token-index candidates and phrase hits, if maintained incrementally
+        self.candidates = candidates
+        self._hits = hits
+        # Set once a scoring tier has settled the pattern score (even below
+        # threshold), so later scoring tiers are skipped
+        self.scored = False
+        # Precomputed fuzzy result (batch classification)
+        self.fuzzy_match: Optional[Tuple[Optional[str], float]] = None
+        self.resume_at = 0
+        # Intent key -> best acceptable score seen by the tiers that ran
+        # (only collected for ranked classification)
+        self.ranked: Optional[Dict[str, float]] = None
+    
+    @property
+    def hits(self) -> PhraseHits:
+        """Phrase scan of the utterance, run at most once"""
+        if self._hits is None:
+            self._hits = self.matcher.scan(self.text_lower)
+        return self._hits
 
 
 class Brain:
@@ -53,143 +190,865 @@ class Brain:
     - Context awareness
     """
     
-    def __init__(self, confidence_threshold: int = 65):
+    def __init__(
+        self,
+        confidence_threshold: int = 65,
+        cache_size: int = 0,
+        tiers: Optional[List[str]] = None,
+        split_compound: bool = True,
+        app_names: Optional[List[str]] = None,
+        learned_size: int = 0,
+        learned_ttl: float = 0,
+        engine: str = "rules",
+        tfidf_min_similarity: float = 0.4,
+        alternatives: int = 0,
+        context_sessions: int = 256,
+        context_ttl: float = 120.0,
+        patterns_path: Optional[Path] = None,
+        snapshot_cache_dir: Optional[Path] = None
+    ):
+        started = time.perf_counter()
+        if engine not in CLASSIFIER_ENGINES:
+            raise ValueError(f"Unknown classifier engine: {engine}")
+        if engine == "tfidf" and not TFIDF_AVAILABLE:
+            logger.warning("numpy not available, using the rules classifier engine")
+            engine = "rules"
+        self._engine = engine
+        self._tfidf_min_similarity = tfidf_min_similarity
+        
         self._confidence_threshold = confidence_threshold
-        self._intent_patterns = self._build_intent_patterns()
+        self.split_compound = split_compound
+        # Runner-up intents attached to single commands, for the dispatcher
+        # to try when the best one has no handler
+        self.alternatives = alternatives
+        
+        # Known app/site names for the phonetic index
+        self._app_names: List[str] = DESKTOP_APP_NAMES + WEB_APP_NAMES + [
+            name.lower() for name in (app_names or [])
+        ]
+        
+        # Pattern database: the data file plus runtime additions, compiled
+        # into an immutable snapshot that is replaced wholesale on change
+        self._patterns_path = Path(patterns_path) if patterns_path else DEFAULT_PATTERNS_FILE
+        self._patterns_mtime: Optional[float] = None
+        self._file_patterns = self._load_patterns()
+        self._extra_patterns: Dict[str, List[str]] = {}
+        self._compile_lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._watcher_stop = threading.Event()
+        
+        # Compiled snapshots are cached on disk, keyed by everything they
+        # are built from, so a warm start skips compiling
+        self._snapshot_cache: Optional[PickleCache] = (
+            PickleCache(snapshot_cache_dir) if snapshot_cache_dir else None
+        )
+        self._snapshot_source: Tuple[str, float] = ("compiled", 0.0)
+        self._matcher = self._compile_patterns()
+        snapshot, snapshot_ms = self._snapshot_source
         self._context: Dict[str, Any] = {}
         
-    def _build_intent_patterns(self) -> Dict[str, List[str]]:
-        """Build intent pattern database"""
-        return {
-            # System commands
-            "system.shutdown": [
-                "shutdown", "shut down", "power off", "turn off computer",
-                "shutdown computer", "shut down the computer"
-            ],
-            "system.restart": [
-                "restart", "reboot", "restart computer", "reboot computer",
-                "restart the computer"
-            ],
-            "system.lock": [
-                "lock", "lock computer", "lock screen", "lock the computer"
-            ],
-            "system.screenshot": [
-                "screenshot", "take screenshot", "capture screen", "screen capture",
-                "take a screenshot"
-            ],
-            
-            # Volume commands
-            "volume.up": [
-                "volume up", "increase volume", "louder", "turn up volume",
-                "raise volume", "turn it up"
-            ],
-            "volume.down": [
-                "volume down", "decrease volume", "quieter", "turn down volume",
-                "lower volume", "turn it down"
-            ],
-            "volume.mute": [
-                "mute", "mute volume", "silence", "mute audio", "mute sound"
-            ],
-            "volume.unmute": [
-                "unmute", "unmute volume", "unmute audio"
-            ],
-            "volume.set": [
-                "set volume to", "volume to", "set volume"
-            ],
-            
-            # Application commands
-            "app.open": [
-                "open", "launch", "start", "run", "execute", "fire up"
-            ],
-            "app.close": [
-                "close", "quit", "exit", "kill", "terminate", "end"
-            ],
-            
-            # Web commands
-            "web.search": [
-                "search", "google", "look up", "find", "search for",
-                "search the web for", "google search"
-            ],
-            "web.open": [
-                "open website", "go to", "visit", "open site", "browse to",
-                "navigate to"
-            ],
-            "web.youtube": [
-                "play on youtube", "youtube", "search youtube", "play video",
-                "watch"
-            ],
+        # Per-session dialogue state for follow-ups ("close it", "again")
+        self._dialogue: Optional[DialogueContext] = (
+            DialogueContext(context_sessions, context_ttl) if context_sessions > 0 else None
+        )
+        
+        # Optional LRU cache: normalized text -> (category, action, confidence, entities)
+        self._cache: Optional[LRUCache] = LRUCache(cache_size) if cache_size > 0 else None
+        
+        # Utterance -> (intent key, learned at) from resolved conversation
+        # turns; entries older than learned_ttl seconds expire (0 = never)
+        self._learned: Optional[LRUCache] = LRUCache(learned_size) if learned_size > 0 else None
+        self._learned_ttl = learned_ttl
+        
+        # Classifier cascade, tried in order until one produces an intent
+        self._tiers = self._build_tiers(tiers or CLASSIFIER_TIERS)
+        self._tier_stats: Dict[str, Dict[str, float]] = {
+            name: {"calls": 0, "hits": 0, "total_time": 0.0} for name, _ in self._tiers
+        }
+        self._stats_lock = threading.Lock()
+        
+        # Cold start: construction to first classification possible
+        self._startup_stats: Dict[str, Any] = {
+            "ready_ms": (time.perf_counter() - started) * 1000,
+            "snapshot": snapshot,
+            "snapshot_ms": snapshot_ms,
+        }
+        logger.info(f"Brain ready in {self._startup_stats['ready_ms']:.1f} ms (snapshot {snapshot})")
+    
+    @property
+    def confidence_threshold(self) -> int:
+        return self._confidence_threshold
+    
+    @confidence_threshold.setter
+    def confidence_threshold(self, value: int):
+        """Change the acceptance threshold (invalidates cached classifications)"""
+        self._confidence_threshold = value
+        if self._cache is not None:
+            self._cache.clear()
+    
+    # ══════════════════════════════════════════════════════════════════════════
+    # PATTERN SNAPSHOTS
+    # ══════════════════════════════════════════════════════════════════════════
+    
+    def _load_patterns(self) -> Dict[str, List[str]]:
+        """
+        Read the intent pattern database from its data file
+        
+        The file is a JSON object mapping "category.action" keys to lists
+        of trigger phrases, in priority order (ties go to earlier intents).
+        
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If it is not valid pattern JSON
+        """
+        mtime = self._patterns_path.stat().st_mtime
+        with open(self._patterns_path, encoding="utf-8") as f:
+            patterns = json.load(f)
+        
+        if not isinstance(patterns, dict) or not all(
+            isinstance(key, str) and "." in key
+            and isinstance(phrases, list) and all(isinstance(p, str) for p in phrases)
+            for key, phrases in patterns.items()
+        ):
+            raise ValueError(f"{self._patterns_path} must map \"category.action\" keys to phrase lists")
+        
+        self._patterns_mtime = mtime
+        return patterns
+    
+    def _compile_patterns(self) -> IntentMatcher:
+        """
+        Compile file patterns, runtime additions and app names into a
+        new immutable snapshot
+        """
+        patterns = {key: list(phrases) for key, phrases in self._file_patterns.items()}
+        for key, extra in self._extra_patterns.items():
+            patterns.setdefault(key, []).extend(extra)
+        phrase_groups = {
+            "web_app": WEB_APP_NAMES,
+            "app": DESKTOP_APP_NAMES,
+            "open_trigger": APP_OPEN_TRIGGERS,
+        }
+        tfidf = self._engine == "tfidf"
+        
+        start = time.perf_counter()
+        cache_key = None
+        if self._snapshot_cache:
+            cache_key = self._snapshot_key(patterns, phrase_groups, tfidf)
+            matcher = self._snapshot_cache.load(f"intent_snapshot_{cache_key[:16]}", cache_key)
+            if matcher is not None:
+                elapsed = (time.perf_counter() - start) * 1000
+                self._snapshot_source = ("cached", elapsed)
+                logger.info(
+                    f"Intent snapshot loaded from cache in {elapsed:.1f} ms: "
+                    f"{len(matcher.intent_keys)} intents, {len(matcher.choices)} patterns"
+                )
+                return matcher
+        
+        matcher = IntentMatcher(
+            patterns,
+            phrase_groups=phrase_groups,
+            names=self._app_names,
+            tfidf=tfidf
+        )
+        elapsed = (time.perf_counter() - start) * 1000
+        self._snapshot_source = ("compiled", elapsed)
+        
+        logger.info(
+            f"Intent patterns compiled in {elapsed:.1f} ms: {len(matcher.intent_keys)} intents, "
+            f"{len(matcher.choices)} patterns, {len(matcher._index)} tokens, "
+            f"{len(matcher.automaton)} automaton states"
+        )
+        if cache_key:
+            self._snapshot_cache.store(f"intent_snapshot_{cache_key[:16]}", cache_key, matcher)
+            self._snapshot_cache.prune("intent_snapshot_", SNAPSHOT_CACHE_KEEP)
+        return matcher
+    
+    def _snapshot_key(
+        self,
+        patterns: Dict[str, List[str]],
+        phrase_groups: Dict[str, List[str]],
+        tfidf: bool
+    ) -> str:
+        """
+        Hash of everything a compiled snapshot depends on: the pattern
+        source, app names, engine, and the version and code of the
+        compiling modules
+        """
+        digest = hashlib.sha256()
+        source = [MATCHER_VERSION, patterns, phrase_groups, self._app_names, tfidf]
+        digest.update(json.dumps(source, ensure_ascii=False).encode("utf-8"))
+        module_dir = Path(__file__).resolve().parent
+        for name in SNAPSHOT_SOURCES:
+            digest.update((module_dir / name).read_bytes())
+        return digest.hexdigest()
+    
+    def _swap_snapshot(self, matcher: IntentMatcher):
+        """
+        Publish a new snapshot
+        
+        A single reference assignment, so readers never lock: each
+        classification reads self._matcher once and finishes on that
+        snapshot even if a newer one is published meanwhile.
+        """
+        self._matcher = matcher
+        if self._cache is not None:
+            self._cache.clear()
+    
+    def reload_patterns(self, force: bool = False) -> bool:
+        """
+        Recompile the pattern snapshot if the data file changed
+        
+        A file that fails to load is logged and the current snapshot is
+        kept, so a half-saved edit never takes the assistant down.
+        
+        Args:
+            force: Reload even if the modification time is unchanged
+        
+        Returns:
+            True if a new snapshot was published
+        """
+        with self._compile_lock:
+            try:
+                mtime = self._patterns_path.stat().st_mtime
+            except OSError as e:
+                logger.error(f"Intent pattern file unavailable: {e}")
+                return False
             
-            # Time/Date - IMPORTANT: action names must match skill registrations
-            "time_date.time": [
-                "what time", "current time", "tell me the time", "what's the time",
-                "time please", "what is the time", "time", "the time", "whats the time",
-                "tell time", "show time", "give me the time", "what time is it"
-            ],
-            "time_date.date": [
-                "what date", "current date", "today's date", "what's the date",
-                "what day is it", "what is today", "what's today's date",
-                "whats today", "today date", "date today", "date", "the date",
-                "tell me the date", "what day", "today"
-            ],
+            if not force and mtime == self._patterns_mtime:
+                return False
             
-            # Memory commands
-            "memory.remember": [
-                "remember", "remember that", "store", "save", "note that",
-                "keep in mind"
-            ],
-            "memory.recall": [
-                "recall", "what do you remember", "what did i tell you",
-                "do you remember", "what do you know about"
-            ],
-            "memory.forget": [
-                "forget", "forget that", "delete", "remove from memory"
-            ],
+            try:
+                self._file_patterns = self._load_patterns()
+            except (OSError, ValueError) as e:
+                # Do not retry until the file changes again
+                self._patterns_mtime = mtime
+                logger.error(f"Intent pattern reload failed, keeping current patterns: {e}")
+                return False
             
-            # Conversation
-            "conversation.greeting": [
-                "hello", "hi", "hey", "good morning", "good afternoon",
-                "good evening", "howdy", "what's up"
-            ],
-            "conversation.farewell": [
-                "goodbye", "bye", "see you", "farewell", "good night",
-                "i'm leaving", "that's all"
-            ],
-            "conversation.thanks": [
-                "thank you", "thanks", "appreciate it", "cheers"
-            ],
-            "conversation.how_are_you": [
-                "how are you", "how do you feel", "how's it going",
-                "what's up", "how are things"
-            ],
-            "conversation.who_are_you": [
-                "who are you", "what are you", "what's your name",
-                "tell me about yourself", "introduce yourself"
-            ],
-            "conversation.capabilities": [
-                "what can you do", "help", "what are your capabilities",
-                "what do you do", "show me what you can do"
-            ],
-            "conversation.joke": [
-                "tell me a joke", "joke", "make me laugh", "say something funny"
-            ],
-            "conversation.stop": [
-                "stop", "cancel", "nevermind", "never mind", "abort",
-                "shut up", "be quiet", "stop talking"
-            ],
+            self._swap_snapshot(self._compile_patterns())
+        
+        logger.info(f"Intent patterns reloaded from {self._patterns_path}")
+        return True
+    
+    def start_pattern_watcher(self, interval: float = 2.0):
+        """Poll the pattern file every interval seconds and hot-reload it"""
+        if self._watcher and self._watcher.is_alive():
+            return
+        
+        self._watcher_stop.clear()
+        
+        def watch():
+            while not self._watcher_stop.wait(interval):
+                try:
+                    self.reload_patterns()
+                except Exception as e:
+                    logger.error(f"Pattern watcher error: {e}")
+        
+        self._watcher = threading.Thread(target=watch, name="pattern-watcher", daemon=True)
+        self._watcher.start()
+        logger.info(f"Watching {self._patterns_path} for changes")
+    
+    def stop_pattern_watcher(self):
+        """Stop the pattern file watcher"""
+        self._watcher_stop.set()
+        if self._watcher:
+            self._watcher.join(timeout=5)
+            self._watcher = None
+    
+    def add_patterns(self, intent_key: str, patterns: List[str]):
+        """
+        Add phrases to an intent (creating it if needed) and recompile
+        
+        Runtime additions survive reloads of the pattern file.
+        
+        Args:
+            intent_key: "category.action" key, e.g. "web.search"
+            patterns: Phrases that should trigger the intent
+        """
+        with self._compile_lock:
+            self._extra_patterns.setdefault(intent_key, []).extend(patterns)
+            self._swap_snapshot(self._compile_patterns())
+        logger.info(f"Added {len(patterns)} pattern(s) to {intent_key}")
+    
+    def add_app_names(self, names: List[str]):
+        """
+        Teach the phonetic index more app/site names and recompile
+        
+        Args:
+            names: Names as users say them, e.g. "file explorer"
+        """
+        with self._compile_lock:
+            new_names = [name.lower() for name in names if name.lower() not in self._app_names]
+            if not new_names:
+                return
+            self._app_names = self._app_names + new_names
+            self._swap_snapshot(self._compile_patterns())
+        logger.debug(f"Added {len(new_names)} app name(s) to the phonetic index")
+    
+    def _build_tiers(self, names: List[str]) -> List[Tuple[str, Any]]:
+        """Resolve tier names to tier methods"""
+        if self._engine == "tfidf":
+            # One similarity tier takes the place of the rule scoring tiers
+            scoring = [name for name in names if name in RULE_SCORING_TIERS]
+            if scoring:
+                pos = names.index(scoring[0])
+                names = [name for name in names if name not in RULE_SCORING_TIERS]
+                names.insert(pos, "tfidf")
+        
+        available = {
+            "learned": self._tier_learned,
+            "exact": self._tier_exact,
+            "token": self._tier_token,
+            "phonetic": self._tier_phonetic,
+            "fuzzy": self._tier_fuzzy,
+            "tfidf": self._tier_tfidf,
+            "app": self._tier_app,
         }
+        unknown = [name for name in names if name not in available]
+        if unknown:
+            raise ValueError(f"Unknown classifier tier(s): {unknown}")
+        return [(name, available[name]) for name in names]
     
-    def classify_intent(self, text: str) -> Intent:
+    def classify_intent(self, text: str, session_id: Optional[str] = None) -> Intent:
         """
         Classify the intent of user input
         
         Args:
             text: User's spoken/typed input
-            
+            session_id: Conversation the input belongs to; follow-ups
+                ("close it", "again") are resolved against its previous
+                command (None = no context)
+        
         Returns:
             Intent object with classification details
         """
+        intent = self._classify(text, text.lower().strip())
+        if session_id is not None:
+            intent = self._apply_context(intent, session_id)
+        return intent
+    
+    def _classify(self, text: str, text_lower: str, state: Optional[_ClassifyState] = None) -> Intent:
+        """Classify through the cache, trivial checks and tier cascade"""
+        cache = self._cache
+        if cache is not None:
+            cached = cache.get(text_lower)
+            if cached is not None:
+                return self._intents_from_cache(cached, text)[0]
+            generation = cache.generation
+        
+        intent = self._classify_trivial(text, text_lower)
+        if intent is None:
+            intent = self._run_tiers(state or _ClassifyState(self._matcher, text, text_lower))
+        
+        if cache is not None:
+            cache.put(text_lower, self._intent_to_cache([intent]), generation)
+        
+        return intent
+    
+    def classify_ranked(self, text: str, k: int = 3) -> List[Intent]:
+        """
+        Classify user input, keeping the runner-up readings
+        
+        Runs the same single cascade as classify_intent; every intent a
+        tier scored above the acceptance threshold on the way is kept
+        instead of only the best. The first result is always what
+        classify_intent returns. Cached like classify_intent, runner-ups
+        included; an entry classify_intent stored holds only the best
+        intent and is recomputed.
+        
+        Args:
+            text: User's spoken/typed input
+            k: Maximum number of intents
+        
+        Returns:
+            Up to k intents, best first
+        """
+        if k <= 1:
+            return [self.classify_intent(text)]
+        
         text_lower = text.lower().strip()
+        cache = self._cache
+        if cache is not None:
+            cached = cache.get(text_lower)
+            if cached is not None and cached[0] >= k:
+                return self._intents_from_cache(cached, text, k)
+            generation = cache.generation
+        
+        intent = self._classify_trivial(text, text_lower)
+        if intent is not None:
+            ranked = [intent]
+        else:
+            state = _ClassifyState(self._matcher, text, text_lower)
+            state.ranked = {}
+            intent = self._run_tiers(state)
+            
+            best_key = self.intent_key(intent)
+            order = {key: idx for idx, key in enumerate(state.matcher.intent_keys)}
+            runners_up = sorted(
+                (key for key in state.ranked if key != best_key),
+                key=lambda key: (-state.ranked[key], order.get(key, len(order)))
+            )
+            ranked = [intent] + [
+                self._build_intent(state, key, state.ranked[key]) for key in runners_up[:k - 1]
+            ]
+        
+        if cache is not None:
+            cache.put(text_lower, self._intent_to_cache(ranked, k), generation)
+        return ranked
+    
+    def _classify_single(self, text: str, session_id: Optional[str] = None) -> Intent:
+        """Classify one command, attaching runner-ups if enabled"""
+        if self.alternatives <= 0:
+            return self.classify_intent(text, session_id)
+        ranked = self.classify_ranked(text, self.alternatives + 1)
+        ranked[0].alternatives = ranked[1:]
+        if session_id is not None:
+            return self._apply_context(ranked[0], session_id)
+        return ranked[0]
+    
+    def stream(self) -> "IntentStream":
+        """Start an incremental classification session for a partial transcript"""
+        return IntentStream(self)
+    
+    def classify_compound(self, text: str, session_id: Optional[str] = None) -> List[Intent]:
+        """
+        Classify an utterance that may hold several commands
+        
+        "Open chrome and mute" is split on sentence punctuation, commas and
+        conjunctions. A segment that is not a command on its own ("pepper"
+        in "open salt and pepper") is glued back onto the one before it, so
+        the text is only split where every part stands alone. Nothing is
+        split off a command that ends in free text (FREE_TEXT_INTENTS):
+        "search for how to shut down windows and restart it" is one search.
+        
+        Args:
+            text: User's spoken/typed input
+            session_id: Conversation for follow-up resolution (see
+                classify_intent)
+        
+        Returns:
+            Intents in spoken order; a single classification (with
+            alternatives attached) when the utterance is one command
+        """
+        pieces = COMPOUND_SPLIT_RE.split(text)
+        if not self.split_compound or len(pieces) < 3:
+            return [self._classify_single(text, session_id)]
+        
+        # pieces alternates segment, separator, segment, ...
+        segments = pieces[0::2]
+        separators = [""] + pieces[1::2]
+        intents = self.classify_intents([segment.strip() for segment in segments])
+        
+        merged: List[str] = []
+        merged_intents: List[Optional[Intent]] = []
+        prefix = ""
+        free_text = False
+        for segment, separator, intent in zip(segments, separators, intents):
+            if merged and (free_text or not self._is_command(intent)):
+                merged[-1] += separator + segment
+                merged_intents[-1] = None
+            elif self._is_command(intent):
+                if prefix:
+                    # Leading chatter ("um, open chrome") stays with the first command
+                    merged.append(prefix + separator + segment)
+                    merged_intents.append(None)
+                    prefix = ""
+                else:
+                    merged.append(segment)
+                    merged_intents.append(intent)
+                free_text = (intent.category, intent.action) in FREE_TEXT_INTENTS
+            else:
+                prefix += separator + segment
+        
+        if len(merged) < 2:
+            return [self._classify_single(text, session_id)]
+        
+        # Reclassify segments that absorbed a neighbour
+        stale = [pos for pos, intent in enumerate(merged_intents) if intent is None]
+        for pos, intent in zip(stale, self.classify_intents([merged[pos].strip() for pos in stale])):
+            merged_intents[pos] = intent
+        
+        if session_id is not None:
+            merged_intents = [self._apply_context(intent, session_id) for intent in merged_intents]
+        return merged_intents
+    
+    @staticmethod
+    def _is_command(intent: Intent) -> bool:
+        """Whether an intent was confidently classified as something specific"""
+        if intent.category == IntentCategory.UNKNOWN:
+            return False
+        return not (intent.category == IntentCategory.CONVERSATION and intent.action == "general")
+    
+    def classify_intents(self, texts: List[str]) -> List[Intent]:
+        """
+        Classify a batch of inputs in one go
+        
+        Every text runs the cascade up to the fuzzy tier; all texts that
+        reach it are scored together as one texts x patterns matrix on all
+        cores before their cascades resume. Returns the same intents as
+        calling classify_intent on each text.
+        
+        Args:
+            texts: User inputs to classify
+        
+        Returns:
+            One Intent per input, in input order
+        """
+        if not (FUZZY_AVAILABLE and NUMPY_AVAILABLE):
+            return [self.classify_intent(text) for text in texts]
+        
+        results: List[Optional[Intent]] = [None] * len(texts)
+        pending: List[Tuple[int, _ClassifyState]] = []
+        matcher = self._matcher
+        cache = self._cache
+        generation = cache.generation if cache is not None else None
+        
+        for pos, text in enumerate(texts):
+            text_lower = text.lower().strip()
+            
+            if cache is not None:
+                cached = cache.get(text_lower)
+                if cached is not None:
+                    results[pos] = self._intents_from_cache(cached, text)[0]
+                    continue
+            
+            trivial = self._classify_trivial(text, text_lower)
+            if trivial:
+                results[pos] = trivial
+                continue
+            
+            state = _ClassifyState(matcher, text, text_lower)
+            intent = self._run_tiers(state, defer_fuzzy=True)
+            if intent is None:
+                pending.append((pos, state))
+            else:
+                results[pos] = intent
+        
+        if pending:
+            start = time.perf_counter()
+            matches = self._match_fuzzy_batch(matcher, [state.text_lower for _, state in pending])
+            with self._stats_lock:
+                self._tier_stats["fuzzy"]["total_time"] += time.perf_counter() - start
+            for (pos, state), match in zip(pending, matches):
+                state.fuzzy_match = match
+                results[pos] = self._run_tiers(state)
+        
+        if cache is not None:
+            for text, intent in zip(texts, results):
+                cache.put(text.lower().strip(), self._intent_to_cache([intent]), generation)
         
+        return results
+    
+    def _run_tiers(
+        self,
+        state: _ClassifyState,
+        defer_fuzzy: bool = False,
+        fallback: bool = True,
+        record: bool = True
+    ) -> Optional[Intent]:
+        """
+        Run the classifier cascade, stopping at the first tier that
+        produces an intent
+        
+        Args:
+            state: Per-utterance state (resumes from state.resume_at)
+            defer_fuzzy: Pause before an unsettled fuzzy tier and return
+                None, so a batch can score all such texts at once
+            fallback: Return the general conversation intent when no tier
+                hits (otherwise None)
+            record: Count this run in the tier statistics
+        
+        Returns:
+            Classified intent (None when paused or without fallback)
+        """
+        tiers = self._tiers
+        
+        for pos in range(state.resume_at, len(tiers)):
+            name, tier = tiers[pos]
+            
+            # Once the pattern score is settled, later scoring tiers are moot
+            if state.scored and name in RULE_SCORING_TIERS + ("tfidf",):
+                continue
+            
+            if name == "fuzzy" and defer_fuzzy:
+                state.resume_at = pos
+                return None
+            
+            if not record:
+                intent = tier(state)
+                if intent is not None:
+                    return intent
+                continue
+            
+            start = time.perf_counter()
+            intent = tier(state)
+            elapsed = time.perf_counter() - start
+            
+            with self._stats_lock:
+                stats = self._tier_stats[name]
+                stats["calls"] += 1
+                stats["total_time"] += elapsed
+                if intent is not None:
+                    stats["hits"] += 1
+            
+            if intent is not None:
+                return intent
+        
+        if not fallback:
+            return None
+        
+        # Default to conversation/unknown
+        return Intent(
+            category=IntentCategory.CONVERSATION,
+            action="general",
+            confidence=50.0,
+            entities={},
+            raw_text=state.text
+        )
+    
+    def get_tier_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-tier classification statistics
+        
+        Returns:
+            Tier name -> calls, hits, hit_rate and avg_ms, in cascade order
+        """
+        with self._stats_lock:
+            return {
+                name: {
+                    "calls": stats["calls"],
+                    "hits": stats["hits"],
+                    "hit_rate": stats["hits"] / stats["calls"] if stats["calls"] else 0.0,
+                    "avg_ms": stats["total_time"] * 1000 / stats["calls"] if stats["calls"] else 0.0,
+                }
+                for name, stats in self._tier_stats.items()
+            }
+    
+    @staticmethod
+    def _intent_to_cache(intents: List[Intent], depth: int = 1) -> Tuple[int, Tuple[Any, ...]]:
+        """
+        Cache entry for a classification: (readings asked for, intents best
+        first) - classify_ranked stores runner-ups, classify_intent only
+        the best one
+        """
+        return depth, tuple(
+            (intent.category, intent.action, intent.confidence, dict(intent.entities))
+            for intent in intents
+        )
+    
+    @staticmethod
+    def _intents_from_cache(cached: Tuple[int, Tuple[Any, ...]], text: str, k: int = 1) -> List[Intent]:
+        return [
+            Intent(
+                category=category,
+                action=action,
+                confidence=confidence,
+                entities=dict(entities),
+                raw_text=text
+            )
+            for category, action, confidence, entities in cached[1][:k]
+        ]
+    
+    # ══════════════════════════════════════════════════════════════════════════
+    # DIALOGUE CONTEXT
+    # ══════════════════════════════════════════════════════════════════════════
+    
+    def _apply_context(self, intent: Intent, session_id: str) -> Intent:
+        """
+        Resolve a follow-up against the session's previous command, then
+        record the resulting command as the session's latest
+        
+        Tried in order: repeats and adjustments ("again", "less"),
+        back-references ("close it" -> "close chrome", reclassified) and
+        elliptical subjects ("what about firefox"). Resolution is local
+        and costs at most two extra cascade runs.
+        """
+        if self._dialogue is None:
+            return intent
+        
+        state = self._dialogue.get(session_id)
+        if state is not None:
+            text_lower = intent.raw_text.lower().strip()
+            intent = self._resolve_follow_up(intent, text_lower, state) or intent
+        
+        intent_key = self.intent_key(intent)
+        if intent_key and intent.category != IntentCategory.CONVERSATION:
+            self._dialogue.update(session_id, intent_key, intent.entities)
+        return intent
+    
+    def _resolve_follow_up(self, intent: Intent, text_lower: str, state) -> Optional[Intent]:
+        """The command a follow-up means, or None if it is not one"""
+        text = intent.raw_text
+        
+        resolved = follow_up(text_lower, state)
+        if resolved is not None:
+            return self._context_intent(text, *resolved)
+        
+        # A back-reference is only substituted where it is not already
+        # understood ("what time is it" stays as it is)
+        unresolved = not self._is_command(intent) or any(
+            isinstance(value, str) and REFERENCE_RE.search(value)
+            for value in intent.entities.values()
+        )
+        if unresolved:
+            rewritten = substitute_reference(text_lower, state)
+            if rewritten is not None:
+                candidate = self._classify(text, rewritten)
+                if self._is_command(candidate):
+                    return candidate
+        
+        subject = elided_subject(text_lower, state)
+        if subject is not None:
+            slot, value = subject
+            # "and what time is it" is a new command, not a new subject
+            if len(value.split()) <= MAX_ELIDED_WORDS and not REFERENCE_RE.search(value):
+                if not self._is_command(self._classify(value, value)):
+                    return self._context_intent(text, state.intent_key, {slot: value})
+        
+        return None
+    
+    def _context_intent(self, text: str, intent_key: str, entities: Dict[str, Any]) -> Intent:
+        """Build the Intent for a command resolved from dialogue context"""
+        category_str, action = intent_key.split(".", 1)
+        if entities.get("app_name"):
+            entities = dict(entities, app_name=self._matcher.names.resolve(entities["app_name"]))
+        return Intent(
+            category=self._get_category(category_str),
+            action=action,
+            confidence=CONTEXT_CONFIDENCE,
+            entities=entities,
+            raw_text=text
+        )
+    
+    def clear_dialogue(self, session_id: Optional[str] = None):
+        """Forget one session's dialogue state, or every session's"""
+        if self._dialogue is not None:
+            self._dialogue.clear(session_id)
+    
+    def get_dialogue_stats(self) -> Dict[str, Any]:
+        """Get dialogue session table statistics (empty if disabled)"""
+        return self._dialogue.get_stats() if self._dialogue is not None else {}
+    
+    # ══════════════════════════════════════════════════════════════════════════
+    # LEARNED INTENTS
+    # ══════════════════════════════════════════════════════════════════════════
+    
+    @staticmethod
+    def _learn_key(text: str) -> str:
+        """Near-exact lookup key: lowercase words without punctuation"""
+        return " ".join(LEARN_KEY_STRIP_RE.sub(" ", text.lower()).split())
+    
+    def intent_key(self, intent: Intent) -> Optional[str]:
+        """The "category.action" pattern key an intent corresponds to, if any"""
+        for key in self._matcher.intent_keys:
+            category_str, action = key.split(".", 1)
+            if action == intent.action and self._get_category(category_str) == intent.category:
+                return key
+        return None
+    
+    def learn(self, text: str, intent_key: str, learned_at: Optional[float] = None):
+        """
+        Remember that an utterance resolved to an intent
+        
+        Later classifications of the same utterance (ignoring case and
+        punctuation) skip pattern scoring entirely.
+        
+        Args:
+            text: User utterance
+            intent_key: "category.action" key it resolved to
+            learned_at: Epoch time of the turn (default now)
+        """
+        if self._learned is None or intent_key not in self._matcher.intent_keys:
+            return
+        if intent_key == "conversation.stop":
+            return
+        
+        learned_at = learned_at or time.time()
+        if self._learned_ttl and time.time() - learned_at > self._learned_ttl:
+            return
+        
+        key = self._learn_key(text)
+        if key:
+            self._learned.put(key, (intent_key, learned_at))
+            if self._cache is not None:
+                self._cache.discard(text.lower().strip())
+    
+    def unlearn(self, text: str):
+        """Forget a learned utterance (its resolution failed or was corrected)"""
+        if self._learned is None:
+            return
+        self._learned.discard(self._learn_key(text))
+        if self._cache is not None:
+            self._cache.discard(text.lower().strip())
+    
+    def learn_from_history(self, conversations: List[Dict[str, Any]]) -> int:
+        """
+        Seed the learned table from stored conversation turns
+        
+        A user turn answered by an assistant turn that recorded an intent
+        was resolved successfully. If the user's next turn cancelled it
+        ("stop"), it counts as a correction and is not learned.
+        
+        Args:
+            conversations: Rows from Memory.get_recent_conversations, oldest first
+        
+        Returns:
+            Number of learned utterances
+        """
+        if self._learned is None:
+            return 0
+        
+        user_text: Optional[str] = None
+        resolved: Optional[str] = None
+        
+        for row in conversations:
+            if row.get("role") == "user":
+                if resolved and self.classify_intent(row.get("content", "")).action == "stop":
+                    self.unlearn(resolved)
+                user_text = row.get("content")
+                resolved = None
+            elif row.get("role") == "assistant" and user_text:
+                intent_key = self._resolve_logged_intent(row.get("intent"))
+                if intent_key:
+                    self.learn(user_text, intent_key, _parse_timestamp(row.get("timestamp")))
+                    resolved = user_text
+                user_text = None
+        
+        logger.info(f"Learned {len(self._learned)} utterance(s) from conversation history")
+        return len(self._learned)
+    
+    def _resolve_logged_intent(self, logged: Optional[str]) -> Optional[str]:
+        """Map an intent logged with a turn to a pattern key"""
+        if not logged:
+            return None
+        intent_keys = self._matcher.intent_keys
+        if logged in intent_keys:
+            return logged
+        
+        # Older turns logged only the action; use it when it is unambiguous
+        keys = [key for key in intent_keys if key.split(".", 1)[1] == logged]
+        return keys[0] if len(keys) == 1 else None
+    
+    def get_learned_stats(self) -> Dict[str, Any]:
+        """Get learned-table statistics (empty if learning is disabled)"""
+        return self._learned.get_stats() if self._learned is not None else {}
+    
+    def get_startup_stats(self) -> Dict[str, Any]:
+        """
+        Cold-start timings
+        
+        Returns:
+            Dict with ready_ms (construction to ready to classify),
+            snapshot ("cached" or "compiled") and snapshot_ms
+        """
+        return dict(self._startup_stats)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get classification cache statistics (empty if caching is disabled)"""
+        return self._cache.get_stats() if self._cache is not None else {}
+    
+    def _classify_trivial(self, text: str, text_lower: str) -> Optional[Intent]:
+        """Handle empty input and bare greetings without scoring"""
         if not text_lower:
             return Intent(
                 category=IntentCategory.UNKNOWN,
@@ -210,97 +1069,266 @@ class Brain:
                 raw_text=text
             )
         
-        best_match = None
-        best_score = 0
+        return None
+    
+    @property
+    def engine(self) -> str:
+        """Active scoring engine ("rules" or "tfidf")"""
+        return self._engine
+    
+    def _note(self, state: _ClassifyState, intent_key: Optional[str], score: float):
+        """Keep a scored intent as a ranked candidate if it would be accepted"""
+        ranked = state.ranked
+        if ranked is None or not intent_key or score < self._confidence_threshold:
+            return
+        if score > ranked.get(intent_key, 0.0):
+            ranked[intent_key] = score
+    
+    def _accept(self, state: _ClassifyState, intent_key: Optional[str], score: float) -> Optional[Intent]:
+        """Build the Intent for a pattern match if it clears the threshold"""
+        if not intent_key or score < self._confidence_threshold:
+            return None
+        return self._build_intent(state, intent_key, score)
+    
+    def _build_intent(self, state: _ClassifyState, intent_key: str, score: float) -> Intent:
+        """Build the Intent for a matched pattern key"""
+        # Determine category and action from intent key
+        category_str, action = intent_key.split(".", 1)
         
-        for intent_key, patterns in self._intent_patterns.items():
-            score = self._match_patterns(text_lower, patterns)
-            
-            if score > best_score:
-                best_score = score
-                best_match = intent_key
+        entities = self._extract_entities(state.text_lower, intent_key)
+        if entities.get("app_name"):
+            # "note pad" -> "notepad", "discort" -> "discord"
+            entities["app_name"] = state.matcher.names.resolve(entities["app_name"])
         
-        # Determine category and action from intent key
-        if best_match and best_score >= self._confidence_threshold:
-            category_str, action = best_match.split(".", 1)
-            category = self._get_category(category_str)
-            entities = self._extract_entities(text_lower, best_match)
-            
-            return Intent(
-                category=category,
-                action=action,
-                confidence=best_score,
-                entities=entities,
-                raw_text=text
-            )
+        return Intent(
+            category=self._get_category(category_str),
+            action=action,
+            confidence=score,
+            entities=entities,
+            raw_text=state.text
+        )
+    
+    # ══════════════════════════════════════════════════════════════════════════
+    # CLASSIFIER TIERS
+    # ══════════════════════════════════════════════════════════════════════════
+    
+    def _tier_learned(self, state: _ClassifyState) -> Optional[Intent]:
+        """Learned tier: hash lookup of utterances resolved before"""
+        if self._learned is None:
+            return None
         
-        # Check for app open pattern specifically
-        app_match = self._check_app_open(text_lower)
-        if app_match:
-            return Intent(
-                category=IntentCategory.APPLICATION,
-                action="open",
-                confidence=85.0,
-                entities={"app_name": app_match},
-                raw_text=text
-            )
+        key = self._learn_key(state.text_lower)
+        entry = self._learned.get(key)
+        if entry is None:
+            return None
         
-        # Default to conversation/unknown
+        intent_key, learned_at = entry
+        if self._learned_ttl and time.time() - learned_at > self._learned_ttl:
+            self._learned.discard(key)
+            return None
+        
+        state.scored = True
+        self._note(state, intent_key, LEARNED_CONFIDENCE)
+        return self._accept(state, intent_key, LEARNED_CONFIDENCE)
+    
+    def _tier_exact(self, state: _ClassifyState) -> Optional[Intent]:
+        """Exact-phrase tier: O(1) lookup of utterances that are a known pattern"""
+        match = state.matcher.exact_phrases.get(state.text_lower)
+        if match is None:
+            return None
+        
+        # The token tier would compute the same score, so it is settled
+        state.scored = True
+        if state.ranked is not None:
+            for intent_key, score in state.matcher.exact_ranked[state.text_lower]:
+                self._note(state, intent_key, score)
+        return self._accept(state, *match)
+    
+    def _tier_token(self, state: _ClassifyState) -> Optional[Intent]:
+        """Token tier: inverted-index word matches and phrase-scan hits"""
+        match = self._match_exact(state)
+        if match is None:
+            return None
+        
+        state.scored = True
+        return self._accept(state, *match)
+    
+    def _tier_phonetic(self, state: _ClassifyState) -> Optional[Intent]:
+        """Phonetic tier: re-run the word tiers with misheard words respelled"""
+        respelled = state.matcher.phonetic.normalize(state.text_lower)
+        if respelled == state.text_lower:
+            return None
+        
+        # At least one word must have been heard right, so a lone "lunch"
+        # is not promoted to "launch"
+        heard = set(state.words)
+        if not any(word in heard for word in respelled.split()):
+            return None
+        
+        # "lunch chrome" -> "launch chrome"; raw_text keeps what was heard
+        respelled_state = _ClassifyState(state.matcher, state.text, respelled)
+        match = state.matcher.exact_phrases.get(respelled) or self._match_exact(respelled_state)
+        if match is None:
+            return None
+        
+        intent_key, score = match
+        self._note(state, intent_key, score - PHONETIC_PENALTY)
+        return self._accept(respelled_state, intent_key, score - PHONETIC_PENALTY)
+    
+    def _tier_fuzzy(self, state: _ClassifyState) -> Optional[Intent]:
+        """Fuzzy tier: one partial_ratio pass over every pattern"""
+        if state.is_short or not FUZZY_AVAILABLE:
+            # Skip fuzzy matching for very short inputs to avoid false matches
+            return None
+        
+        match = state.fuzzy_match or self._match_fuzzy(state.matcher, state.text_lower, state)
+        state.scored = True
+        return self._accept(state, *match)
+    
+    def _tier_tfidf(self, state: _ClassifyState) -> Optional[Intent]:
+        """TF-IDF tier: cosine similarity to the nearest pattern"""
+        tfidf = state.matcher.tfidf
+        ranked = tfidf.rank(state.text_lower, None if state.ranked is not None else 1)
+        state.scored = True
+        ranked = [(key, sim) for key, sim in ranked if sim >= self._tfidf_min_similarity]
+        if not ranked:
+            return None
+        if state.ranked is not None:
+            for intent_key, similarity in ranked:
+                state.ranked.setdefault(intent_key, round(similarity * 100.0, 1))
+        intent_key, similarity = ranked[0]
+        return self._build_intent(state, intent_key, round(similarity * 100.0, 1))
+    
+    def _tier_app(self, state: _ClassifyState) -> Optional[Intent]:
+        """App tier: desktop app names in an "open" context"""
+        app_match = self._check_app_open(state.text_lower, state.hits)
+        if not app_match:
+            return None
+        
+        self._note(state, "app.open", 85.0)
         return Intent(
-            category=IntentCategory.CONVERSATION,
-            action="general",
-            confidence=50.0,
-            entities={},
-            raw_text=text
+            category=IntentCategory.APPLICATION,
+            action="open",
+            confidence=85.0,
+            entities={"app_name": app_match},
+            raw_text=state.text
         )
     
-    def _match_patterns(self, text: str, patterns: List[str]) -> float:
-        """Match text against patterns, return best score"""
-        text = text.lower().strip()
-        text_words = text.split()
+    def _match_exact(self, state: _ClassifyState) -> Optional[Tuple[str, float]]:
+        """
+        Score exact word matches and phrase-scan hits
         
-        # For very short inputs (1-2 words), be strict with matching
-        is_short_input = len(text_words) <= 2 and len(text) <= 10
+        Only intents sharing a token with the input are scored; a pattern
+        found in the text by the phrase scan is a perfect partial match,
+        so fuzzy scoring is not needed when there is one.
         
-        # First check for exact word matches (highest priority)
-        for pattern in patterns:
-            pattern_lower = pattern.lower()
-            pattern_words = pattern_lower.split()
-            
-            # Exact match of entire pattern
-            if pattern_lower == text:
-                return 100.0
-            
-            # Exact word match (any word in text matches any word in pattern)
-            for text_word in text_words:
-                if text_word in pattern_words:
-                    # For short inputs, require exact word match
-                    if is_short_input and text_word == text:
-                        return 95.0
-                    elif not is_short_input:
-                        return 90.0
+        Returns:
+            (intent key, score), or None if nothing matched this way
+        """
+        matcher = state.matcher
+        text = state.text_lower
+        
+        # Exact word matches (highest priority, always >= 90)
+        scores = matcher.score_exact(text, state.words, state.is_short, state.candidates)
+        if scores:
+            if state.ranked is not None:
+                for intent_idx, score in scores.items():
+                    self._note(state, matcher.intent_keys[intent_idx], score)
+            # Earliest declared intent wins ties
+            best_idx = min(scores, key=lambda idx: (-scores[idx], idx))
+            return matcher.intent_keys[best_idx], scores[best_idx]
+        
+        if state.is_short:
+            return None
+        
+        hits = state.hits
+        if hits.intents:
+            first_hit = min(hits.intents)
+            hit_score = 70.0 if FUZZY_AVAILABLE else 65.0
+            if state.ranked is not None:
+                for intent_idx in hits.intents:
+                    self._note(state, matcher.intent_keys[intent_idx], hit_score)
+            if not FUZZY_AVAILABLE:
+                # Basic substring matching
+                return matcher.intent_keys[first_hit], 65.0
             
-            # Check if all pattern words are in text (for longer patterns)
-            if len(pattern_words) > 1 and all(word in text_words for word in pattern_words):
-                return 95.0
-        
-        # Skip fuzzy matching for very short inputs to avoid false matches
-        if is_short_input:
-            return 0.0
-        
-        # Then use fuzzy matching for longer inputs only
-        if FUZZY_AVAILABLE:
-            result = process.extractOne(text, patterns, scorer=fuzz.partial_ratio)
-            if result:
-                # Reduce fuzzy match scores to give priority to exact matches
-                return min(result[1] * 0.7, 70.0)
-        else:
-            # Basic substring matching
-            for pattern in patterns:
-                if pattern in text:
-                    return 65.0
+            # partial_ratio is 100 exactly when one string contains the
+            # other, so the earliest intent doing so takes the 70 cap
+            for intent_idx in range(first_hit):
+                if any(text in pattern for pattern in matcher.patterns[intent_idx]):
+                    self._note(state, matcher.intent_keys[intent_idx], 70.0)
+                    return matcher.intent_keys[intent_idx], 70.0
+            return matcher.intent_keys[first_hit], 70.0
+        
+        return None
+    
+    def _fuzzy_cutoff(self) -> float:
+        """
+        Raw partial_ratio below which a fuzzy match can never be accepted
+        
+        Fuzzy scores are scaled by 0.7 before the threshold check; one
+        point of slack absorbs rapidfuzz's internal cutoff rounding.
+        """
+        return max(self._confidence_threshold / 0.7 - 1.0, 0.0)
+    
+    def _match_fuzzy(
+        self,
+        matcher: IntentMatcher,
+        text: str,
+        state: Optional[_ClassifyState] = None
+    ) -> Tuple[Optional[str], float]:
+        """
+        One extract call over every pattern, best raw score per intent
+        
+        Every intent's score is noted on state for ranked classification.
+        """
+        score_cutoff = self._fuzzy_cutoff()
+        if score_cutoff > 100:
+            return None, 0.0
+        
+        best: Dict[int, float] = {}
+        for _, raw_score, choice_idx in process.extract(
+            text, matcher.choices, scorer=fuzz.partial_ratio,
+            score_cutoff=score_cutoff, limit=None
+        ):
+            intent_idx = matcher.choice_intents[choice_idx]
+            if raw_score > best.get(intent_idx, 0.0):
+                best[intent_idx] = raw_score
+        
+        if not best:
+            return None, 0.0
+        
+        if state is not None and state.ranked is not None:
+            for intent_idx, raw_score in best.items():
+                self._note(state, matcher.intent_keys[intent_idx], min(raw_score * 0.7, 70.0))
+        
+        best_idx = min(best, key=lambda idx: (-best[idx], idx))
+        # Reduce fuzzy match scores to give priority to exact matches
+        return matcher.intent_keys[best_idx], min(best[best_idx] * 0.7, 70.0)
+    
+    def _match_fuzzy_batch(self, matcher: IntentMatcher, texts: List[str]) -> List[Tuple[Optional[str], float]]:
+        """Fuzzy tier for many texts: one cdist matrix, argmax per intent group"""
+        score_cutoff = self._fuzzy_cutoff()
+        if score_cutoff > 100:
+            return [(None, 0.0)] * len(texts)
+        
+        # texts x patterns, then best pattern per intent -> texts x intents
+        matrix = process.cdist(
+            texts, matcher.choices, scorer=fuzz.partial_ratio,
+            score_cutoff=score_cutoff, dtype=np.float64, workers=-1
+        )
+        per_intent = np.maximum.reduceat(matrix, matcher.intent_offsets, axis=1)
         
-        return 0.0
+        # argmax returns the first maximum, so the earliest intent wins ties
+        best_idxs = per_intent.argmax(axis=1)
+        results = []
+        for row, best_idx in zip(per_intent, best_idxs):
+            raw_score = float(row[best_idx])
+            if raw_score > 0:
+                results.append((matcher.intent_keys[best_idx], min(raw_score * 0.7, 70.0)))
+            else:
+                results.append((None, 0.0))
+        return results
     
     def _get_category(self, category_str: str) -> IntentCategory:
         """Convert string to IntentCategory"""
@@ -318,103 +1346,23 @@ class Brain:
         return mapping.get(category_str, IntentCategory.UNKNOWN)
     
     def _extract_entities(self, text: str, intent_key: str) -> Dict[str, Any]:
-        """Extract entities from text based on intent"""
-        entities = {}
-        
-        if intent_key == "app.open":
-            # Extract app name
-            for trigger in ["open", "launch", "start", "run"]:
-                if trigger in text:
-                    parts = text.split(trigger, 1)
-                    if len(parts) > 1:
-                        app_name = parts[1].strip()
-                        # Clean common suffixes
-                        app_name = re.sub(r'\s+(please|now|for me)$', '', app_name)
-                        entities["app_name"] = app_name
-                        break
-        
-        elif intent_key == "app.close":
-            for trigger in ["close", "quit", "exit", "kill"]:
-                if trigger in text:
-                    parts = text.split(trigger, 1)
-                    if len(parts) > 1:
-                        entities["app_name"] = parts[1].strip()
-                        break
-        
-        elif intent_key.startswith("web.search"):
-            for trigger in ["search for", "search", "google", "look up", "find"]:
-                if trigger in text:
-                    parts = text.split(trigger, 1)
-                    if len(parts) > 1:
-                        entities["query"] = parts[1].strip()
-                        break
-        
-        elif intent_key == "web.youtube":
-            for trigger in ["play", "youtube", "watch"]:
-                if trigger in text:
-                    parts = text.split(trigger, 1)
-                    if len(parts) > 1:
-                        query = parts[1].strip()
-                        query = re.sub(r'^(on youtube|video)\s*', '', query)
-                        entities["query"] = query
-                        break
-        
-        elif intent_key == "volume.set":
-            # Extract volume level
-            numbers = re.findall(r'\d+', text)
-            if numbers:
-                entities["level"] = int(numbers[0])
-        
-        elif intent_key == "memory.remember":
-            for trigger in ["remember that", "remember", "note that"]:
-                if trigger in text:
-                    parts = text.split(trigger, 1)
-                    if len(parts) > 1:
-                        entities["content"] = parts[1].strip()
-                        break
-        
-        elif intent_key == "memory.recall":
-            for trigger in ["about", "remember"]:
-                if trigger in text:
-                    parts = text.split(trigger, 1)
-                    if len(parts) > 1:
-                        entities["query"] = parts[1].strip()
-                        break
-        
-        return entities
-    
-    def _check_app_open(self, text: str) -> Optional[str]:
+        """Extract entities from text based on intent (see core.entities)"""
+        return extract_entities(intent_key, text)
+    
+    def _check_app_open(self, text: str, hits: Optional[PhraseHits] = None) -> Optional[str]:
         """Check if text is requesting to open an app"""
-        # Web-based apps that should open in browser, not as .exe
-        web_apps = [
-            "youtube", "netflix", "spotify web", "facebook", "instagram",
-            "twitter", "whatsapp", "telegram", "gmail", "google drive",
-            "github", "linkedin", "reddit", "amazon", "flipkart",
-            "chatgpt", "google", "wikipedia", "stackoverflow"
-        ]
+        if hits is None:
+            hits = self._matcher.scan(text)
         
-        for web_app in web_apps:
-            if web_app in text:
-                # These should be handled by web skills, not app skills
-                return None
+        if hits.group("web_app"):
+            # These should be handled by web skills, not app skills
+            return None
         
-        # Common desktop app names
-        apps = [
-            "chrome", "firefox", "edge", "browser",
-            "notepad", "calculator", "word", "excel", "powerpoint",
-            "spotify", "discord", "vscode", "code",
-            "file explorer", "explorer", "command prompt", "cmd",
-            "powershell", "terminal", "task manager", "settings",
-            "control panel", "paint", "photos", "camera", "teams",
-            "zoom", "vlc", "media player", "snipping tool"
-        ]
+        app_hits = hits.group("app")
         
-        for app in apps:
-            if app in text:
-                # Check if it's in an "open" context
-                open_triggers = ["open", "launch", "start", "run"]
-                if any(trigger in text for trigger in open_triggers):
-                    return app
+        # Check if it's in an "open" context
+        if app_hits and hits.group("open_trigger"):
+            return DESKTOP_APP_NAMES[min(app_hits)]
         
         return None
     
@@ -497,6 +1445,104 @@ class Brain:
         self._context.clear()
 
 
+class IntentStream:
+    """
+    Incremental classification over a partial transcript
+    
+    Fed word by word as speech arrives. The phrase automaton state and
+    token-index candidates carry over between feeds, so each word only
+    costs its own characters and postings. A provisional intent is
+    emitted as soon as one clears the confidence threshold; finish()
+    returns exactly what classify_intent(stream.text) would.
+    """
+    
+    def __init__(self, brain: Brain):
+        self._brain = brain
+        self._matcher = brain._matcher
+        self._raw_words: List[str] = []
+        self._words: List[str] = []
+        self._node = 0
+        self._phrase_ids: Set[int] = set()
+        self._candidates: Dict[int, Set[int]] = {}
+        self.provisional: Optional[Intent] = None
+    
+    @property
+    def text(self) -> str:
+        """Transcript so far"""
+        return " ".join(self._raw_words)
+    
+    def feed(self, chunk: str) -> Optional[Intent]:
+        """
+        Add the next word(s) of the transcript
+        
+        Args:
+            chunk: One or more words
+        
+        Returns:
+            A provisional Intent when the best confident guess first
+            appears or changes, otherwise None
+        """
+        raw_words = chunk.split()
+        if not raw_words:
+            return None
+        words = [word.lower() for word in raw_words]
+        
+        # Resume the automaton where the previous word left it
+        joined = " ".join(words)
+        if self._words:
+            joined = " " + joined
+        self._node = self._matcher.automaton.advance(self._node, joined, self._phrase_ids)
+        self._matcher.candidates(words, self._candidates)
+        self._raw_words.extend(raw_words)
+        self._words.extend(words)
+        
+        intent = self._classify(provisional=True)
+        previous = self.provisional
+        self.provisional = intent
+        
+        if intent is None:
+            return None
+        if previous and (previous.category, previous.action) == (intent.category, intent.action):
+            return None
+        return intent
+    
+    def finish(self) -> Intent:
+        """Final classification of the complete transcript"""
+        if self._matcher is not self._brain._matcher:
+            # Patterns changed mid-utterance; the saved state is stale
+            return self._brain.classify_intent(self.text)
+        return self._classify(provisional=False)
+    
+    def _state(self) -> _ClassifyState:
+        return _ClassifyState(
+            self._matcher,
+            self.text,
+            " ".join(self._words),
+            hits=self._matcher.hits_for(self._phrase_ids),
+            candidates=self._candidates
+        )
+    
+    def _classify(self, provisional: bool) -> Optional[Intent]:
+        brain = self._brain
+        text_lower = " ".join(self._words)
+        
+        if not provisional:
+            return brain._classify(self.text, text_lower, self._state())
+        
+        intent = brain._classify_trivial(self.text, text_lower)
+        if intent is None:
+            intent = brain._run_tiers(self._state(), fallback=False, record=False)
+        return intent
+
+
+def _parse_timestamp(value: Any) -> Optional[float]:
+    """Epoch time of a SQLite CURRENT_TIMESTAMP value (stored in UTC)"""
+    try:
+        return datetime.strptime(str(value), "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc).timestamp()
+    except ValueError:
+        return None
+
+
 # Global brain instance
 _brain_instance: Optional[Brain] = None
 
@@ -505,6 +1551,31 @@ def get_brain() -> Brain:
     """Get or create global brain instance"""
     global _brain_instance
     if _brain_instance is None:
-        from config import INTENT_CONFIDENCE_THRESHOLD
-        _brain_instance = Brain(confidence_threshold=INTENT_CONFIDENCE_THRESHOLD)
+        from config import (
+            INTENT_CONFIDENCE_THRESHOLD, INTENT_CACHE_SIZE,
+            INTENT_CLASSIFIER_TIERS, INTENT_SPLIT_COMPOUND, APP_PATHS, WEB_APPS,
+            INTENT_LEARNED_SIZE, INTENT_LEARNED_TTL,
+            INTENT_CLASSIFIER_ENGINE, INTENT_TFIDF_MIN_SIMILARITY,
+            INTENT_PATTERNS_FILE, INTENT_PATTERNS_RELOAD_INTERVAL,
+            INTENT_SNAPSHOT_CACHE_DIR, INTENT_ALTERNATIVES,
+            DIALOGUE_MAX_SESSIONS, DIALOGUE_CONTEXT_TTL
+        )
+        _brain_instance = Brain(
+            confidence_threshold=INTENT_CONFIDENCE_THRESHOLD,
+            cache_size=INTENT_CACHE_SIZE,
+            tiers=INTENT_CLASSIFIER_TIERS,
+            split_compound=INTENT_SPLIT_COMPOUND,
+            app_names=list(APP_PATHS) + list(WEB_APPS),
+            learned_size=INTENT_LEARNED_SIZE,
+            learned_ttl=INTENT_LEARNED_TTL,
+            engine=INTENT_CLASSIFIER_ENGINE,
+            tfidf_min_similarity=INTENT_TFIDF_MIN_SIMILARITY,
+            alternatives=INTENT_ALTERNATIVES,
+            context_sessions=DIALOGUE_MAX_SESSIONS,
+            context_ttl=DIALOGUE_CONTEXT_TTL,
+            patterns_path=INTENT_PATTERNS_FILE,
+            snapshot_cache_dir=INTENT_SNAPSHOT_CACHE_DIR
+        )
+        if INTENT_PATTERNS_RELOAD_INTERVAL > 0:
+            _brain_instance.start_pattern_watcher(INTENT_PATTERNS_RELOAD_INTERVAL)
     return _brain_instance
@@ -0,0 +1,124 @@
+"""
+JARVIS Circuit Breaker
+Fail-fast protection for skills that keep failing or hanging
+"""
+
+from typing import Any, Dict
+import threading
+import time
+
+
+class CircuitBreaker:
+    """
+    Per-skill circuit breaker
+    
+    closed:    calls run; consecutive failures are counted
+    open:      after failure_threshold consecutive failures (errors or
+               timeouts) calls are rejected at once for reset_timeout
+               seconds instead of waiting on a broken skill
+    half_open: after that, one trial call is let through; success closes
+               the breaker, failure opens it again
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        
+        # Lifetime counters for monitoring
+        self._calls = 0
+        self._errors = 0
+        self._timeouts = 0
+        self._rejected = 0
+        self._trips = 0
+    
+    def allow(self) -> bool:
+        """Whether a call may run now (counts it as rejected if not)"""
+        with self._lock:
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self._reset_timeout:
+                    self._rejected += 1
+                    return False
+                self._state = self.HALF_OPEN
+                self._trial_running = False
+            
+            if self._state == self.HALF_OPEN:
+                if self._trial_running:
+                    self._rejected += 1
+                    return False
+                self._trial_running = True
+            
+            self._calls += 1
+            return True
+    
+    def rejecting(self) -> bool:
+        """
+        Whether a call would be rejected now (counts it as rejected if so)
+        
+        Unlike allow(), never claims the half-open trial call, so it can be
+        checked before the call has everything else it needs to run.
+        """
+        with self._lock:
+            if self._state == self.OPEN:
+                rejecting = time.monotonic() - self._opened_at < self._reset_timeout
+            else:
+                rejecting = self._state == self.HALF_OPEN and self._trial_running
+            if rejecting:
+                self._rejected += 1
+            return rejecting
+    
+    def record_success(self):
+        """Report that an allowed call completed"""
+        with self._lock:
+            self._failures = 0
+            self._state = self.CLOSED
+            self._trial_running = False
+    
+    def record_failure(self, timeout: bool = False):
+        """Report that an allowed call raised or timed out"""
+        with self._lock:
+            if timeout:
+                self._timeouts += 1
+            else:
+                self._errors += 1
+            self._failures += 1
+            self._trial_running = False
+            
+            if self._state == self.HALF_OPEN or self._failures >= self._failure_threshold:
+                if self._state != self.OPEN:
+                    self._trips += 1
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+    
+    def retry_in(self) -> float:
+        """Seconds until an open breaker lets a trial call through"""
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(self._reset_timeout - (time.monotonic() - self._opened_at), 0.0)
+    
+    @property
+    def state(self) -> str:
+        return self._state
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get breaker state and counters"""
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "calls": self._calls,
+                "errors": self._errors,
+                "timeouts": self._timeouts,
+                "rejected": self._rejected,
+                "trips": self._trips,
+            }
@@ -0,0 +1,189 @@
+"""
+JARVIS Caching Utilities
+Thread-safe bounded caches with hit/miss accounting
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class LRUCache:
+    """
+    Size-bounded least-recently-used cache
+    
+    Features:
+    - Thread-safe get/put
+    - Hit, miss and eviction counters
+    - Generation counter so results computed before a clear() are
+      never stored after it
+    - Optional time-to-live: entries older than ttl seconds are dropped
+      on access and count as misses
+    """
+    
+    def __init__(self, max_size: int, ttl: float = 0):
+        self._max_size = max(1, max_size)
+        self._ttl = ttl
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+    
+    @property
+    def generation(self) -> int:
+        return self._generation
+    
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value (marking it recently used) or None"""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            if self._ttl:
+                value, stored_at = value
+                if time.monotonic() - stored_at > self._ttl:
+                    del self._data[key]
+                    self._misses += 1
+                    self._expirations += 1
+                    return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+    
+    def put(self, key: Hashable, value: Any, generation: Optional[int] = None):
+        """
+        Store a value, evicting the least recently used entry if full
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            generation: Generation read before computing the value; the
+                put is dropped if the cache was cleared since then
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            if self._ttl:
+                value = (value, time.monotonic())
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._max_size:
+                self._data.popitem(last=False)
+                self._evictions += 1
+    
+    def discard(self, key: Hashable):
+        """Remove a single entry if present and invalidate in-flight puts"""
+        with self._lock:
+            self._data.pop(key, None)
+            self._generation += 1
+    
+    def clear(self):
+        """Drop all entries and invalidate in-flight puts"""
+        with self._lock:
+            self._data.clear()
+            self._generation += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._data),
+                "max_size": self._max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class PickleCache:
+    """
+    Directory of pickled values, each stored with the key it was built from
+    
+    Meant for expensive derived data (compiled indexes) whose key is a
+    hash of everything it was derived from. A load under a different key
+    misses, and the caller rebuilds and stores; the stale value is never
+    unpickled. Only load files this process family wrote itself.
+    """
+    
+    def __init__(self, directory: Path):
+        self._directory = Path(directory)
+    
+    def _path(self, name: str) -> Path:
+        return self._directory / f"{name}.pkl"
+    
+    def load(self, name: str, key: str) -> Optional[Any]:
+        """Return the value stored under name if it was stored with key, else None"""
+        path = self._path(name)
+        try:
+            with open(path, "rb") as f:
+                if pickle.load(f) != key:
+                    return None
+                value = pickle.load(f)
+            # Mark as recently used, for prune()
+            os.utime(path)
+            return value
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache file {path}: {e}")
+            return None
+    
+    def store(self, name: str, key: str, value: Any) -> bool:
+        """
+        Store a value atomically (readers see the old file or the new one)
+        
+        Returns:
+            True if written; failures (read-only disk, etc.) are logged
+        """
+        path = self._path(name)
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self._directory, prefix=f".{name}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            return True
+        except Exception as e:
+            logger.warning(f"Could not write cache file {path}: {e}")
+            return False
+    
+    def prune(self, prefix: str, keep: int):
+        """Delete all but the keep most recently used files whose name starts with prefix"""
+        try:
+            paths = sorted(
+                self._directory.glob(f"{prefix}*.pkl"),
+                key=lambda path: path.stat().st_mtime,
+                reverse=True
+            )
+            for path in paths[keep:]:
+                path.unlink()
+        except OSError as e:
+            logger.warning(f"Could not prune cache directory {self._directory}: {e}")
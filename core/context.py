@@ -0,0 +1,165 @@
+"""
+JARVIS Dialogue Context
+Bounded per-session state for resolving follow-up commands
+"""
+
+from typing import Any, Dict, Hashable, Optional, Tuple
+import re
+import time
+import logging
+
+from .cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+# Words that refer back to the previous command's subject
+REFERENCE_RE = re.compile(r"\b(it|that|this|them)\b")
+
+# Verbs that take an app rather than a search query as their object
+APP_VERBS = frozenset(["open", "launch", "start", "run", "close", "quit", "exit", "kill"])
+
+# Follow-ups that repeat the previous command as is
+REPEAT_PHRASES = frozenset([
+    "again", "do it again", "do that again", "one more time", "same again", "repeat that",
+])
+
+# Commands never repeated from a follow-up
+NO_REPEAT_INTENTS = frozenset(["system.shutdown", "system.restart"])
+
+# Follow-ups that repeat or invert an adjustment ("louder" -> "more")
+MORE_PHRASES = frozenset(["more", "even more", "a bit more", "a little more"])
+LESS_PHRASES = frozenset(["less", "a bit less", "a little less"])
+INVERSE_INTENTS = {
+    "volume.up": "volume.down",
+    "volume.down": "volume.up",
+}
+
+# "what about firefox" - the previous command with a new subject
+ELLIPSIS_RE = re.compile(r"^(?:and|what about|how about|now|also)\s+(.+?)(?:\s+(?:too|as well))?$")
+
+
+class DialogueState:
+    """What one session's last command was about (fixed size)"""
+    
+    __slots__ = ("intent_key", "entities", "app", "referent", "updated_at")
+    
+    def __init__(self, intent_key: str, entities: Dict[str, Any], updated_at: float):
+        self.intent_key = intent_key
+        self.entities = entities
+        self.updated_at = updated_at
+        
+        # Most recent app and most recent subject of any kind; kept across
+        # commands that do not name one ("mute" after "open spotify")
+        self.app: Optional[str] = entities.get("app_name") or None
+        self.referent: Optional[str] = next(
+            (value for value in entities.values() if isinstance(value, str) and value),
+            None
+        )
+    
+    def slot(self) -> Optional[str]:
+        """Name of the text slot the last command filled, if any"""
+        for name, value in self.entities.items():
+            if isinstance(value, str) and value:
+                return name
+        return None
+
+
+class DialogueContext:
+    """
+    Recent dialogue state per session
+    
+    Holds one DialogueState per session in an LRU table, so memory is
+    bounded by max_sessions no matter how long sessions run. States older
+    than ttl seconds are dropped on access: a follow-up only refers back
+    to a command made moments ago.
+    """
+    
+    def __init__(self, max_sessions: int = 256, ttl: float = 120.0):
+        self._sessions = LRUCache(max_sessions)
+        self._ttl = ttl
+    
+    def get(self, session_id: Hashable) -> Optional[DialogueState]:
+        """Current state of a session, or None if it has none or it expired"""
+        state = self._sessions.get(session_id)
+        if state is None:
+            return None
+        if self._ttl and time.time() - state.updated_at > self._ttl:
+            self._sessions.discard(session_id)
+            return None
+        return state
+    
+    def update(self, session_id: Hashable, intent_key: str, entities: Dict[str, Any]):
+        """Record a session's latest command"""
+        previous = self.get(session_id)
+        state = DialogueState(intent_key, dict(entities), time.time())
+        if previous is not None:
+            state.app = state.app or previous.app
+            state.referent = state.referent or previous.referent
+        self._sessions.put(session_id, state)
+    
+    def clear(self, session_id: Optional[Hashable] = None):
+        """Forget one session, or all of them"""
+        if session_id is None:
+            self._sessions.clear()
+        else:
+            self._sessions.discard(session_id)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get session table statistics"""
+        return self._sessions.get_stats()
+
+
+def follow_up(text_lower: str, state: DialogueState) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Resolve a repeat or adjustment follow-up ("again", "more", "less")
+    
+    Returns:
+        (intent key, entities) of the command meant, or None
+    """
+    if text_lower in REPEAT_PHRASES and state.intent_key not in NO_REPEAT_INTENTS:
+        return state.intent_key, dict(state.entities)
+    
+    if state.intent_key in INVERSE_INTENTS:
+        if text_lower in MORE_PHRASES:
+            return state.intent_key, dict(state.entities)
+        if text_lower in LESS_PHRASES:
+            return INVERSE_INTENTS[state.intent_key], {}
+    
+    return None
+
+
+def elided_subject(text_lower: str, state: DialogueState) -> Optional[Tuple[str, str]]:
+    """
+    New subject for the previous command ("what about firefox")
+    
+    Returns:
+        (slot name, value) to re-run the previous command with, or None
+    """
+    match = ELLIPSIS_RE.match(text_lower)
+    slot = state.slot()
+    if match is None or slot is None:
+        return None
+    return slot, match.group(1)
+
+
+def substitute_reference(text_lower: str, state: DialogueState) -> Optional[str]:
+    """
+    Replace the first back-reference in an utterance with what it refers to
+    
+    "close it" -> "close chrome"; an app is preferred after app verbs,
+    otherwise the last subject of any kind.
+    
+    Returns:
+        Rewritten text, or None if there is nothing to substitute
+    """
+    match = REFERENCE_RE.search(text_lower)
+    if match is None:
+        return None
+    
+    verbs = APP_VERBS.intersection(text_lower[:match.start()].split())
+    referent = state.app if verbs and state.app else state.referent
+    if not referent:
+        return None
+    
+    return text_lower[:match.start()] + referent + text_lower[match.end():]
@@ -3,16 +3,33 @@ JARVIS Command Dispatcher
 Routes intents to appropriate skill handlers
 """
 
-from typing import Dict, Any, Callable, Optional, List
-from dataclasses import dataclass
+from typing import Dict, Any, Callable, Hashable, Optional, List, Tuple
+from dataclasses import dataclass, field
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 import logging
 import importlib
 import inspect
+import threading
+import time
 
 from .brain import Intent, IntentCategory
+from .breaker import CircuitBreaker
+from .cache import LRUCache
+from .limiter import ConcurrencyLimiter, Slot
+from .lanes import Lane, LANES, LANE_EXPRESS, LANE_NORMAL, LANE_BULK
+from .metrics import CallStats
+from .middleware import Middleware, MIDDLEWARE, compile_chain
 
 logger = logging.getLogger(__name__)
 
+# Name the fallback handler runs under (breaker and statistics)
+FALLBACK_SKILL = "fallback"
+
+
+class SkillTimeout(Exception):
+    """A skill handler overran its timeout budget"""
+
 
 @dataclass
 class SkillHandler:
@@ -20,8 +37,31 @@ class SkillHandler:
     name: str
     category: IntentCategory
     actions: List[str]
-    handler: Callable
+    handler: Optional[Callable]
     description: str = ""
+    # Run in the process pool (handler and intent must be picklable)
+    cpu_bound: bool = False
+    # Seconds the handler may run before the dispatch gives up (None = no limit)
+    timeout: Optional[float] = None
+    # Seconds a successful result is reused for a repeat call (None = never)
+    cache_ttl: Optional[float] = None
+    # Maps intent.entities to the part of the cache key they contribute
+    # (default: all of them); returning None skips the cache
+    cache_key: Optional[Callable[[Dict[str, Any]], Optional[Hashable]]] = None
+    # Priority lane of asynchronous dispatches (see core.lanes)
+    lane: str = LANE_NORMAL
+    # Calls that may run at once (None = no limit), and how many more may
+    # wait for a slot before calls are turned away as busy
+    max_concurrency: Optional[int] = None
+    max_queue: Optional[int] = None
+    # Middleware chain compiled around this skill's call (None = no
+    # middleware applies; the skill is called directly)
+    pipeline: Optional[Callable[..., Dict[str, Any]]] = field(
+        default=None, repr=False, compare=False
+    )
+    # Module to import on first dispatch; set (with handler None) while
+    # the skill is only known from the manifest
+    module: Optional[str] = None
 
 
 class Dispatcher:
@@ -31,122 +71,846 @@ class Dispatcher:
     Features:
     - Dynamic skill registration
     - Category-based routing
-    - Action pattern matching
+    - O(1) (category, action) route table
     - Fallback handling
+    - Runner-up intents tried before the fallback
+    - Concurrent dispatch of independent intents
+    - Asynchronous dispatch returning futures
+    - Express, normal and bulk priority lanes with separate workers
+    - CPU-bound skills isolated in a process pool
+    - Per-skill timeouts and circuit breakers
+    - Per-skill call counters and latency histograms
+    - TTL result caches for skills that declare one
+    - Per-skill concurrency limits with a bounded wait queue
+    - Pre/post/error middleware, compiled per skill at registration
+    - Skills registered from a manifest, imported on first dispatch
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_workers: int = 4,
+        express_workers: int = 1,
+        bulk_workers: int = 2,
+        process_workers: int = 2,
+        breaker_failures: int = 3,
+        breaker_reset: float = 30.0,
+        result_cache_size: int = 32,
+        queue_size: int = 4,
+        queue_wait: float = 5.0
+    ):
         self._handlers: Dict[str, SkillHandler] = {}
         self._category_handlers: Dict[IntentCategory, List[str]] = {}
-        self._fallback: Optional[Callable] = None
+        # The fallback runs as a skill of its own (see set_fallback)
+        self._fallback: Optional[SkillHandler] = None
+        
+        # Route tables derived from the registrations above: explicit
+        # (category, action) routes and one "*" skill per category.
+        # Replaced wholesale on change, so dispatch never sees a partial one
+        self._routes: Dict[Tuple[IntentCategory, str], SkillHandler] = {}
+        self._wildcards: Dict[IntentCategory, SkillHandler] = {}
+        
+        # Worker pools (created on first use): one thread pool per priority
+        # lane for asynchronous and concurrent dispatch, processes for
+        # CPU-bound skills
+        self._max_workers = max_workers
+        self._lane_workers = {
+            LANE_EXPRESS: express_workers,
+            LANE_NORMAL: max_workers,
+            LANE_BULK: bulk_workers,
+        }
+        self._process_workers = process_workers
+        self._lanes: Dict[str, Lane] = {}
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        # Threads (per lane) that run skills with a timeout budget, so the
+        # dispatching thread can stop waiting on one that hangs
+        self._timeout_executors: Dict[str, ThreadPoolExecutor] = {}
+        self._executor_lock = threading.Lock()
+        
+        # Per-skill circuit breakers (skill name -> breaker)
+        self._breaker_failures = breaker_failures
+        self._breaker_reset = breaker_reset
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        
+        # Per-skill call counts and latency (skill name -> stats)
+        self._skill_stats: Dict[str, CallStats] = {}
+        
+        # Recent results of skills with a cache_ttl (skill name -> cache of
+        # (action, entities key) -> result), each bounded to result_cache_size
+        self._result_cache_size = result_cache_size
+        self._result_caches: Dict[str, LRUCache] = {}
+        
+        # Concurrency limits of skills that declare max_concurrency (skill
+        # name -> limiter); max_queue defaults to queue_size, and a queued
+        # call waits at most queue_wait seconds for a slot
+        self._queue_size = queue_size
+        self._queue_wait = queue_wait
+        self._limiters: Dict[str, ConcurrencyLimiter] = {}
+        
+        # Middleware around every skill call, outermost first
+        self._middleware: List[Middleware] = []
         
+        # Serializes first-dispatch imports of manifest-only skills
+        self._load_lock = threading.Lock()
+    
     def register(
         self,
         name: str,
         category: IntentCategory,
         actions: List[str],
         handler: Callable,
-        description: str = ""
+        description: str = "",
+        cpu_bound: bool = False,
+        timeout: Optional[float] = None,
+        cache_ttl: Optional[float] = None,
+        cache_key: Optional[Callable[[Dict[str, Any]], Optional[Hashable]]] = None,
+        lane: str = LANE_NORMAL,
+        max_concurrency: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        module: Optional[str] = None
     ):
         """
         Register a skill handler
         
+        Registering a name again replaces the skill but keeps its place in
+        routing order, its circuit breaker and its statistics - this is how
+        a manifest entry is swapped for the real handler once its module
+        is imported.
+        
         Args:
             name: Unique handler name
             category: Intent category this handler serves
             actions: List of actions this handler can process
-            handler: Callable that processes the intent
+            handler: Callable that processes the intent (None for a skill
+                known only from the manifest)
             description: Human-readable description
+            cpu_bound: Run the handler in the process pool; it must be a
+                module-level function
+            timeout: Seconds the handler may run before the dispatch
+                returns a timeout result (None = no limit)
+            cache_ttl: Seconds a successful result is served again to
+                calls with the same action and cache key (None = no cache)
+            cache_key: Function of intent.entities giving the cache key
+                (default: all entities); None from it skips the cache
+            lane: Priority lane ("express", "normal" or "bulk") its
+                asynchronous dispatches run in
+            max_concurrency: Calls that may run at once (None = no limit)
+            max_queue: Calls that may wait for a slot beyond that (default
+                queue_size); any more get a "busy" result
+            module: Module that registers the handler when imported
+                (required when handler is None)
         """
+        if lane not in LANES:
+            raise ValueError(f"Unknown dispatch lane for {name}: {lane}")
+        
         skill = SkillHandler(
             name=name,
             category=category,
             actions=actions,
             handler=handler,
-            description=description
+            description=description,
+            cpu_bound=cpu_bound,
+            timeout=timeout,
+            cache_ttl=cache_ttl,
+            cache_key=cache_key,
+            lane=lane,
+            max_concurrency=max_concurrency,
+            max_queue=max_queue,
+            module=module if handler is None else None
         )
+        skill.pipeline = self._compile(skill)
         
+        previous = self._handlers.get(name)
         self._handlers[name] = skill
+        self._breakers.setdefault(name, CircuitBreaker(self._breaker_failures, self._breaker_reset))
+        self._skill_stats.setdefault(name, CallStats())
+        if not cache_ttl:
+            self._result_caches.pop(name, None)
+        elif name not in self._result_caches or self._result_caches[name].ttl != cache_ttl:
+            # Created for manifest entries too, so the miss on the call
+            # that imports the skill is counted
+            self._result_caches[name] = LRUCache(self._result_cache_size, ttl=cache_ttl)
+        self._set_limiter(name, max_concurrency, max_queue)
         
         # Index by category
-        if category not in self._category_handlers:
-            self._category_handlers[category] = []
-        self._category_handlers[category].append(name)
+        if previous is not None and previous.category != category:
+            self._category_handlers[previous.category].remove(name)
+            self._rebuild_routes(previous.category)
+        names = self._category_handlers.setdefault(category, [])
+        if name not in names:
+            names.append(name)
+        self._rebuild_routes(category)
+        
+        if handler is None:
+            logger.debug(f"Registered skill: {name} [{category.name}] - {actions} (from {module})")
+        else:
+            logger.info(f"Registered skill: {name} [{category.name}] - {actions}")
+    
+    def register_manifest(self, manifest: Dict[str, Any]):
+        """
+        Register the skills described by a manifest without importing them
+        
+        Each skill's module is imported the first time one of its skills
+        is dispatched (see core.manifest.build_manifest for the layout).
+        """
+        for entry in manifest["skills"]:
+            self.register(
+                entry["name"],
+                IntentCategory[entry["category"]],
+                entry["actions"],
+                None,
+                entry["description"],
+                entry["cpu_bound"],
+                entry["timeout"],
+                entry["cache_ttl"],
+                lane=entry["lane"],
+                max_concurrency=entry["max_concurrency"],
+                max_queue=entry["max_queue"],
+                module=entry["module"]
+            )
+        
+        if manifest["fallback"] is not None and self._fallback is None:
+            # Importing the module sets the real fallback
+            module, _, options = manifest["fallback"]
+            self.set_fallback(None, module=module, **options)
+    
+    def _ensure_loaded(self, skill: SkillHandler) -> SkillHandler:
+        """
+        The registered skill with its handler, importing its module if needed
+        
+        Raises:
+            ImportError: The module failed to import or did not register
+                the skill
+        """
+        if skill.handler is not None:
+            return skill
         
-        logger.info(f"Registered skill: {name} [{category.name}] - {actions}")
+        with self._load_lock:
+            loaded = self._registered(skill)
+            if loaded.handler is None:
+                start = time.perf_counter()
+                importlib.import_module(skill.module)
+                loaded = self._registered(skill)
+                if loaded.handler is None:
+                    raise ImportError(f"{skill.module} did not register skill {skill.name}")
+                logger.info(
+                    f"Loaded skill module {skill.module} in "
+                    f"{(time.perf_counter() - start) * 1000:.1f} ms"
+                )
+        return loaded
+    
+    def _set_limiter(self, name: str, max_concurrency: Optional[int], max_queue: Optional[int]):
+        """Create, keep or drop a skill's concurrency limiter"""
+        if not max_concurrency:
+            self._limiters.pop(name, None)
+            return
+        max_queue = self._queue_size if max_queue is None else max_queue
+        limiter = self._limiters.get(name)
+        # Kept when unchanged, so calls in flight while a manifest entry is
+        # replaced by the real skill still count against the limit
+        if (
+            limiter is None or limiter.max_concurrency != max_concurrency
+            or limiter.max_queue != max_queue
+        ):
+            self._limiters[name] = ConcurrencyLimiter(max_concurrency, max_queue, self._queue_wait)
+    
+    def _registered(self, skill: SkillHandler) -> SkillHandler:
+        """Current registration of a skill, which may have replaced this one"""
+        if skill.name == FALLBACK_SKILL and self._fallback is not None:
+            return self._fallback
+        return self._handlers.get(skill.name, skill)
     
     def register_decorator(
         self,
         category: IntentCategory,
         actions: List[str],
-        description: str = ""
+        description: str = "",
+        cpu_bound: bool = False,
+        timeout: Optional[float] = None,
+        cache_ttl: Optional[float] = None,
+        cache_key: Optional[Callable[[Dict[str, Any]], Optional[Hashable]]] = None,
+        lane: str = LANE_NORMAL,
+        max_concurrency: Optional[int] = None,
+        max_queue: Optional[int] = None
     ):
         """Decorator for registering skill handlers"""
         def decorator(func: Callable):
             name = func.__name__
-            self.register(name, category, actions, func, description)
+            self.register(
+                name, category, actions, func, description, cpu_bound, timeout,
+                cache_ttl, cache_key, lane, max_concurrency, max_queue
+            )
             return func
         return decorator
     
-    def set_fallback(self, handler: Callable):
-        """Set fallback handler for unmatched intents"""
-        self._fallback = handler
-        logger.info("Fallback handler registered")
+    def set_fallback(
+        self,
+        handler: Optional[Callable],
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        module: Optional[str] = None
+    ):
+        """
+        Set fallback handler for unmatched intents
+        
+        The fallback runs like a skill named "fallback" in the bulk lane:
+        behind a circuit breaker, with call statistics, and within timeout
+        seconds and max_concurrency concurrent calls if given.
+        
+        Args:
+            handler: Callable that processes the intent (None to import
+                module on first use, which sets the real one)
+            timeout: Seconds the handler may run (None = no limit)
+            max_concurrency: Calls that may run at once (None = no limit)
+            max_queue: Calls that may wait for a slot (default queue_size)
+            module: Module that sets the fallback when imported
+        """
+        self._fallback = SkillHandler(
+            name=FALLBACK_SKILL,
+            category=IntentCategory.UNKNOWN,
+            actions=["*"],
+            handler=handler,
+            description="Fallback for unmatched intents",
+            timeout=timeout,
+            lane=LANE_BULK,
+            max_concurrency=max_concurrency,
+            max_queue=max_queue,
+            module=module if handler is None else None
+        )
+        self._fallback.pipeline = self._compile(self._fallback)
+        self._set_limiter(FALLBACK_SKILL, max_concurrency, max_queue)
+        self._breakers.setdefault(
+            FALLBACK_SKILL, CircuitBreaker(self._breaker_failures, self._breaker_reset)
+        )
+        self._skill_stats.setdefault(FALLBACK_SKILL, CallStats())
+        if handler is not None:
+            logger.info("Fallback handler registered")
+    
+    def add_middleware(self, middleware: Middleware):
+        """
+        Add a middleware around skill calls (inside those added before it)
+        
+        Every skill's call path is recompiled now rather than consulting
+        the middleware list on each dispatch.
+        """
+        self._middleware.append(middleware)
+        self._recompile()
+        logger.info(f"Middleware added: {middleware.name}")
+    
+    def remove_middleware(self, middleware: Middleware):
+        """Remove a middleware added with add_middleware"""
+        if middleware in self._middleware:
+            self._middleware.remove(middleware)
+            self._recompile()
+    
+    def _compile(self, skill: SkillHandler) -> Optional[Callable[..., Dict[str, Any]]]:
+        """Call path of a skill through the middleware (None if there is none)"""
+        if not self._middleware:
+            return None
+        return compile_chain(
+            self._middleware, skill, lambda intent, slot=None: self._run_skill(skill, intent, slot)
+        )
+    
+    def _recompile(self):
+        """Recompile every skill's call path after the middleware changed"""
+        for skill in list(self._handlers.values()):
+            skill.pipeline = self._compile(skill)
+        if self._fallback is not None:
+            self._fallback.pipeline = self._compile(self._fallback)
+    
+    def _call(self, skill: SkillHandler, intent: Intent, slot: Optional[Slot] = None) -> Dict[str, Any]:
+        """
+        Run a skill through its compiled middleware chain, if any
+        
+        Args:
+            slot: Concurrency slot the call was admitted with (see _admit)
+        """
+        pipeline = skill.pipeline
+        try:
+            if pipeline is None:
+                return self._run_skill(skill, intent, slot)
+            return pipeline(intent, slot)
+        finally:
+            # A middleware that answered by itself never passed it on
+            if slot is not None and not slot.claimed:
+                slot.release()
+    
+    def _rebuild_routes(self, category: IntentCategory):
+        """
+        Recompute the route tables for one category
+        
+        The first registered skill listing an action, or accepting "*",
+        serves it - so an explicit route only exists if no "*" skill was
+        registered before it.
+        """
+        routes = {key: skill for key, skill in self._routes.items() if key[0] != category}
+        wildcards = {cat: skill for cat, skill in self._wildcards.items() if cat != category}
+        
+        for name in self._category_handlers.get(category, []):
+            skill = self._handlers.get(name)
+            if skill is None:
+                continue
+            if category in wildcards:
+                break
+            for action in skill.actions:
+                if action == "*":
+                    wildcards[category] = skill
+                else:
+                    routes.setdefault((category, action), skill)
+        
+        self._routes = routes
+        self._wildcards = wildcards
+    
+    def _find_handler(self, intent: Intent) -> Optional[SkillHandler]:
+        """Skill that handles an intent's action (a single lookup)"""
+        skill = self._routes.get((intent.category, intent.action))
+        if skill is None:
+            skill = self._wildcards.get(intent.category)
+        return skill
+    
+    def _route(self, intent: Intent) -> Tuple[Optional[SkillHandler], Intent]:
+        """
+        Skill that runs an intent and the intent it runs with
+        
+        When no skill handles the intent, its runner-up readings
+        (intent.alternatives) are tried in order, then the fallback.
+        """
+        skill = self._find_handler(intent)
+        if skill is not None:
+            return skill, intent
+        
+        for alternative in intent.alternatives:
+            skill = self._find_handler(alternative)
+            if skill is not None:
+                return skill, alternative
+        
+        return self._fallback, intent
+    
+    def _lane_for(self, intent: Intent) -> str:
+        """Lane an intent is dispatched in: its skill's, bulk for the fallback"""
+        skill, _ = self._route(intent)
+        return skill.lane if skill is not None else LANE_NORMAL
     
     def dispatch(self, intent: Intent) -> Dict[str, Any]:
         """
         Dispatch an intent to the appropriate handler
         
+        When no skill handles the intent, its runner-up readings
+        (intent.alternatives) are tried in order before the fallback.
+        
         Args:
             intent: Classified intent to dispatch
-            
+        
         Returns:
-            Result dictionary from handler
+            Result dictionary from handler; includes "intent" when a
+            runner-up was dispatched instead. A skill that overruns its
+            timeout yields error "timeout"; one whose circuit breaker is
+            open is not called and yields error "circuit_open"; one at its
+            concurrency limit with a full queue yields error "busy".
         """
         logger.debug(f"Dispatching: {intent.category.name}.{intent.action}")
+        skill, chosen = self._route(intent)
+        return self._dispatch_routed(intent, skill, chosen)
+    
+    def _dispatch_routed(
+        self,
+        intent: Intent,
+        skill: Optional[SkillHandler],
+        chosen: Intent,
+        slot: Optional[Slot] = None
+    ) -> Dict[str, Any]:
+        """Dispatch an intent to the skill _route() picked for it"""
+        if skill is None:
+            logger.warning(f"No handler for: {intent.category.name}.{intent.action}")
+            return {
+                "success": False,
+                "error": "No handler found"
+            }
         
-        # Find handlers for this category
-        handler_names = self._category_handlers.get(intent.category, [])
+        if chosen is not intent:
+            logger.info(
+                f"No handler for {intent.category.name}.{intent.action}, "
+                f"using {chosen.category.name}.{chosen.action}"
+            )
         
-        for name in handler_names:
-            skill = self._handlers[name]
-            
-            # Check if this skill handles the action
-            if intent.action in skill.actions or "*" in skill.actions:
-                try:
-                    result = skill.handler(intent)
-                    return {
-                        "success": True,
-                        "handler": name,
-                        "result": result
-                    }
-                except Exception as e:
-                    logger.error(f"Handler {name} error: {e}")
-                    return {
-                        "success": False,
-                        "handler": name,
-                        "error": str(e)
-                    }
-        
-        # Try fallback
-        if self._fallback:
-            try:
-                result = self._fallback(intent)
-                return {
-                    "success": True,
-                    "handler": "fallback",
-                    "result": result
-                }
-            except Exception as e:
-                logger.error(f"Fallback handler error: {e}")
-        
-        # No handler found
-        logger.warning(f"No handler for: {intent.category.name}.{intent.action}")
+        outcome = self._call(skill, chosen, slot)
+        if chosen is not intent:
+            outcome["intent"] = chosen
+        return outcome
+    
+    def _result_key(self, skill: SkillHandler, intent: Intent) -> Optional[Hashable]:
+        """Result cache key for an intent, or None if it should not be cached"""
+        try:
+            if skill.cache_key is not None:
+                entities_key = skill.cache_key(intent.entities)
+            else:
+                entities_key = tuple(sorted(intent.entities.items()))
+            if entities_key is None:
+                return None
+            key = (intent.action, entities_key)
+            hash(key)
+            return key
+        except Exception as e:
+            logger.debug(f"Not caching {skill.name} result: {e}")
+            return None
+    
+    def _cached_result(self, skill: SkillHandler, intent: Intent) -> Optional[Dict[str, Any]]:
+        """Result dictionary of a repeat call answered from the skill's result cache"""
+        cache = self._result_caches.get(skill.name)
+        if cache is None:
+            return None
+        key = self._result_key(self._handlers.get(skill.name, skill), intent)
+        result = cache.get(key) if key is not None else None
+        if result is None:
+            return None
+        return {
+            "success": True,
+            "handler": skill.name,
+            "result": dict(result) if isinstance(result, dict) else result,
+            "cached": True
+        }
+    
+    def _admit(self, skill: SkillHandler, intent: Intent) -> Tuple[Optional[Slot], Optional[Dict[str, Any]]]:
+        """
+        Take a concurrency slot (or queue place) for a call before it is
+        queued on a lane, without waiting
+        
+        The limiter only sees a call once a lane worker runs it, so
+        without this a burst would pile up in the lane's queue instead of
+        being turned away.
+        
+        Returns:
+            (slot for the call, or None if it needs none; result to answer
+            with at once instead of queueing the call, or None)
+        """
+        limiter = self._limiters.get(skill.name)
+        if limiter is None or self._cached_result(skill, intent) is not None:
+            return None, None
+        
+        breaker = self._breakers[skill.name]
+        if breaker.rejecting():
+            return None, self._circuit_open(skill, breaker)
+        slot = limiter.admit()
+        if slot is None:
+            return None, self._busy(skill, limiter, breaker)
+        return slot, None
+    
+    def _run_skill(self, skill: SkillHandler, intent: Intent, slot: Optional[Slot] = None) -> Dict[str, Any]:
+        """
+        Run a skill behind its circuit breaker and build the result dictionary
+        
+        Args:
+            slot: Concurrency slot the call was admitted with before it was
+                queued on a lane (None = take one now, if the skill is limited)
+        """
+        if slot is not None:
+            slot.claimed = True
+        
+        # A repeat call to a skill with a cache_ttl is served from its
+        # cache, without calling the handler (or consulting the breaker)
+        outcome = self._cached_result(skill, intent)
+        if outcome is not None:
+            if slot is not None:
+                slot.release()
+            return outcome
+        
+        # Checked before queueing for a slot, so calls to a broken skill
+        # fail at once instead of waiting for one
+        breaker = self._breakers[skill.name]
+        if breaker.rejecting():
+            if slot is not None:
+                slot.release()
+            return self._circuit_open(skill, breaker)
+        
+        limiter = self._limiters.get(skill.name)
+        if limiter is not None:
+            if slot is None:
+                slot = limiter.admit()
+            if slot is None or not slot.wait():
+                if slot is not None:
+                    slot.release()
+                return self._busy(skill, limiter, breaker)
+        release = slot.release if slot is not None else None
+        
+        # The half-open trial is claimed only once a slot is held, so the
+        # trial call is never admitted and then turned away busy
+        if not breaker.allow():
+            if release:
+                release()
+            return self._circuit_open(skill, breaker)
+        
+        # First dispatch of a manifest-only skill: import it outside the
+        # timeout budget and the latency statistics
+        try:
+            skill = self._ensure_loaded(skill)
+        except Exception as e:
+            if release:
+                release()
+            breaker.record_failure()
+            logger.error(f"Handler {skill.name} failed to load: {e}")
+            return {
+                "success": False,
+                "handler": skill.name,
+                "error": str(e)
+            }
+        
+        stats = self._skill_stats[skill.name]
+        start = time.perf_counter()
+        try:
+            result = self._invoke(skill, intent, release)
+        except SkillTimeout:
+            if slot is not None:
+                slot.mark_overdue()
+            stats.record((time.perf_counter() - start) * 1000, error=True)
+            breaker.record_failure(timeout=True)
+            logger.error(f"Handler {skill.name} timed out after {skill.timeout}s")
+            return {
+                "success": False,
+                "handler": skill.name,
+                "error": "timeout",
+                "timeout": skill.timeout
+            }
+        except Exception as e:
+            stats.record((time.perf_counter() - start) * 1000, error=True)
+            breaker.record_failure()
+            logger.error(f"Handler {skill.name} error: {e}")
+            return {
+                "success": False,
+                "handler": skill.name,
+                "error": str(e)
+            }
+        
+        stats.record((time.perf_counter() - start) * 1000)
+        breaker.record_success()
+        
+        # Skills report failures as {"error": ...}; only cache real results
+        cache = self._result_caches.get(skill.name)
+        if cache is not None and not (isinstance(result, dict) and "error" in result):
+            key = self._result_key(skill, intent)
+            if key is not None:
+                cache.put(key, dict(result) if isinstance(result, dict) else result)
+        
+        return {
+            "success": True,
+            "handler": skill.name,
+            "result": result
+        }
+    
+    @staticmethod
+    def _busy(skill: SkillHandler, limiter: ConcurrencyLimiter, breaker: CircuitBreaker) -> Dict[str, Any]:
+        """Result of a call turned away at the skill's concurrency limit"""
+        # Slots still held by calls that timed out: the skill is stuck,
+        # not just busy, so let the breaker count it
+        if limiter.overdue:
+            breaker.record_failure(timeout=True)
+        logger.warning(f"Handler {skill.name} busy, call rejected")
         return {
             "success": False,
-            "error": "No handler found"
+            "handler": skill.name,
+            "error": "busy",
+            "retry_after": limiter.wait_timeout
         }
     
+    @staticmethod
+    def _circuit_open(skill: SkillHandler, breaker: CircuitBreaker) -> Dict[str, Any]:
+        """Result of a call skipped because the skill's breaker is open"""
+        logger.warning(f"Handler {skill.name} skipped, circuit open")
+        return {
+            "success": False,
+            "handler": skill.name,
+            "error": "circuit_open",
+            "retry_in": breaker.retry_in()
+        }
+    
+    def _invoke(
+        self,
+        skill: SkillHandler,
+        intent: Intent,
+        on_done: Optional[Callable[[], None]] = None
+    ) -> Any:
+        """
+        Run a skill handler, in the process pool if it is CPU-bound
+        
+        A handler with a timeout runs on another thread (or process) so
+        waiting can stop at the deadline; the call is cancelled if it has
+        not started yet. Python cannot interrupt a call that already
+        started - it finishes in the background and its result is dropped.
+        
+        Args:
+            on_done: Called once the handler has really finished (or was
+                cancelled) - after a timeout that is later than the return
+        
+        Raises:
+            SkillTimeout: The handler overran skill.timeout
+        """
+        if not (skill.cpu_bound or skill.timeout):
+            try:
+                return skill.handler(intent)
+            finally:
+                if on_done:
+                    on_done()
+        
+        try:
+            if skill.cpu_bound:
+                future = self._get_process_pool().submit(skill.handler, intent)
+            else:
+                future = self._get_timeout_executor(skill.lane).submit(skill.handler, intent)
+        except BaseException:
+            if on_done:
+                on_done()
+            raise
+        if on_done:
+            future.add_done_callback(lambda _: on_done())
+        
+        try:
+            return future.result(timeout=skill.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise SkillTimeout(skill.name)
+    
+    def dispatch_async(self, intent: Intent) -> Future:
+        """
+        Dispatch an intent on the worker pool of its skill's lane
+        
+        A skill at its concurrency limit with a full queue is answered
+        "busy" at once rather than queued on the lane.
+        
+        Returns:
+            Future resolving to the dispatch() result dictionary
+        """
+        future: Future = Future()
+        self._submit(intent, future)
+        return future
+    
+    def _submit(self, intent: Intent, future: Future, then: Optional[Callable[[], None]] = None):
+        """
+        Admit an intent's call and queue it on its skill's lane
+        
+        Args:
+            future: Resolves to the result dictionary; cancelling it before
+                a worker takes the call skips the call
+            then: Called once the call is done (or was turned away or
+                cancelled) - on the thread that finished it
+        """
+        skill, chosen = self._route(intent)
+        slot = None
+        if skill is not None:
+            slot, outcome = self._admit(skill, chosen)
+            if outcome is not None:
+                if chosen is not intent:
+                    outcome["intent"] = chosen
+                if future.set_running_or_notify_cancel():
+                    future.set_result(outcome)
+                if then:
+                    then()
+                return
+        
+        def run():
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(self._dispatch_routed(intent, skill, chosen, slot))
+                except Exception as e:
+                    future.set_exception(e)
+            elif slot is not None:
+                slot.release()
+            if then:
+                then()
+        
+        self._get_lane(skill.lane if skill is not None else LANE_NORMAL).submit(run)
+    
+    def dispatch_many_async(self, intents: List[Intent]) -> List[Future]:
+        """
+        Dispatch several intents on the worker pool (see dispatch_many)
+        
+        Returns:
+            One future per intent, in input order; same-category intents
+            still run one after another, each step in its own lane
+        """
+        chains: Dict[IntentCategory, List[int]] = {}
+        for pos, intent in enumerate(intents):
+            chains.setdefault(intent.category, []).append(pos)
+        
+        futures = [Future() for _ in intents]
+        
+        def submit_step(positions: List[int], index: int):
+            # The next command of the chain starts only once this one is
+            # done, in its own lane - a bulk step never runs on an express
+            # worker
+            then = None
+            if index + 1 < len(positions):
+                then = lambda: submit_step(positions, index + 1)
+            self._submit(intents[positions[index]], futures[positions[index]], then)
+        
+        for positions in chains.values():
+            submit_step(positions, 0)
+        return futures
+    
+    def dispatch_many(self, intents: List[Intent]) -> List[Dict[str, Any]]:
+        """
+        Dispatch several intents, running independent ones concurrently
+        
+        Intents of different categories run in parallel on the worker
+        pools. Intents of the same category act on the same thing ("volume
+        up and mute"), so they run one after another in spoken order.
+        Bulk-lane work always goes through its lane, which bounds how many
+        slow calls run at once.
+        
+        Args:
+            intents: Intents in spoken order
+        
+        Returns:
+            One result dictionary per intent, in input order
+        """
+        if (
+            len({intent.category for intent in intents}) <= 1
+            and all(self._lane_for(intent) != LANE_BULK for intent in intents)
+        ):
+            # Nothing to overlap: run on the caller's thread
+            return [self.dispatch(intent) for intent in intents]
+        return [future.result() for future in self.dispatch_many_async(intents)]
+    
+    def _get_lane(self, name: str) -> Lane:
+        """Get or create the worker pool of a priority lane"""
+        with self._executor_lock:
+            lane = self._lanes.get(name)
+            if lane is None:
+                lane = self._lanes[name] = Lane(name, self._lane_workers[name])
+            return lane
+    
+    def _get_timeout_executor(self, lane: str) -> ThreadPoolExecutor:
+        """Get or create a lane's thread pool for skills with a timeout"""
+        with self._executor_lock:
+            executor = self._timeout_executors.get(lane)
+            if executor is None:
+                # Sized like the lane itself: each of its workers may be
+                # waiting on one timed skill call
+                executor = self._timeout_executors[lane] = ThreadPoolExecutor(
+                    max_workers=self._lane_workers[lane],
+                    thread_name_prefix=f"skill-{lane}"
+                )
+            return executor
+    
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Get or create the process pool for CPU-bound skills"""
+        with self._executor_lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(max_workers=self._process_workers)
+            return self._process_pool
+    
+    def shutdown(self):
+        """Stop the worker pools (waits for running skills)"""
+        with self._executor_lock:
+            for lane in self._lanes.values():
+                lane.shutdown(wait=True)
+            self._lanes.clear()
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=True)
+                self._process_pool = None
+            for executor in self._timeout_executors.values():
+                # Hung handlers are abandoned rather than waited for
+                executor.shutdown(wait=False)
+            self._timeout_executors.clear()
+    
     def get_registered_skills(self) -> List[Dict]:
         """Get list of registered skills"""
         return [
@@ -154,11 +918,82 @@ class Dispatcher:
                 "name": skill.name,
                 "category": skill.category.name,
                 "actions": skill.actions,
-                "description": skill.description
+                "description": skill.description,
+                "timeout": skill.timeout,
+                "cache_ttl": skill.cache_ttl,
+                "lane": skill.lane,
+                "max_concurrency": skill.max_concurrency,
+                "loaded": skill.handler is not None
             }
             for skill in self._handlers.values()
         ]
     
+    def get_breaker_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get circuit breaker state per skill
+        
+        Returns:
+            Skill name -> state (closed/open/half_open), consecutive
+            failures, and call, error, timeout, rejected and trip counts
+        """
+        return {name: breaker.get_stats() for name, breaker in self._breakers.items()}
+    
+    def get_skill_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get call statistics per skill
+        
+        Errors are handler exceptions and timeouts; calls skipped by an
+        open circuit breaker or served from the result cache are not
+        counted (see get_breaker_stats and get_result_cache_stats).
+        
+        Returns:
+            Skill name -> calls, errors, error_rate, avg_ms, p50_ms,
+            p95_ms, p99_ms and max_ms
+        """
+        return {name: stats.get_stats() for name, stats in self._skill_stats.items()}
+    
+    def get_result_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get result cache statistics per skill with a cache_ttl
+        
+        Returns:
+            Skill name -> size, max_size, hits, misses, evictions,
+            expirations and hit_rate
+        """
+        return {name: cache.get_stats() for name, cache in self._result_caches.items()}
+    
+    def get_lane_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get queue depth and wait time per priority lane
+        
+        Returns:
+            Lane name -> workers, queued, running, completed, wait_avg_ms,
+            wait_p95_ms and wait_max_ms (lanes not used yet are omitted)
+        """
+        with self._executor_lock:
+            lanes = list(self._lanes.values())
+        return {lane.name: lane.get_stats() for lane in lanes}
+    
+    def get_concurrency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get concurrency limit statistics per skill that declares one
+        
+        Returns:
+            Skill name -> max_concurrency, max_queue, running, waiting,
+            admitted, queued, rejected and peak_waiting
+        """
+        return {name: limiter.get_stats() for name, limiter in self._limiters.items()}
+    
+    def get_middleware_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get statistics of each middleware (middleware name -> stats)"""
+        return {middleware.name: middleware.get_stats() for middleware in self._middleware}
+    
+    def clear_result_cache(self, name: Optional[str] = None):
+        """Drop cached results of one skill, or of all skills"""
+        for skill_name, cache in list(self._result_caches.items()):
+            if name is None or skill_name == name:
+                cache.clear()
+    
     def unregister(self, name: str):
         """Unregister a skill handler"""
         if name in self._handlers:
@@ -169,6 +1004,11 @@ class Dispatcher:
                 self._category_handlers[skill.category].remove(name)
             
             del self._handlers[name]
+            self._breakers.pop(name, None)
+            self._skill_stats.pop(name, None)
+            self._result_caches.pop(name, None)
+            self._limiters.pop(name, None)
+            self._rebuild_routes(skill.category)
             logger.info(f"Unregistered skill: {name}")
 
 
@@ -180,11 +1020,44 @@ def get_dispatcher() -> Dispatcher:
     """Get or create global dispatcher instance"""
     global _dispatcher_instance
     if _dispatcher_instance is None:
-        _dispatcher_instance = Dispatcher()
+        from config import (
+            DISPATCH_WORKERS, DISPATCH_EXPRESS_WORKERS, DISPATCH_BULK_WORKERS,
+            DISPATCH_PROCESS_WORKERS,
+            DISPATCH_BREAKER_FAILURES, DISPATCH_BREAKER_RESET,
+            SKILL_RESULT_CACHE_SIZE, SKILL_QUEUE_SIZE, SKILL_QUEUE_WAIT,
+            DISPATCH_MIDDLEWARE
+        )
+        _dispatcher_instance = Dispatcher(
+            max_workers=DISPATCH_WORKERS,
+            express_workers=DISPATCH_EXPRESS_WORKERS,
+            bulk_workers=DISPATCH_BULK_WORKERS,
+            process_workers=DISPATCH_PROCESS_WORKERS,
+            breaker_failures=DISPATCH_BREAKER_FAILURES,
+            breaker_reset=DISPATCH_BREAKER_RESET,
+            result_cache_size=SKILL_RESULT_CACHE_SIZE,
+            queue_size=SKILL_QUEUE_SIZE,
+            queue_wait=SKILL_QUEUE_WAIT
+        )
+        for name in DISPATCH_MIDDLEWARE:
+            if name in MIDDLEWARE:
+                _dispatcher_instance.add_middleware(MIDDLEWARE[name]())
+            else:
+                logger.warning(f"Unknown dispatch middleware: {name}")
     return _dispatcher_instance
 
 
-def skill(category: IntentCategory, actions: List[str], description: str = ""):
+def skill(
+    category: IntentCategory,
+    actions: List[str],
+    description: str = "",
+    cpu_bound: bool = False,
+    timeout: Optional[float] = None,
+    cache_ttl: Optional[float] = None,
+    cache_key: Optional[Callable[[Dict[str, Any]], Optional[Hashable]]] = None,
+    lane: str = LANE_NORMAL,
+    max_concurrency: Optional[int] = None,
+    max_queue: Optional[int] = None
+):
     """
     Decorator for registering skill handlers
     
@@ -192,5 +1065,64 @@ def skill(category: IntentCategory, actions: List[str], description: str = ""):
         @skill(IntentCategory.SYSTEM, ["shutdown", "restart"])
         def handle_power(intent):
             ...
+    
+    CPU-bound handlers (cpu_bound=True) run in a separate process so they
+    do not hold the GIL against the voice loop and web requests. A
+    timeout (seconds) bounds how long a dispatch waits for the handler.
+    
+    Handlers whose result only changes slowly can declare cache_ttl
+    (seconds): repeat calls with the same action and entities within
+    that window are answered from a bounded cache. cache_key narrows or
+    widens what counts as "the same" - e.g. lambda entities:
+    entities.get("query") - and may return None to skip the cache.
+    
+    lane picks the worker pool of asynchronous dispatches: "express" for
+    commands that must never wait (stop, volume), "bulk" for slow ones
+    (AI replies, scans) whose concurrency is capped, else "normal".
+    
+    max_concurrency caps how many calls of this one skill run at once;
+    up to max_queue more wait briefly for a slot, and calls beyond that
+    get a fast {"error": "busy"} result.
+    """
+    return get_dispatcher().register_decorator(
+        category, actions, description, cpu_bound, timeout, cache_ttl, cache_key, lane,
+        max_concurrency, max_queue
+    )
+
+
+def load_skills(modules: Optional[List[str]] = None, lazy: Optional[bool] = None):
+    """
+    Register the skill modules with the global dispatcher
+    
+    Lazily (the default) the skills are registered from a manifest parsed
+    from the modules' source and cached on disk, and each module is only
+    imported on its first dispatch - startup skips importing skills (and
+    their dependencies) that a session never uses.
+    
+    Args:
+        modules: Dotted module names (default SKILL_MODULES)
+        lazy: Route from the manifest (default SKILL_LAZY_LOADING);
+            False imports every module now
     """
-    return get_dispatcher().register_decorator(category, actions, description)
+    from config import SKILL_MODULES, SKILL_LAZY_LOADING, SKILL_MANIFEST_CACHE_DIR
+    from .manifest import load_manifest
+    
+    modules = list(SKILL_MODULES if modules is None else modules)
+    lazy = SKILL_LAZY_LOADING if lazy is None else lazy
+    dispatcher = get_dispatcher()
+    start = time.perf_counter()
+    
+    if lazy:
+        manifest = load_manifest(modules, SKILL_MANIFEST_CACHE_DIR)
+        dispatcher.register_manifest(manifest)
+        imported = manifest["eager"]
+    else:
+        imported = modules
+    
+    for module in imported:
+        importlib.import_module(module)
+    
+    logger.info(
+        f"Skills ready in {(time.perf_counter() - start) * 1000:.1f} ms "
+        f"({len(dispatcher._handlers)} skills, {len(imported)}/{len(modules)} modules imported)"
+    )
@@ -8,13 +8,14 @@ import threading
 import signal
 import sys
 import logging
-from typing import Optional, Callable
+from concurrent.futures import Future
+from typing import Optional, Callable, List
 from enum import Enum, auto
 from datetime import datetime
 import random
 
 from .brain import Brain, get_brain, Intent, IntentCategory
-from .dispatcher import Dispatcher, get_dispatcher
+from .dispatcher import Dispatcher, get_dispatcher, load_skills
 from .memory import Memory, get_memory
 
 logger = logging.getLogger(__name__)
@@ -43,6 +44,9 @@ class Engine:
     - Graceful lifecycle
     """
     
+    # Dialogue session of the local voice/text user (follow-up resolution)
+    SESSION_ID = "local"
+    
     def __init__(self):
         self._state = EngineState.STOPPED
         self._running = False
@@ -60,9 +64,15 @@ class Engine:
         self._on_command: Optional[Callable] = None
         self._on_response: Optional[Callable] = None
         
+        # Last command the brain learned (dropped if cancelled right away)
+        self._last_learned: Optional[str] = None
+        
+        # Commands dispatched and not yet answered
+        self._in_flight = 0
+        
         # Thread safety
         self._lock = threading.Lock()
-        
+    
     @property
     def state(self) -> EngineState:
         return self._state
@@ -82,6 +92,12 @@ class Engine:
             self._dispatcher = get_dispatcher()
             self._memory = get_memory()
             
+            # Seed learned utterances from past conversations
+            from config import INTENT_LEARNED_HISTORY
+            self._brain.learn_from_history(
+                self._memory.get_recent_conversations(INTENT_LEARNED_HISTORY)
+            )
+            
             # Initialize audio
             from audio import get_tts, get_stt
             self._tts = get_tts()
@@ -104,7 +120,7 @@ class Engine:
             
             logger.info("JARVIS Engine initialized successfully")
             return True
-            
+        
         except Exception as e:
             logger.error(f"Engine initialization failed: {e}")
             self._state = EngineState.STOPPED
@@ -112,9 +128,8 @@ class Engine:
     
     def _register_skills(self):
         """Register all skill modules"""
-        # Import skill modules to trigger registration
         try:
-            from skills import system, apps, time_date, web, conversation
+            load_skills()
             logger.info("Skills registered successfully")
         except Exception as e:
             logger.error(f"Failed to register skills: {e}")
@@ -210,7 +225,7 @@ class Engine:
                         self._handle_command(data)
                 
                 time.sleep(0.1)
-                
+            
             except KeyboardInterrupt:
                 logger.info("Keyboard interrupt received")
                 break
@@ -240,63 +255,170 @@ class Engine:
         if self._on_wake:
             self._on_wake()
     
+    def _set_state(self, state: EngineState):
+        """Change state, unless the engine is shutting down"""
+        with self._lock:
+            if self._state not in (EngineState.STOPPING, EngineState.STOPPED):
+                self._state = state
+    
+    def _command_done(self):
+        """Account for an answered command; back to listening once none is left"""
+        with self._lock:
+            self._in_flight -= 1
+            if self._state not in (EngineState.STOPPING, EngineState.STOPPED):
+                self._state = EngineState.PROCESSING if self._in_flight else EngineState.LISTENING
+    
     def _handle_command(self, command: str):
-        """Handle recognized command"""
-        self._state = EngineState.PROCESSING
+        """
+        Handle recognized command
+        
+        The state stays PROCESSING until the command's skills finish, is
+        SPEAKING while the answer is spoken and returns to LISTENING once
+        no command is left in flight.
+        """
+        with self._lock:
+            self._in_flight += 1
+        self._set_state(EngineState.PROCESSING)
+        dispatched = False
         
         try:
             # Store in conversation history
             self._memory.add_conversation("user", command)
             
-            # Classify intent
-            intent = self._brain.classify_intent(command)
-            logger.info(f"Intent: {intent.category.name}.{intent.action} ({intent.confidence:.1f}%)")
+            # Classify intents (compound commands yield several)
+            intents = self._brain.classify_compound(command, self.SESSION_ID)
+            for intent in intents:
+                logger.info(f"Intent: {intent.category.name}.{intent.action} ({intent.confidence:.1f}%)")
             
-            # Check for stop/cancel
-            if intent.action == "stop":
+            # Check for stop/cancel (also a correction of the previous command)
+            last_learned, self._last_learned = self._last_learned, None
+            if any(intent.action == "stop" for intent in intents):
+                if last_learned:
+                    self._brain.unlearn(last_learned)
                 self._tts.clear_queue()
-                self._tts.speak("Okay.")
-                self._state = EngineState.LISTENING
-                return
-            
-            # Dispatch to handler
-            result = self._dispatcher.dispatch(intent)
-            
-            # Generate and speak response
-            self._state = EngineState.SPEAKING
-            
-            if result.get("success"):
-                handler_result = result.get("result", {})
-                
-                # Check if handler provided a response
-                if isinstance(handler_result, dict) and handler_result.get("response"):
-                    response = handler_result["response"]
-                elif isinstance(handler_result, str):
-                    response = handler_result
-                else:
-                    response = self._brain.generate_response(intent, result)
-                
-                self._tts.speak(response)
-                self._memory.add_conversation("assistant", response, intent.action)
-            else:
-                # Error or no handler
-                if intent.category == IntentCategory.UNKNOWN:
-                    from config import RESPONSES, USER_NAME
-                    response = random.choice(RESPONSES["not_understood"]).replace("{user}", USER_NAME)
-                else:
-                    response = self._brain.generate_response(intent, result)
-                
-                self._tts.speak(response)
+                intents = [intent for intent in intents if intent.action != "stop"]
+                if not intents:
+                    self._tts.speak("Okay.")
+                    return
             
-            if self._on_response:
-                self._on_response(response)
-                
+            # Dispatch on the worker pool, independent commands concurrently;
+            # the main loop goes back to listening while skills run
+            futures = self._dispatcher.dispatch_many_async(intents)
+            self._await_results(command, intents, futures)
+            dispatched = True
+        
         except Exception as e:
             logger.error(f"Command handling error: {e}")
             self._tts.speak("I encountered an error processing that request.")
         
         finally:
-            self._state = EngineState.LISTENING
+            # A dispatched command is accounted for once it has been answered
+            if not dispatched:
+                self._command_done()
+    
+    def _await_results(self, command: str, intents: List[Intent], futures: List[Future]):
+        """
+        Finish a command once all its skills are done, without blocking
+        
+        Commands still running after COMMAND_ACK_DELAY seconds are
+        acknowledged ("One moment...") so the user knows they were heard.
+        The answer is spoken on its own thread, not on the worker that ran
+        the last skill, so speech never holds up a dispatch lane.
+        """
+        from config import COMMAND_ACK_DELAY, RESPONSES, USER_NAME
+        
+        lock = threading.Lock()
+        pending = [len(futures)]
+        
+        def acknowledge():
+            with lock:
+                if pending[0]:
+                    self._tts.speak(random.choice(RESPONSES["thinking"]).replace("{user}", USER_NAME))
+        
+        ack_timer = threading.Timer(COMMAND_ACK_DELAY, acknowledge)
+        ack_timer.daemon = True
+        
+        def respond():
+            try:
+                self._finish_command(command, intents, [future.result() for future in futures])
+            except Exception as e:
+                logger.error(f"Command handling error: {e}")
+                self._tts.speak("I encountered an error processing that request.")
+            finally:
+                self._command_done()
+        
+        def on_done(_future: Future):
+            with lock:
+                pending[0] -= 1
+                if pending[0]:
+                    return
+            ack_timer.cancel()
+            threading.Thread(target=respond, name="command-response", daemon=True).start()
+        
+        ack_timer.start()
+        for future in futures:
+            future.add_done_callback(on_done)
+    
+    def _finish_command(self, command: str, intents: List[Intent], results: List[dict]):
+        """Log and learn from the results of a dispatched command, then speak them"""
+        # A runner-up intent may have been dispatched instead
+        intents = [result.get("intent", intent) for intent, result in zip(intents, results)]
+        response = " ".join(
+            self._build_response(intent, result)
+            for intent, result in zip(intents, results)
+        )
+        
+        intent_key = self._brain.intent_key(intents[0]) if len(intents) == 1 else None
+        succeeded = intent_key is not None and self._succeeded(results[0])
+        if any(result.get("success") for result in results):
+            # The logged intent is relearned at startup: only log it for a
+            # command that worked
+            self._memory.add_conversation("assistant", response, intent_key if succeeded else None)
+        
+        # Learn single commands that worked, forget ones that failed
+        if succeeded:
+            self._brain.learn(command, intent_key)
+            self._last_learned = command
+        elif len(intents) == 1:
+            self._brain.unlearn(command)
+        
+        if self._on_response:
+            self._on_response(response)
+        
+        # Spoken last, so a "stop" during the answer can already unlearn it
+        self._set_state(EngineState.SPEAKING)
+        self._tts.speak(response, block=True)
+    
+    @staticmethod
+    def _succeeded(result: dict) -> bool:
+        """Whether a dispatch ran and the skill did not report a failure"""
+        if not result.get("success"):
+            return False
+        # Skills report failure as {"error": ...} (app_not_running, ...),
+        # the same check the dispatcher's result cache uses
+        handler_result = result.get("result")
+        return not (
+            isinstance(handler_result, dict)
+            and ("error" in handler_result or handler_result.get("success") is False)
+        )
+    
+    def _build_response(self, intent: Intent, result: dict) -> str:
+        """Turn a dispatch result into the sentence to speak"""
+        if result.get("success"):
+            handler_result = result.get("result", {})
+            
+            # Check if handler provided a response
+            if isinstance(handler_result, dict) and handler_result.get("response"):
+                return handler_result["response"]
+            elif isinstance(handler_result, str):
+                return handler_result
+            return self._brain.generate_response(intent, result)
+        
+        # Error or no handler
+        if intent.category == IntentCategory.UNKNOWN:
+            from config import RESPONSES, USER_NAME
+            return random.choice(RESPONSES["not_understood"]).replace("{user}", USER_NAME)
+        return self._brain.generate_response(intent, result)
     
     def process_text_command(self, command: str):
         """Process a text command (for testing without voice)"""
@@ -311,7 +433,7 @@ class Engine:
         """Gracefully shutdown the engine"""
         if self._state == EngineState.STOPPING:
             return
-            
+        
         self._state = EngineState.STOPPING
         self._running = False
         
@@ -328,6 +450,10 @@ class Engine:
             self._tts.shutdown()
         if self._memory:
             self._memory.shutdown()
+        if self._dispatcher:
+            self._dispatcher.shutdown()
+        if self._brain:
+            self._brain.stop_pattern_watcher()
         
         self._state = EngineState.STOPPED
         logger.info("JARVIS shutdown complete")
@@ -352,7 +478,7 @@ class Engine:
                     break
                 
                 self._handle_command(command)
-                
+            
             except KeyboardInterrupt:
                 break
             except EOFError:
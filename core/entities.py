@@ -0,0 +1,176 @@
+"""
+JARVIS Entity Extraction
+Declarative per-intent slot grammar compiled into regexes
+"""
+
+import re
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SLOT GRAMMAR
+# ══════════════════════════════════════════════════════════════════════════════
+
+# intent key -> slot name -> slot spec
+#   triggers: phrases the slot value follows, in priority order (the first
+#             trigger present in the text wins, at its first occurrence)
+#   strip:    regexes removed from the extracted value
+#   type:     "text" (default) or "number" (digits or spoken numbers)
+SLOT_GRAMMAR: Dict[str, Dict[str, Dict[str, Any]]] = {
+    "app.open": {
+        "app_name": {
+            "triggers": ["open", "launch", "start", "run"],
+            "strip": [r"\s+(please|now|for me)$"],
+        },
+    },
+    "app.close": {
+        "app_name": {"triggers": ["close", "quit", "exit", "kill"]},
+    },
+    "web.search": {
+        "query": {"triggers": ["search for", "search", "google", "look up", "find"]},
+    },
+    "web.youtube": {
+        "query": {
+            "triggers": ["play", "youtube", "watch"],
+            "strip": [r"^(on youtube|video)\s*"],
+        },
+    },
+    "web.weather": {
+        "location": {"triggers": ["weather in", "weather for", "weather at"]},
+    },
+    "volume.set": {
+        "level": {"type": "number"},
+    },
+    "memory.remember": {
+        "content": {"triggers": ["remember that", "remember", "note that", "save"]},
+    },
+    "memory.recall": {
+        "query": {"triggers": ["about", "remember", "recall"]},
+    },
+}
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SPOKEN NUMBERS
+# ══════════════════════════════════════════════════════════════════════════════
+
+_UNITS = {
+    "zero": 0, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+    "eleven": 11, "twelve": 12, "thirteen": 13, "fourteen": 14,
+    "fifteen": 15, "sixteen": 16, "seventeen": 17, "eighteen": 18,
+    "nineteen": 19,
+}
+
+_TENS = {
+    "twenty": 20, "thirty": 30, "forty": 40, "fifty": 50,
+    "sixty": 60, "seventy": 70, "eighty": 80, "ninety": 90,
+}
+
+_NUMBER_WORD = "|".join(sorted(list(_UNITS) + list(_TENS) + ["hundred"], key=len, reverse=True))
+
+# Digits take priority over number words anywhere in the text
+_NUMBER_RE = re.compile(
+    r"^(?:.*?(?P<digits>\d+)"
+    r"|.*?\b(?P<words>(?:%s)(?:[\s-]+(?:and[\s-]+)?(?:%s))*)\b)" % (_NUMBER_WORD, _NUMBER_WORD),
+    re.DOTALL
+)
+
+
+def words_to_number(words: str) -> int:
+    """Convert spoken number words ("twenty five", "one hundred") to an int"""
+    value = 0
+    for word in re.split(r"[\s-]+", words):
+        if word in _UNITS:
+            value += _UNITS[word]
+        elif word in _TENS:
+            value += _TENS[word]
+        elif word == "hundred" and value < 10:
+            value = (value or 1) * 100
+    return value
+
+
+def parse_number(text: str) -> Optional[int]:
+    """Find the first number in text, written as digits or spoken words"""
+    match = _NUMBER_RE.match(text)
+    if not match:
+        return None
+    if match.group("digits") is not None:
+        return int(match.group("digits"))
+    return words_to_number(match.group("words"))
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# COMPILATION
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _compile_triggers(triggers: List[str]) -> Pattern:
+    """
+    Compile triggers into one regex with one alternative per trigger
+    
+    Alternatives are tried in order and each scans the whole text, so the
+    first trigger present wins at its first occurrence; the value is
+    whatever follows it.
+    """
+    branches = [
+        rf".*?{re.escape(trigger)}(?P<v{idx}>.*)"
+        for idx, trigger in enumerate(triggers)
+    ]
+    return re.compile(r"^(?:" + "|".join(branches) + r")$", re.DOTALL)
+
+
+def _compile_slot(spec: Dict[str, Any]) -> Callable[[str], Optional[Any]]:
+    """Compile a slot spec into an extractor function"""
+    if spec.get("type") == "number":
+        return parse_number
+    
+    pattern = _compile_triggers(spec["triggers"])
+    strips = [re.compile(regex) for regex in spec.get("strip", [])]
+    
+    def extract(text: str) -> Optional[str]:
+        match = pattern.match(text)
+        if not match:
+            return None
+        value = match.group(match.lastgroup).strip()
+        for strip in strips:
+            value = strip.sub("", value)
+        return value
+    
+    return extract
+
+
+_COMPILED: Dict[str, List[Tuple[str, Callable[[str], Optional[Any]]]]] = {
+    intent_key: [(slot, _compile_slot(spec)) for slot, spec in slots.items()]
+    for intent_key, slots in SLOT_GRAMMAR.items()
+}
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# PUBLIC API
+# ══════════════════════════════════════════════════════════════════════════════
+
+def extract_entities(intent_key: str, text: str) -> Dict[str, Any]:
+    """
+    Extract all slots defined for an intent
+    
+    Args:
+        intent_key: "category.action" key, e.g. "web.search"
+        text: Lowercased user input
+    
+    Returns:
+        Slot name -> value for every slot found
+    """
+    entities = {}
+    for slot, extract in _COMPILED.get(intent_key, ()):
+        value = extract(text)
+        if value is not None:
+            entities[slot] = value
+    return entities
+
+
+def extract_slot(intent_key: str, slot: str, text: str) -> Optional[Any]:
+    """Extract a single slot (None if the intent/slot is unknown or absent)"""
+    for name, extract in _COMPILED.get(intent_key, ()):
+        if name == slot:
+            return extract(text)
+    return None
@@ -0,0 +1,91 @@
+"""
+JARVIS Dispatch Lanes
+Separate worker pools so urgent commands never queue behind slow ones
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+import threading
+import time
+
+from .metrics import LatencyHistogram
+
+
+# Lanes, most urgent first
+LANE_EXPRESS = "express"  # stop, volume, power: must answer at once
+LANE_NORMAL = "normal"
+LANE_BULK = "bulk"        # AI replies, process scans: slow and deferrable
+LANES = (LANE_EXPRESS, LANE_NORMAL, LANE_BULK)
+
+
+class Lane:
+    """
+    Worker pool for one priority lane
+    
+    Work beyond max_workers queues inside the lane only, so a burst of
+    bulk work cannot hold up the express lane. Tracks how many calls are
+    queued and running, and how long calls waited for a worker.
+    """
+    
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self._max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix=f"dispatch-{name}"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._wait = LatencyHistogram()
+    
+    def submit(self, fn: Callable, *args: Any) -> Future:
+        """Run fn(*args) on a lane worker"""
+        submitted = time.perf_counter()
+        with self._lock:
+            self._queued += 1
+        
+        def run():
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self._wait.record((time.perf_counter() - submitted) * 1000)
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+        
+        def forget_cancelled(future: Future):
+            if future.cancelled():
+                with self._lock:
+                    self._queued -= 1
+        
+        future = self._executor.submit(run)
+        future.add_done_callback(forget_cancelled)
+        return future
+    
+    def shutdown(self, wait: bool = True):
+        """Stop the lane's workers"""
+        self._executor.shutdown(wait=wait)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get lane statistics
+        
+        Returns:
+            Dict with workers, queued, running, completed, and the wait
+            for a worker (wait_avg_ms, wait_p95_ms, wait_max_ms)
+        """
+        with self._lock:
+            return {
+                "workers": self._max_workers,
+                "queued": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "wait_avg_ms": self._wait.mean,
+                "wait_p95_ms": self._wait.percentile(95),
+                "wait_max_ms": self._wait.max,
+            }
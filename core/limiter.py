@@ -0,0 +1,171 @@
+"""
+JARVIS Concurrency Limiter
+Caps how many calls of one skill run at once, with a bounded wait queue
+"""
+
+from typing import Any, Dict, Optional
+import threading
+import time
+
+
+class Slot:
+    """
+    One admitted call's hold on a limiter slot
+    
+    Admitted either holding a slot or with a place in the queue (wait()
+    then takes the slot). Released once however often release() is
+    called, so whichever thread sees the handler finish can release it.
+    
+    claimed is set by the call that runs with the slot; a slot nobody
+    claimed (a call that never got to run) is released by whoever
+    admitted it.
+    """
+    
+    __slots__ = ("_limiter", "_deadline", "queued", "held", "released", "overdue", "claimed")
+    
+    def __init__(self, limiter: "ConcurrencyLimiter", deadline: float):
+        self._limiter = limiter
+        self._deadline = deadline
+        self.queued = False
+        self.held = False
+        self.released = False
+        self.overdue = False
+        self.claimed = False
+    
+    def wait(self) -> bool:
+        """Take the slot, waiting if queued; False if the wait timed out"""
+        return self._limiter._wait(self)
+    
+    def release(self):
+        """Give the slot (or the place in the queue) back"""
+        self._limiter._release(self)
+    
+    def mark_overdue(self):
+        """The call timed out but its handler still holds the slot"""
+        self._limiter._mark_overdue(self)
+
+
+class ConcurrencyLimiter:
+    """
+    Per-skill concurrency limit
+    
+    At most max_concurrency calls hold a slot. Up to max_queue more wait
+    for one, each for at most wait_timeout seconds from admission; any
+    further caller - or a waiter whose time runs out - is turned away at
+    once, so a burst of requests is shed instead of piling up threads.
+    
+    Admission never blocks, so it can happen before a call is queued on a
+    worker pool; the wait for a slot happens once a worker runs the call.
+    
+    Slots whose call timed out but whose handler has not returned yet are
+    counted as overdue: a skill turned away while it has overdue slots is
+    stuck rather than merely busy.
+    """
+    
+    def __init__(self, max_concurrency: int, max_queue: int = 4, wait_timeout: float = 5.0):
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self.wait_timeout = wait_timeout
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._lock = threading.Lock()
+        
+        self._running = 0
+        self._waiting = 0
+        self._overdue = 0
+        
+        # Lifetime counters for monitoring
+        self._admitted = 0
+        self._queued = 0
+        self._rejected = 0
+        self._peak_waiting = 0
+    
+    @property
+    def overdue(self) -> int:
+        """Slots held by calls that already timed out"""
+        return self._overdue
+    
+    def admit(self) -> Optional[Slot]:
+        """Take a free slot or a place in the queue, without waiting; None if full"""
+        slot = Slot(self, time.monotonic() + self.wait_timeout)
+        if self._slots.acquire(blocking=False):
+            with self._lock:
+                self._running += 1
+                self._admitted += 1
+            slot.held = True
+            return slot
+        
+        with self._lock:
+            if self._waiting >= self.max_queue:
+                self._rejected += 1
+                return None
+            self._waiting += 1
+            self._queued += 1
+            self._peak_waiting = max(self._peak_waiting, self._waiting)
+        slot.queued = True
+        return slot
+    
+    def acquire(self) -> Optional[Slot]:
+        """Take a slot, waiting in the queue if needed; None if turned away"""
+        slot = self.admit()
+        if slot is None or not slot.wait():
+            return None
+        return slot
+    
+    def _wait(self, slot: Slot) -> bool:
+        if not slot.queued:
+            return slot.held
+        
+        acquired = self._slots.acquire(timeout=max(slot._deadline - time.monotonic(), 0.0))
+        with self._lock:
+            if slot.queued:
+                slot.queued = False
+                self._waiting -= 1
+                if acquired:
+                    slot.held = True
+                    self._running += 1
+                    self._admitted += 1
+                else:
+                    self._rejected += 1
+                return acquired
+        
+        # Released while waiting: hand the slot straight back
+        if acquired:
+            self._slots.release()
+        return False
+    
+    def _release(self, slot: Slot):
+        with self._lock:
+            if slot.released:
+                return
+            slot.released = True
+            if slot.queued:
+                slot.queued = False
+                self._waiting -= 1
+                return
+            if not slot.held:
+                return
+            self._running -= 1
+            if slot.overdue:
+                self._overdue -= 1
+        self._slots.release()
+    
+    def _mark_overdue(self, slot: Slot):
+        with self._lock:
+            if slot.held and not slot.released and not slot.overdue:
+                slot.overdue = True
+                self._overdue += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limits, current occupancy and counters"""
+        with self._lock:
+            return {
+                "max_concurrency": self.max_concurrency,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "waiting": self._waiting,
+                "overdue": self._overdue,
+                "admitted": self._admitted,
+                "queued": self._queued,
+                "rejected": self._rejected,
+                "peak_waiting": self._peak_waiting,
+            }
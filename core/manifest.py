@@ -0,0 +1,210 @@
+"""
+JARVIS Skill Manifest
+Static description of skill modules, so skills can be routed before import
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+import ast
+import hashlib
+import importlib.util
+import logging
+
+from .cache import PickleCache
+
+logger = logging.getLogger(__name__)
+
+
+# Bump when the manifest layout or the parsing rules change
+MANIFEST_VERSION = 5
+
+# skill() parameters, in positional order
+SKILL_PARAMS = [
+    "category", "actions", "description", "cpu_bound", "timeout", "cache_ttl", "cache_key", "lane",
+    "max_concurrency", "max_queue",
+]
+
+SKILL_DEFAULTS = {
+    "description": "", "cpu_bound": False, "timeout": None, "cache_ttl": None, "lane": "normal",
+    "max_concurrency": None, "max_queue": None,
+}
+
+# set_fallback() keyword arguments recorded in the manifest
+FALLBACK_OPTIONS = frozenset(["timeout", "max_concurrency", "max_queue"])
+
+# skill() parameters only used once the module is imported (not recorded)
+RUNTIME_PARAMS = frozenset(["cache_key"])
+
+# Top-level statements that only define things; anything else in a module
+# (a bare call, an if, a loop) may have side effects, so the module is
+# imported at startup instead of on first dispatch
+STATIC_STATEMENTS = (
+    ast.Import, ast.ImportFrom, ast.Assign, ast.AnnAssign,
+    ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef,
+)
+
+
+class ManifestError(Exception):
+    """A module cannot be described without importing it"""
+
+
+def _module_source(module: str) -> Path:
+    """Path of a module's source file (without importing it)"""
+    spec = importlib.util.find_spec(module)
+    if spec is None or not spec.origin or not spec.origin.endswith(".py"):
+        raise ManifestError(f"no source file for {module}")
+    return Path(spec.origin)
+
+
+def _skill_entry(decorator: ast.Call, name: str, module: str) -> Dict[str, Any]:
+    """Manifest entry for one @skill(...) decorator"""
+    if len(decorator.args) > len(SKILL_PARAMS):
+        raise ManifestError(f"{module}.{name}: too many @skill arguments")
+    
+    nodes = dict(zip(SKILL_PARAMS, decorator.args))
+    for keyword in decorator.keywords:
+        if keyword.arg not in SKILL_PARAMS:
+            raise ManifestError(f"{module}.{name}: unsupported @skill argument")
+        nodes[keyword.arg] = keyword.value
+    
+    category = nodes.get("category")
+    if not isinstance(category, ast.Attribute) or "actions" not in nodes:
+        raise ManifestError(f"{module}.{name}: category must be IntentCategory.<NAME>")
+    
+    entry = dict(SKILL_DEFAULTS, name=name, module=module, category=category.attr)
+    for param, node in nodes.items():
+        if param == "category" or param in RUNTIME_PARAMS:
+            continue
+        try:
+            entry[param] = ast.literal_eval(node)
+        except ValueError:
+            raise ManifestError(f"{module}.{name}: @skill {param} is not a literal")
+    entry["actions"] = list(entry["actions"])
+    return entry
+
+
+def _fallback_call(statement: ast.stmt) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    (handler name, keyword arguments) if statement is
+    get_dispatcher().set_fallback(<name>[, <option>=<literal>, ...])
+    """
+    if not isinstance(statement, ast.Expr) or not isinstance(statement.value, ast.Call):
+        return None
+    call = statement.value
+    func = call.func
+    if not (
+        isinstance(func, ast.Attribute) and func.attr == "set_fallback"
+        and isinstance(func.value, ast.Call)
+        and isinstance(func.value.func, ast.Name) and func.value.func.id == "get_dispatcher"
+        and len(call.args) == 1 and isinstance(call.args[0], ast.Name)
+    ):
+        return None
+    
+    options = {}
+    for keyword in call.keywords:
+        if keyword.arg not in FALLBACK_OPTIONS:
+            return None
+        try:
+            options[keyword.arg] = ast.literal_eval(keyword.value)
+        except ValueError:
+            return None
+    return call.args[0].id, options
+
+
+def describe_module(module: str, source: str) -> Dict[str, Any]:
+    """
+    Describe one skill module from its source
+    
+    Returns:
+        Dict with "skills" (one entry per @skill function) and "fallback"
+        ((handler name, keyword arguments) passed to set_fallback, or None)
+    
+    Raises:
+        ManifestError: The module does something at import time besides
+            defining skills, or uses non-literal @skill arguments
+    """
+    tree = ast.parse(source)
+    skills: List[Dict[str, Any]] = []
+    fallback = None
+    
+    for position, statement in enumerate(tree.body):
+        if position == 0 and isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Constant):
+            continue  # docstring
+        
+        call = _fallback_call(statement)
+        if call is not None:
+            fallback = call
+            continue
+        
+        if not isinstance(statement, STATIC_STATEMENTS):
+            raise ManifestError(f"{module}: import-time statement on line {statement.lineno}")
+        
+        if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            for decorator in statement.decorator_list:
+                if (
+                    isinstance(decorator, ast.Call)
+                    and isinstance(decorator.func, ast.Name) and decorator.func.id == "skill"
+                ):
+                    skills.append(_skill_entry(decorator, statement.name, module))
+    
+    return {"skills": skills, "fallback": fallback}
+
+
+def build_manifest(modules: List[str]) -> Dict[str, Any]:
+    """
+    Build the manifest of a list of skill modules by parsing their source
+    
+    Returns:
+        Dict with "skills" (entries with name, module, category name,
+        actions, description, cpu_bound, timeout, cache_ttl, lane,
+        max_concurrency and max_queue), "fallback" ((module, handler
+        name, set_fallback keyword arguments) or None) and "eager" (modules that could
+        not be described statically and must be imported)
+    """
+    manifest: Dict[str, Any] = {"skills": [], "fallback": None, "eager": []}
+    
+    for module in modules:
+        try:
+            described = describe_module(module, _module_source(module).read_text(encoding="utf-8"))
+        except (ManifestError, SyntaxError, OSError, ImportError) as e:
+            logger.info(f"Skill module {module} will be imported at startup: {e}")
+            manifest["eager"].append(module)
+            continue
+        
+        manifest["skills"].extend(described["skills"])
+        if described["fallback"] is not None:
+            manifest["fallback"] = (module,) + described["fallback"]
+    
+    return manifest
+
+
+def manifest_key(modules: List[str]) -> str:
+    """Hash of the manifest version and every module's source"""
+    digest = hashlib.sha256(str(MANIFEST_VERSION).encode())
+    for module in modules:
+        digest.update(module.encode())
+        try:
+            digest.update(_module_source(module).read_bytes())
+        except (ManifestError, OSError, ImportError):
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def load_manifest(modules: List[str], cache_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Manifest of the given modules, from the disk cache when no source changed
+    
+    Args:
+        modules: Dotted names of the skill modules
+        cache_dir: Directory for the cached manifest (None = no caching)
+    """
+    if cache_dir is None:
+        return build_manifest(modules)
+    
+    cache = PickleCache(cache_dir)
+    key = manifest_key(modules)
+    manifest = cache.load("skill_manifest", key)
+    if manifest is None:
+        manifest = build_manifest(modules)
+        cache.store("skill_manifest", key, manifest)
+    return manifest
@@ -0,0 +1,302 @@
+"""
+JARVIS Intent Matcher
+Precompiled pattern indexes for fast intent classification
+"""
+
+from collections import deque
+from typing import Dict, List, Tuple, FrozenSet, Optional, Set
+import logging
+
+from .phonetic import PhoneticIndex
+from .tfidf import TfidfIntentClassifier
+
+logger = logging.getLogger(__name__)
+
+# Bump when the compiled layout or scoring changes, to invalidate
+# snapshots cached on disk
+MATCHER_VERSION = 2
+
+
+class PhraseAutomaton:
+    """
+    Aho-Corasick automaton over a fixed set of phrases
+    
+    Finds every phrase occurring as a substring of the input in a single
+    left-to-right scan, regardless of how many phrases are loaded.
+    """
+    
+    def __init__(self, phrases: List[str]):
+        self.phrases = phrases
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+        
+        # Trie of all phrases
+        for phrase_id, phrase in enumerate(phrases):
+            node = 0
+            for char in phrase:
+                nxt = self._goto[node].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                node = nxt
+            self._output[node] += (phrase_id,)
+        
+        # Breadth-first failure links, merging outputs along the way
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._output[child] += self._output[self._fail[child]]
+    
+    def scan(self, text: str) -> Set[int]:
+        """Return the ids of all phrases occurring in text"""
+        found: Set[int] = set()
+        self.advance(0, text, found)
+        return found
+    
+    def advance(self, node: int, text: str, found: Set[int]) -> int:
+        """
+        Continue a scan from a saved state
+        
+        Args:
+            node: State returned by a previous advance (0 to start)
+            text: Next chunk of input
+            found: Set that receives the ids of phrases ending in this chunk
+        
+        Returns:
+            State to resume from with the following chunk
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node]:
+                found.update(output[node])
+        
+        return node
+    
+    def __len__(self) -> int:
+        return len(self._goto)
+
+
+class PhraseHits:
+    """Phrase occurrences found by one automaton scan, grouped by source"""
+    
+    __slots__ = ("intents", "groups")
+    
+    def __init__(self):
+        self.intents: Set[int] = set()
+        self.groups: Dict[str, Set[int]] = {}
+    
+    def group(self, name: str) -> Set[int]:
+        """Indexes (into the group's phrase list) of hits for a phrase group"""
+        return self.groups.get(name, set())
+
+
+class IntentMatcher:
+    """
+    Compiled form of the intent pattern database
+    
+    Built once from the pattern dictionary so classification never
+    re-lowers or re-splits patterns. Holds:
+    - Intent keys in declaration order (ties resolve to the earliest)
+    - Pre-lowered, pre-split patterns per intent
+    - Token -> (intent, pattern) inverted index
+    - Aho-Corasick automaton over every pattern plus extra phrase groups
+    - Phonetic indexes over pattern words and known names
+    - Optionally, a char n-gram TF-IDF model of the patterns
+    """
+    
+    def __init__(
+        self,
+        intent_patterns: Dict[str, List[str]],
+        phrase_groups: Optional[Dict[str, List[str]]] = None,
+        names: Optional[List[str]] = None,
+        tfidf: bool = False
+    ):
+        # Intents without patterns can never match, so they are left out
+        self.intent_keys: List[str] = [
+            key for key, patterns in intent_patterns.items() if patterns
+        ]
+        self.patterns: List[List[str]] = [
+            [pattern.lower() for pattern in intent_patterns[key]]
+            for key in self.intent_keys
+        ]
+        
+        # All patterns flattened into one choices list for single-call fuzzy
+        # scoring, with a side table mapping each choice back to its intent
+        self.choices: List[str] = [p for patterns in self.patterns for p in patterns]
+        self.choice_intents: List[int] = [
+            intent_idx
+            for intent_idx, patterns in enumerate(self.patterns)
+            for _ in patterns
+        ]
+        # Start of each intent's run of choices (for grouped reductions)
+        self.intent_offsets: List[int] = []
+        offset = 0
+        for patterns in self.patterns:
+            self.intent_offsets.append(offset)
+            offset += len(patterns)
+        
+        # Per intent: (pattern, pattern_words, pattern_word_set)
+        self._compiled: List[List[Tuple[str, Tuple[str, ...], FrozenSet[str]]]] = [
+            [(p, tuple(p.split()), frozenset(p.split())) for p in patterns]
+            for patterns in self.patterns
+        ]
+        
+        # Inverted index: token -> postings of (intent_idx, pattern_idx)
+        self._index: Dict[str, List[Tuple[int, int]]] = {}
+        for intent_idx, compiled in enumerate(self._compiled):
+            for pattern_idx, (_, _, word_set) in enumerate(compiled):
+                for word in word_set:
+                    self._index.setdefault(word, []).append((intent_idx, pattern_idx))
+        
+        # Single automaton over all phrases; each phrase maps back to every
+        # (source, index) it came from, since phrases repeat across sources
+        self.phrase_groups: Dict[str, List[str]] = {
+            name: [phrase.lower() for phrase in phrases]
+            for name, phrases in (phrase_groups or {}).items()
+        }
+        phrase_ids: Dict[str, int] = {}
+        self._phrase_sources: List[List[Tuple[Optional[str], int]]] = []
+        sources = [
+            (None, intent_idx, pattern)
+            for intent_idx, patterns in enumerate(self.patterns)
+            for pattern in patterns
+        ] + [
+            (name, idx, phrase)
+            for name, phrases in self.phrase_groups.items()
+            for idx, phrase in enumerate(phrases)
+        ]
+        for group, idx, phrase in sources:
+            if phrase not in phrase_ids:
+                phrase_ids[phrase] = len(self._phrase_sources)
+                self._phrase_sources.append([])
+            self._phrase_sources[phrase_ids[phrase]].append((group, idx))
+        self.automaton = PhraseAutomaton(list(phrase_ids))
+        
+        # O(1) table for utterances that are exactly a known pattern: the
+        # exact-tier outcome for each pattern, computed once up front, plus
+        # every intent it scored for (best first) for ranked output
+        self.exact_phrases: Dict[str, Tuple[str, float]] = {}
+        self.exact_ranked: Dict[str, List[Tuple[str, float]]] = {}
+        for patterns in self.patterns:
+            for pattern in patterns:
+                if pattern in self.exact_phrases:
+                    continue
+                words = pattern.split()
+                scores = self.score_exact(pattern, words, len(words) <= 2 and len(pattern) <= 10)
+                ranked = sorted(scores, key=lambda idx: (-scores[idx], idx))
+                self.exact_ranked[pattern] = [(self.intent_keys[idx], scores[idx]) for idx in ranked]
+                self.exact_phrases[pattern] = self.exact_ranked[pattern][0]
+        
+        # Sound-alike lookups: pattern words plus names for respelling
+        # misheard utterances, and names alone for cleaning up entities
+        names = list(names or [])
+        self.phonetic = PhoneticIndex(list(self._index) + names)
+        self.names = PhoneticIndex(names)
+        
+        # Optional TF-IDF model over the same patterns (tfidf engine)
+        self.tfidf: Optional[TfidfIntentClassifier] = (
+            TfidfIntentClassifier(self.intent_keys, self.patterns) if tfidf else None
+        )
+        
+        logger.debug(
+            f"Intent matcher compiled: {len(self.intent_keys)} intents, "
+            f"{sum(len(p) for p in self.patterns)} patterns, {len(self._index)} tokens, "
+            f"{len(self.automaton)} automaton states"
+        )
+    
+    def scan(self, text: str) -> PhraseHits:
+        """Find every pattern and group phrase occurring in text in one pass"""
+        return self.hits_for(self.automaton.scan(text))
+    
+    def hits_for(self, phrase_ids: Set[int]) -> PhraseHits:
+        """Group raw automaton phrase ids by source"""
+        hits = PhraseHits()
+        for phrase_id in phrase_ids:
+            for group, idx in self._phrase_sources[phrase_id]:
+                if group is None:
+                    hits.intents.add(idx)
+                else:
+                    hits.groups.setdefault(group, set()).add(idx)
+        return hits
+    
+    def candidates(self, text_words: List[str], found: Optional[Dict[int, Set[int]]] = None) -> Dict[int, Set[int]]:
+        """
+        Map each intent sharing a token with the input to its candidate pattern indexes
+        
+        Args:
+            text_words: Input tokens
+            found: Existing candidates to extend in place (incremental use)
+        """
+        if found is None:
+            found = {}
+        for word in set(text_words):
+            for intent_idx, pattern_idx in self._index.get(word, ()):
+                found.setdefault(intent_idx, set()).add(pattern_idx)
+        return found
+    
+    def score_exact(
+        self,
+        text: str,
+        text_words: List[str],
+        is_short: bool,
+        candidates: Optional[Dict[int, Set[int]]] = None
+    ) -> Dict[int, float]:
+        """
+        Score the exact-match tier for intents that share a token with the input
+        
+        Applies the same rules, in the same pattern order, as the original
+        per-intent loop: the first pattern that hits decides the intent score.
+        Candidates may be passed in when they are maintained incrementally.
+        
+        Returns:
+            Mapping of intent index to score (100/95/90) for intents with a hit
+        """
+        text_word_set = frozenset(text_words)
+        scores: Dict[int, float] = {}
+        
+        if candidates is None:
+            candidates = self.candidates(text_words)
+        
+        for intent_idx, pattern_idxs in candidates.items():
+            compiled = self._compiled[intent_idx]
+            for pattern_idx in sorted(pattern_idxs):
+                pattern, pattern_words, pattern_word_set = compiled[pattern_idx]
+                
+                # Exact match of entire pattern
+                if pattern == text:
+                    scores[intent_idx] = 100.0
+                    break
+                
+                # Exact word match (any word in text matches any word in pattern)
+                if not is_short:
+                    scores[intent_idx] = 90.0
+                    break
+                if text in pattern_word_set:
+                    scores[intent_idx] = 95.0
+                    break
+                
+                # All pattern words present in text (for longer patterns)
+                if len(pattern_words) > 1 and pattern_word_set <= text_word_set:
+                    scores[intent_idx] = 95.0
+                    break
+        
+        return scores
+    
+    def __len__(self) -> int:
+        return len(self.intent_keys)
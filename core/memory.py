@@ -220,7 +220,7 @@ class Memory:
                 cursor.execute("""
                     SELECT role, content, intent, timestamp 
                     FROM conversations 
-                    ORDER BY timestamp DESC 
+                    ORDER BY timestamp DESC, id DESC 
                     LIMIT ?
                 """, (limit,))
                 
@@ -0,0 +1,111 @@
+"""
+JARVIS Metrics
+Low-overhead call counters and latency histograms
+"""
+
+from bisect import bisect_left
+from typing import Any, Dict, List
+import threading
+
+
+def _bucket_bounds(low_ms: float, high_ms: float, growth: float) -> List[float]:
+    bounds = [low_ms]
+    while bounds[-1] < high_ms:
+        bounds.append(bounds[-1] * growth)
+    return bounds
+
+
+# Upper bounds (ms) of the histogram buckets: 0.05 ms to ~1 min, each
+# bucket 1.5x the previous, so percentiles are within 50% of the truth
+# while recording stays a binary search plus an increment
+LATENCY_BUCKETS_MS = _bucket_bounds(0.05, 60000.0, 1.5)
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram
+    
+    Memory is constant whatever the number of samples; percentiles are
+    reported as the upper bound of the bucket they fall in (capped at the
+    largest sample seen).
+    """
+    
+    def __init__(self, bounds: List[float] = LATENCY_BUCKETS_MS):
+        self._bounds = bounds
+        # One extra bucket for samples above the last bound
+        self._counts = [0] * (len(bounds) + 1)
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+    
+    def record(self, elapsed_ms: float):
+        """Add one sample (not thread-safe; callers hold their own lock)"""
+        self._counts[bisect_left(self._bounds, elapsed_ms)] += 1
+        self._count += 1
+        self._total += elapsed_ms
+        if elapsed_ms > self._max:
+            self._max = elapsed_ms
+    
+    def percentile(self, pct: float) -> float:
+        """Latency (ms) below which pct percent of samples fall"""
+        if not self._count:
+            return 0.0
+        rank = pct / 100.0 * self._count
+        seen = 0
+        for idx, count in enumerate(self._counts):
+            seen += count
+            if count and seen >= rank:
+                if idx == len(self._bounds):
+                    return self._max
+                return min(self._bounds[idx], self._max)
+        return self._max
+    
+    @property
+    def count(self) -> int:
+        return self._count
+    
+    @property
+    def mean(self) -> float:
+        return self._total / self._count if self._count else 0.0
+    
+    @property
+    def max(self) -> float:
+        return self._max
+
+
+class CallStats:
+    """Call and error counts plus a latency histogram for one operation"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._errors = 0
+        self._latency = LatencyHistogram()
+    
+    def record(self, elapsed_ms: float, error: bool = False):
+        """Record one completed call"""
+        with self._lock:
+            self._latency.record(elapsed_ms)
+            if error:
+                self._errors += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get counters and latency percentiles
+        
+        Returns:
+            Dict with calls, errors, error_rate, avg_ms, p50_ms, p95_ms,
+            p99_ms and max_ms
+        """
+        with self._lock:
+            latency = self._latency
+            calls = latency.count
+            return {
+                "calls": calls,
+                "errors": self._errors,
+                "error_rate": self._errors / calls if calls else 0.0,
+                "avg_ms": latency.mean,
+                "p50_ms": latency.percentile(50),
+                "p95_ms": latency.percentile(95),
+                "p99_ms": latency.percentile(99),
+                "max_ms": latency.max,
+            }
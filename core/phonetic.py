@@ -0,0 +1,286 @@
+"""
+JARVIS Phonetic Index
+Sound-alike lookup for words the speech recognizer mishears
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+_VOWELS = frozenset("aeiou")
+
+
+def phonetic_key(word: str) -> str:
+    """
+    Metaphone-style sound key for a word or phrase
+    
+    Spellings that sound alike map to the same key ("lunch"/"launch",
+    "crome"/"chrome", "note pad"/"notepad"): letters become consonant
+    sound classes, vowels after the first letter are dropped and doubled
+    letters count once. Spaces and punctuation are ignored.
+    """
+    letters = [char for char in word.lower() if "a" <= char <= "z"]
+    
+    # Doubled letters sound once (except "cc", as in "accent")
+    w = "".join(
+        char for idx, char in enumerate(letters)
+        if idx == 0 or char != letters[idx - 1] or char == "c"
+    )
+    if not w:
+        return ""
+    
+    # Silent or softened initial letters
+    if w[:2] in ("kn", "gn", "pn", "wr", "ae"):
+        w = w[1:]
+    elif w[0] == "x":
+        w = "s" + w[1:]
+    elif w[:2] == "wh":
+        w = "w" + w[2:]
+    
+    codes: List[str] = []
+    length = len(w)
+    idx = 0
+    while idx < length:
+        char = w[idx]
+        nxt = w[idx + 1] if idx + 1 < length else ""
+        after = w[idx + 2] if idx + 2 < length else ""
+        prev = w[idx - 1] if idx else ""
+        skip = 0
+        
+        if char in _VOWELS:
+            code = "A" if idx == 0 else ""
+        elif char == "b":
+            code = "" if prev == "m" and not nxt else "B"
+        elif char == "c":
+            if nxt == "h":
+                # "chrome", "school" are hard; "chat", "lunch" are soft
+                code = "K" if after in ("r", "l") or prev == "s" else "X"
+                skip = 1
+            elif nxt in ("e", "i", "y"):
+                code = "S"
+            elif nxt == "k":
+                code = ""
+            else:
+                code = "K"
+        elif char == "d":
+            code = "J" if nxt == "g" and after in ("e", "i", "y") else "T"
+        elif char == "g":
+            if nxt == "h" and idx:
+                code = ""
+                skip = 1
+            elif nxt == "n" and (not after or w[idx + 2:] == "ed"):
+                code = ""
+            elif nxt in ("e", "i", "y"):
+                code = "J"
+            else:
+                code = "K"
+        elif char == "h":
+            code = "H" if nxt in _VOWELS and prev not in _VOWELS else ""
+        elif char == "p":
+            code = "F" if nxt == "h" else "P"
+            skip = 1 if nxt == "h" else 0
+        elif char == "q":
+            code = "K"
+        elif char == "s":
+            if nxt == "h":
+                code = "X"
+                skip = 1
+            elif nxt == "i" and after in ("o", "a"):
+                code = "X"
+            else:
+                code = "S"
+        elif char == "t":
+            if nxt == "h":
+                code = "0"
+                skip = 1
+            elif nxt == "i" and after in ("o", "a"):
+                code = "X"
+            elif nxt == "c" and after == "h":
+                code = ""
+            else:
+                code = "T"
+        elif char == "v":
+            code = "F"
+        elif char in ("w", "y"):
+            code = char.upper() if nxt in _VOWELS else ""
+        elif char == "x":
+            code = "KS"
+        elif char == "z":
+            code = "S"
+        else:
+            code = char.upper()
+        
+        if code:
+            codes.append(code)
+        idx += 1 + skip
+    
+    return "".join(codes)
+
+
+def _letter_count(word: str) -> int:
+    return sum(1 for char in word if char.isalpha())
+
+
+def edit_distance(first: str, second: str) -> int:
+    """Levenshtein distance (insertions, deletions and substitutions)"""
+    if len(first) < len(second):
+        first, second = second, first
+    previous = list(range(len(second) + 1))
+    for idx, char in enumerate(first, 1):
+        current = [idx]
+        for jdx, other in enumerate(second, 1):
+            current.append(min(
+                previous[jdx] + 1,
+                current[jdx - 1] + 1,
+                previous[jdx - 1] + (char != other)
+            ))
+        previous = current
+    return previous[-1]
+
+
+class PhoneticIndex:
+    """
+    Hash index from sound keys to a known vocabulary
+    
+    Resolves a misheard word to the known word that sounds the same with
+    a single dictionary lookup, so STT slips are corrected before any
+    fuzzy scoring runs. Entries may be multi-word ("file explorer").
+    """
+    
+    # Words shorter than this are too ambiguous to respell
+    MIN_WORD_LENGTH = 4
+    
+    # resolve() respells a name only this close to the known one: one
+    # edit per RESPELL_LETTERS_PER_EDIT letters, at least one
+    RESPELL_LETTERS_PER_EDIT = 5
+    
+    def __init__(self, vocabulary: Iterable[str]):
+        # First entry registered for a key wins
+        self._keys: Dict[str, str] = {}
+        self._known: Set[str] = set()
+        self._prefixes: Dict[Tuple[str, ...], str] = {}
+        self._max_words = 0
+        
+        for entry in vocabulary:
+            entry = entry.lower().strip()
+            words = entry.split()
+            if not words:
+                continue
+            self._known.update(words)
+            
+            key = phonetic_key(entry)
+            if len(key) >= 2:
+                self._keys.setdefault(key, entry)
+            
+            word_keys = tuple(phonetic_key(word) for word in words)
+            self._prefixes.setdefault(word_keys, entry)
+            self._max_words = max(self._max_words, len(words))
+        
+        logger.debug(f"Phonetic index built: {len(self._known)} words, {len(self._keys)} keys")
+    
+    def __contains__(self, word: str) -> bool:
+        return word in self._known
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def lookup(self, text: str) -> Optional[str]:
+        """Vocabulary entry that sounds like text, if any"""
+        if text in self._known:
+            return text
+        key = phonetic_key(text)
+        if len(key) < 2:
+            return None
+        return self._keys.get(key)
+    
+    def resolve(self, text: str) -> str:
+        """
+        Vocabulary entry that text is a near-exact mishearing of, or text
+        unchanged
+        
+        Unlike lookup(), a shared sound key is not enough: the key is
+        coarse ("kodi" and "code" share one), and a wrong respelling of an
+        app name opens or closes the wrong program. The text must have no
+        digits, at least MIN_WORD_LENGTH letters, and be within a few
+        edits of the entry, spaces aside ("crome" -> "chrome",
+        "note pad" -> "notepad").
+        """
+        if text in self._known:
+            return text
+        if any(char.isdigit() for char in text) or _letter_count(text) < self.MIN_WORD_LENGTH:
+            return text
+        
+        entry = self.lookup(text)
+        if entry is None:
+            return text
+        squeezed = entry.replace(" ", "")
+        max_edits = max(1, len(squeezed) // self.RESPELL_LETTERS_PER_EDIT)
+        if edit_distance(text.replace(" ", ""), squeezed) > max_edits:
+            return text
+        return entry
+    
+    def normalize(self, text: str) -> str:
+        """
+        Respell misheard words in a lowercased utterance
+        
+        Unknown words become the known word with the same sound key
+        ("lunch" -> "launch"), and a pair of words containing an unknown
+        one is joined when together they sound like a different known
+        word ("note pad" -> "notepad"). Known words are never changed.
+        """
+        words = text.split()
+        out: List[str] = []
+        idx = 0
+        
+        while idx < len(words):
+            word = words[idx]
+            
+            if idx + 1 < len(words):
+                joined = self._join(word, words[idx + 1])
+                if joined is not None:
+                    out.append(joined)
+                    idx += 2
+                    continue
+            
+            if word not in self._known and len(word) >= self.MIN_WORD_LENGTH:
+                word = self._keys.get(phonetic_key(word), word)
+            out.append(word)
+            idx += 1
+        
+        return " ".join(out)
+    
+    def _join(self, first: str, second: str) -> Optional[str]:
+        """Known word that two adjacent words sound like together, if any"""
+        if first in self._known and second in self._known:
+            return None
+        # Both halves must be real syllables, not digits or stray letters
+        if _letter_count(first) < 2 or _letter_count(second) < 2:
+            return None
+        if len(first) + len(second) <= self.MIN_WORD_LENGTH:
+            return None
+        joined = self._keys.get(phonetic_key(first + second))
+        # A join that just reproduces one half drops the other word
+        # ("open now" sounds like "open")
+        if joined == first or joined == second:
+            return None
+        return joined
+    
+    def match_prefix(self, text: str) -> Optional[Tuple[str, str]]:
+        """
+        Match a vocabulary entry against the first words of text
+        
+        Args:
+            text: Lowercased utterance
+        
+        Returns:
+            (matched entry, remaining text), or None
+        """
+        words = text.split()
+        for count in range(min(self._max_words, len(words)), 0, -1):
+            word_keys = tuple(phonetic_key(word) for word in words[:count])
+            entry = self._prefixes.get(word_keys)
+            if entry is not None:
+                return entry, " ".join(words[count:])
+        return None
@@ -0,0 +1,246 @@
+"""
+JARVIS TF-IDF Intent Engine
+Character n-gram TF-IDF classifier over the intent pattern database
+"""
+
+from typing import Dict, List, Optional, Tuple
+import math
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def char_ngrams(text: str, min_n: int = 3, max_n: int = 5) -> Dict[str, int]:
+    """
+    Count character n-grams of each word, padded with spaces
+    
+    Word-bounded n-grams (" op", "ope", "pen ") make misspellings and
+    partial words ("launchin", "chrom") share most features with the
+    pattern they came from.
+    """
+    counts: Dict[str, int] = {}
+    for word in text.lower().split():
+        padded = f" {word} "
+        for n in range(min_n, max_n + 1):
+            if n > len(padded):
+                break
+            for start in range(len(padded) - n + 1):
+                gram = padded[start:start + n]
+                counts[gram] = counts.get(gram, 0) + 1
+    return counts
+
+
+class TfidfIntentClassifier:
+    """
+    TF-IDF nearest-pattern intent classifier
+    
+    Every pattern phrase is vectorized once into an L2-normalised row of a
+    features x patterns matrix. Classifying an utterance gathers the
+    matrix rows of its n-grams and takes one vector-matrix product, so
+    the cost depends on the utterance length and pattern count only -
+    features the utterance does not contain are never touched.
+    """
+    
+    def __init__(
+        self,
+        intent_keys: List[str],
+        patterns: List[List[str]],
+        ngram_range: Tuple[int, int] = (3, 5)
+    ):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is required for the TF-IDF intent engine")
+        
+        self.intent_keys = intent_keys
+        self._min_n, self._max_n = ngram_range
+        
+        phrases = [pattern for intent_patterns in patterns for pattern in intent_patterns]
+        self._intent_offsets = np.cumsum([0] + [len(p) for p in patterns[:-1]])
+        
+        # Vocabulary and document frequencies
+        doc_counts = [self._ngrams(phrase) for phrase in phrases]
+        self._features: Dict[str, int] = {}
+        doc_freq: List[int] = []
+        for counts in doc_counts:
+            for gram in counts:
+                idx = self._features.setdefault(gram, len(self._features))
+                if idx == len(doc_freq):
+                    doc_freq.append(0)
+                doc_freq[idx] += 1
+        
+        # Smoothed idf, as in scikit-learn
+        total = len(phrases)
+        self._idf = np.array(
+            [math.log((1 + total) / (1 + df)) + 1.0 for df in doc_freq],
+            dtype=np.float32
+        )
+        
+        # features x patterns, columns L2-normalised
+        matrix = np.zeros((len(self._features), total), dtype=np.float32)
+        for col, counts in enumerate(doc_counts):
+            for gram, count in counts.items():
+                idx = self._features[gram]
+                matrix[idx, col] = (1.0 + math.log(count)) * self._idf[idx]
+        norms = np.linalg.norm(matrix, axis=0)
+        norms[norms == 0] = 1.0
+        self._matrix = matrix / norms
+        
+        # Plain floats for the per-query Python loop
+        self._idf_list: List[float] = self._idf.tolist()
+        self._unseen_idf = math.log(1 + total) + 1.0
+        
+        logger.debug(
+            f"TF-IDF engine built: {total} patterns, {len(self._features)} n-gram features"
+        )
+    
+    def _ngrams(self, text: str) -> Dict[str, int]:
+        return char_ngrams(text, self._min_n, self._max_n)
+    
+    def scores(self, text: str) -> "np.ndarray":
+        """Best cosine similarity per intent (in intent_keys order)"""
+        features = self._features
+        idf = self._idf_list
+        unseen_idf = self._unseen_idf
+        
+        ids: List[int] = []
+        weights: List[float] = []
+        norm_sq = 0.0
+        for gram, count in self._ngrams(text).items():
+            idx = features.get(gram)
+            tf = 1.0 + math.log(count) if count > 1 else 1.0
+            if idx is None:
+                # Unseen n-grams only dilute the query
+                norm_sq += (tf * unseen_idf) ** 2
+                continue
+            weight = tf * idf[idx]
+            ids.append(idx)
+            weights.append(weight)
+            norm_sq += weight * weight
+        
+        if not ids:
+            return np.zeros(len(self.intent_keys), dtype=np.float32)
+        
+        vector = np.asarray(weights, dtype=np.float32) / math.sqrt(norm_sq)
+        pattern_scores = vector @ self._matrix[ids]
+        return np.maximum.reduceat(pattern_scores, self._intent_offsets)
+    
+    def classify(self, text: str) -> Tuple[Optional[str], float]:
+        """
+        Most similar intent for an utterance
+        
+        Returns:
+            (intent key, cosine similarity 0-1), or (None, 0.0)
+        """
+        ranked = self.rank(text, 1)
+        return ranked[0] if ranked else (None, 0.0)
+    
+    def rank(self, text: str, k: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Intents similar to an utterance, most similar first
+        
+        Args:
+            text: Utterance
+            k: Maximum number of intents (None = all)
+        
+        Returns:
+            (intent key, cosine similarity) pairs with similarity > 0;
+            ties keep declaration order
+        """
+        intent_scores = self.scores(text)
+        order = np.argsort(-intent_scores, kind="stable")[:k]
+        return [
+            (self.intent_keys[idx], float(intent_scores[idx]))
+            for idx in order
+            if intent_scores[idx] > 0.0
+        ]
+    
+    def __len__(self) -> int:
+        return len(self._features)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# ENGINE EVALUATION
+# ══════════════════════════════════════════════════════════════════════════════
+
+# Labelled utterances phrased the way people talk rather than the way the
+# patterns are written; None means "no command" (general conversation)
+EVAL_SAMPLES: List[Tuple[str, Optional[str]]] = [
+    ("open chrome", "app.open"),
+    ("could you open chrome for me", "app.open"),
+    ("launch spotify", "app.open"),
+    ("close notepad", "app.close"),
+    ("turn the volume up", "volume.up"),
+    ("make it louder", "volume.up"),
+    ("turn it down a bit", "volume.down"),
+    ("mute the sound", "volume.mute"),
+    ("set volume to 40", "volume.set"),
+    ("what time is it", "time_date.time"),
+    ("what's the date today", "time_date.date"),
+    ("search for python tutorials", "web.search"),
+    ("play despacito on youtube", "web.youtube"),
+    ("remember that my car is blue", "memory.remember"),
+    ("what do you remember about my car", "memory.recall"),
+    ("hello there", "conversation.greeting"),
+    ("goodbye jarvis", "conversation.farewell"),
+    ("thank you so much", "conversation.thanks"),
+    ("how are you doing", "conversation.how_are_you"),
+    ("who are you", "conversation.who_are_you"),
+    ("tell me a joke", "conversation.joke"),
+    ("stop", "conversation.stop"),
+    ("shut down the computer", "system.shutdown"),
+    ("restart my pc", "system.restart"),
+    ("lock the screen", "system.lock"),
+    ("take a screenshot", "system.screenshot"),
+    ("what can you do", "conversation.capabilities"),
+    ("i like turtles", None),
+    ("blah blah music", None),
+    ("asdf qwer", None),
+    ("banana", None),
+]
+
+
+def evaluate_engine(brain, samples: List[Tuple[str, Optional[str]]] = None) -> Dict[str, float]:
+    """
+    Accuracy and per-utterance latency of a Brain on labelled samples
+    
+    Returns:
+        Dict with accuracy (0-1), avg_ms and p95_ms
+    """
+    import time
+    
+    samples = samples or EVAL_SAMPLES
+    correct = 0
+    timings: List[float] = []
+    
+    for text, expected in samples:
+        start = time.perf_counter()
+        intent = brain.classify_intent(text)
+        timings.append((time.perf_counter() - start) * 1000)
+        if brain.intent_key(intent) == expected:
+            correct += 1
+    
+    timings.sort()
+    return {
+        "accuracy": correct / len(samples),
+        "avg_ms": sum(timings) / len(timings),
+        "p95_ms": timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+    }
+
+
+def compare_engines(samples: List[Tuple[str, Optional[str]]] = None) -> Dict[str, Dict[str, float]]:
+    """Evaluate every classifier engine on the same samples"""
+    from .brain import Brain, CLASSIFIER_ENGINES
+    
+    results = {}
+    for engine in CLASSIFIER_ENGINES:
+        brain = Brain(engine=engine)
+        # Warm up lazy imports and caches before timing
+        brain.classify_intent("warm up")
+        results[engine] = evaluate_engine(brain, samples)
+    return results
+
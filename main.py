@@ -161,11 +161,11 @@ def run_text_mode():
     setup_logging()
     
     from core.brain import get_brain
-    from core.dispatcher import get_dispatcher
+    from core.dispatcher import get_dispatcher, load_skills
     from core.memory import get_memory
     
-    # Import skills
-    from skills import system, apps, time_date, web, conversation
+    # Register skills
+    load_skills()
     
     brain = get_brain()
     dispatcher = get_dispatcher()
@@ -190,20 +190,26 @@ def run_text_mode():
                 print(f"\n{Fore.CYAN}JARVIS:{Style.RESET_ALL} Goodbye, Sir. Until next time.\n")
                 break
             
-            # Process command
-            intent = brain.classify_intent(command)
-            result = dispatcher.dispatch(intent)
+            # Process command (compound commands yield several intents,
+            # independent ones run concurrently)
+            intents = brain.classify_compound(command, "local")
+            results = dispatcher.dispatch_many(intents)
             
-            if result.get("success"):
-                handler_result = result.get("result", {})
-                if isinstance(handler_result, dict) and handler_result.get("response"):
-                    response = handler_result["response"]
-                elif isinstance(handler_result, str):
-                    response = handler_result
+            responses = []
+            for intent, result in zip(intents, results):
+                # A runner-up intent may have been dispatched instead
+                intent = result.get("intent", intent)
+                if result.get("success"):
+                    handler_result = result.get("result", {})
+                    if isinstance(handler_result, dict) and handler_result.get("response"):
+                        responses.append(handler_result["response"])
+                    elif isinstance(handler_result, str):
+                        responses.append(handler_result)
+                    else:
+                        responses.append(brain.generate_response(intent, result))
                 else:
-                    response = brain.generate_response(intent, result)
-            else:
-                response = brain.generate_response(intent, result)
+                    responses.append(brain.generate_response(intent, result))
+            response = " ".join(responses)
             
             print(f"{Fore.CYAN}JARVIS:{Style.RESET_ALL} {response}\n")
             
@@ -214,6 +220,28 @@ def run_text_mode():
             print(f"{Fore.RED}Error:{Style.RESET_ALL} {e}\n")
 
 
+def compare_classifier_engines():
+    """Print accuracy and latency of each intent classifier engine"""
+    from core.tfidf import compare_engines
+    
+    for engine, stats in compare_engines().items():
+        print(
+            f"{engine:6s} accuracy {stats['accuracy']:.1%}  "
+            f"avg {stats['avg_ms']:.3f} ms  p95 {stats['p95_ms']:.3f} ms"
+        )
+
+
+def benchmark_dispatch_middleware():
+    """Print the per-call cost of dispatch middleware"""
+    from core.middleware import benchmark_middleware
+    
+    for label, stats in benchmark_middleware().items():
+        print(
+            f"{label:22s} {stats['ns_per_call']:8.0f} ns/call  "
+            f"overhead {stats['overhead_ns']:+6.0f} ns"
+        )
+
+
 if __name__ == "__main__":
     import argparse
     
@@ -228,13 +256,27 @@ if __name__ == "__main__":
         action='store_true',
         help='Enable debug mode'
     )
+    parser.add_argument(
+        '--compare-engines',
+        action='store_true',
+        help='Report accuracy and latency of each intent classifier engine'
+    )
+    parser.add_argument(
+        '--bench-middleware',
+        action='store_true',
+        help='Report the per-call overhead of dispatch middleware'
+    )
     
     args = parser.parse_args()
     
     if args.debug:
         os.environ['JARVIS_DEBUG'] = '1'
     
-    if args.text:
+    if args.compare_engines:
+        compare_classifier_engines()
+    elif args.bench_middleware:
+        benchmark_dispatch_middleware()
+    elif args.text:
         run_text_mode()
     else:
         main()
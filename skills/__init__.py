@@ -1,5 +1,5 @@
-from . import system
-from . import apps
-from . import time_date
-from . import web
-from . import conversation
+"""
+JARVIS Skills
+Skill modules are listed in config.SKILL_MODULES and loaded with
+core.dispatcher.load_skills(), which imports each one on first use
+"""
@@ -13,58 +13,10 @@ from pathlib import Path
 
 from core.dispatcher import skill, get_dispatcher
 from core.brain import IntentCategory, Intent
-from config import APP_PATHS
+from config import APP_PATHS, WEB_APPS
 
 logger = logging.getLogger(__name__)
 
-# Web-based applications that should open in browser
-WEB_APPS = {
-    "youtube": "https://www.youtube.com",
-    "netflix": "https://www.netflix.com",
-    "prime video": "https://www.primevideo.com",
-    "amazon prime": "https://www.primevideo.com",
-    "hotstar": "https://www.hotstar.com",
-    "disney plus": "https://www.disneyplus.com",
-    "facebook": "https://www.facebook.com",
-    "instagram": "https://www.instagram.com",
-    "twitter": "https://www.twitter.com",
-    "x": "https://www.x.com",
-    "whatsapp": "https://web.whatsapp.com",
-    "whatsapp web": "https://web.whatsapp.com",
-    "telegram": "https://web.telegram.org",
-    "gmail": "https://mail.google.com",
-    "google mail": "https://mail.google.com",
-    "google drive": "https://drive.google.com",
-    "drive": "https://drive.google.com",
-    "google docs": "https://docs.google.com",
-    "google sheets": "https://sheets.google.com",
-    "google photos": "https://photos.google.com",
-    "github": "https://www.github.com",
-    "linkedin": "https://www.linkedin.com",
-    "reddit": "https://www.reddit.com",
-    "amazon": "https://www.amazon.in",
-    "flipkart": "https://www.flipkart.com",
-    "chatgpt": "https://chat.openai.com",
-    "claude": "https://claude.ai",
-    "google": "https://www.google.com",
-    "wikipedia": "https://www.wikipedia.org",
-    "stackoverflow": "https://stackoverflow.com",
-    "stack overflow": "https://stackoverflow.com",
-    "outlook": "https://outlook.live.com",
-    "spotify web": "https://open.spotify.com",
-    "twitch": "https://www.twitch.tv",
-    "pinterest": "https://www.pinterest.com",
-    "tiktok": "https://www.tiktok.com",
-    "snapchat": "https://www.snapchat.com",
-    "google meet": "https://meet.google.com",
-    "zoom web": "https://zoom.us/join",
-    "notion": "https://www.notion.so",
-    "trello": "https://trello.com",
-    "slack": "https://slack.com",
-    "canva": "https://www.canva.com",
-    "figma": "https://www.figma.com",
-}
-
 
 def is_web_app(app_name: str) -> Optional[str]:
     """
@@ -175,7 +127,8 @@ def get_running_processes() -> Dict[str, int]:
 @skill(
     IntentCategory.APPLICATION,
     ["open"],
-    "Open/launch applications"
+    "Open/launch applications",
+    timeout=10.0
 )
 def handle_app_open(intent: Intent) -> Dict[str, Any]:
     """Open an application"""
@@ -228,7 +181,7 @@ def handle_app_open(intent: Intent) -> Dict[str, Any]:
             "app": app_name,
             "path": app_path
         }
-        
+    
     except FileNotFoundError:
         logger.error(f"Application not found: {app_name}")
         return {
@@ -246,7 +199,10 @@ def handle_app_open(intent: Intent) -> Dict[str, Any]:
 @skill(
     IntentCategory.APPLICATION,
     ["close"],
-    "Close applications"
+    "Close applications",
+    cpu_bound=True,
+    lane="bulk",
+    max_concurrency=1
 )
 def handle_app_close(intent: Intent) -> Dict[str, Any]:
     """Close an application"""
@@ -273,7 +229,7 @@ def handle_app_close(intent: Intent) -> Dict[str, Any]:
                     proc.terminate()
                     closed_count += 1
                     logger.info(f"Terminated: {proc.info['name']} (PID: {proc.info['pid']})")
-                    
+            
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
         
@@ -287,7 +243,7 @@ def handle_app_close(intent: Intent) -> Dict[str, Any]:
                 "response": f"I couldn't find {app_name} running.",
                 "error": "app_not_running"
             }
-            
+    
     except Exception as e:
         logger.error(f"Failed to close {app_name}: {e}")
         return {
@@ -299,7 +255,11 @@ def handle_app_close(intent: Intent) -> Dict[str, Any]:
 @skill(
     IntentCategory.APPLICATION,
     ["list", "running"],
-    "List running applications"
+    "List running applications",
+    cpu_bound=True,
+    cache_ttl=5.0,
+    lane="bulk",
+    max_concurrency=1
 )
 def handle_app_list(intent: Intent) -> Dict[str, Any]:
     """List running applications"""
@@ -327,7 +287,7 @@ def handle_app_list(intent: Intent) -> Dict[str, Any]:
             "response": f"Currently running: {', '.join(app_list)}",
             "apps": app_list
         }
-        
+    
     except Exception as e:
         logger.error(f"Failed to list apps: {e}")
         return {"error": str(e)}
@@ -11,6 +11,7 @@ from datetime import datetime
 from core.dispatcher import skill, get_dispatcher
 from core.brain import IntentCategory, Intent
 from core.memory import get_memory
+from core.entities import extract_slot
 from config import USER_NAME, ASSISTANT_NAME
 
 logger = logging.getLogger(__name__)
@@ -120,7 +121,8 @@ def handle_who_are_you(intent: Intent) -> Dict[str, Any]:
 @skill(
     IntentCategory.CONVERSATION,
     ["capabilities", "help"],
-    "List capabilities"
+    "List capabilities",
+    cache_ttl=3600.0
 )
 def handle_capabilities(intent: Intent) -> Dict[str, Any]:
     """List what Jarvis can do"""
@@ -177,7 +179,8 @@ def handle_joke(intent: Intent) -> Dict[str, Any]:
 @skill(
     IntentCategory.CONVERSATION,
     ["stop", "cancel"],
-    "Stop/cancel current action"
+    "Stop/cancel current action",
+    lane="express"
 )
 def handle_stop(intent: Intent) -> Dict[str, Any]:
     """Handle stop/cancel commands"""
@@ -204,11 +207,7 @@ def handle_remember(intent: Intent) -> Dict[str, Any]:
     content = intent.entities.get("content", "").strip()
     
     if not content:
-        raw = intent.raw_text.lower()
-        for trigger in ["remember that", "remember", "note that", "save"]:
-            if trigger in raw:
-                content = raw.split(trigger, 1)[-1].strip()
-                break
+        content = extract_slot("memory.remember", "content", intent.raw_text.lower()) or ""
     
     if not content:
         return {
@@ -248,11 +247,7 @@ def handle_recall(intent: Intent) -> Dict[str, Any]:
     query = intent.entities.get("query", "").strip()
     
     if not query:
-        raw = intent.raw_text.lower()
-        for trigger in ["remember about", "know about", "recall"]:
-            if trigger in raw:
-                query = raw.split(trigger, 1)[-1].strip()
-                break
+        query = extract_slot("memory.recall", "query", intent.raw_text.lower()) or ""
     
     memory = get_memory()
     
@@ -306,7 +301,10 @@ def handle_forget(intent: Intent) -> Dict[str, Any]:
 @skill(
     IntentCategory.CONVERSATION,
     ["general", "*"],
-    "Handle general conversation with AI"
+    "Handle general conversation with AI",
+    timeout=15.0,
+    lane="bulk",
+    max_concurrency=2
 )
 def handle_general(intent: Intent) -> Dict[str, Any]:
     """Handle general/unclassified conversation using AI"""
@@ -362,4 +360,4 @@ def fallback_handler(intent: Intent) -> Dict[str, Any]:
 
 
 # Set fallback on module load
-get_dispatcher().set_fallback(fallback_handler)
+get_dispatcher().set_fallback(fallback_handler, timeout=15.0, max_concurrency=2)
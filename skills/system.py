@@ -22,7 +22,8 @@ logger = logging.getLogger(__name__)
 @skill(
     IntentCategory.SYSTEM,
     ["shutdown"],
-    "Shutdown the computer"
+    "Shutdown the computer",
+    lane="express"
 )
 def handle_shutdown(intent: Intent) -> Dict[str, Any]:
     """Shutdown the computer"""
@@ -43,7 +44,8 @@ def handle_shutdown(intent: Intent) -> Dict[str, Any]:
 @skill(
     IntentCategory.SYSTEM,
     ["restart"],
-    "Restart the computer"
+    "Restart the computer",
+    lane="express"
 )
 def handle_restart(intent: Intent) -> Dict[str, Any]:
     """Restart the computer"""
@@ -66,7 +68,8 @@ def handle_restart(intent: Intent) -> Dict[str, Any]:
 @skill(
     IntentCategory.SYSTEM,
     ["lock"],
-    "Lock the computer"
+    "Lock the computer",
+    lane="express"
 )
 def handle_lock(intent: Intent) -> Dict[str, Any]:
     """Lock the computer"""
@@ -86,7 +89,8 @@ def handle_lock(intent: Intent) -> Dict[str, Any]:
 @skill(
     IntentCategory.SYSTEM,
     ["screenshot"],
-    "Take a screenshot"
+    "Take a screenshot",
+    timeout=10.0
 )
 def handle_screenshot(intent: Intent) -> Dict[str, Any]:
     """Take a screenshot"""
@@ -126,9 +130,12 @@ def get_volume_interface():
     """Get Windows audio volume interface"""
     try:
         from ctypes import cast, POINTER
-        from comtypes import CLSCTX_ALL
+        from comtypes import CLSCTX_ALL, CoInitialize
         from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
         
+        # Skills run on dispatcher worker threads; COM is per thread
+        CoInitialize()
+        
         devices = AudioUtilities.GetSpeakers()
         interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
         volume = cast(interface, POINTER(IAudioEndpointVolume))
@@ -141,7 +148,9 @@ def get_volume_interface():
 @skill(
     IntentCategory.VOLUME,
     ["up"],
-    "Increase volume"
+    "Increase volume",
+    timeout=3.0,
+    lane="express"
 )
 def handle_volume_up(intent: Intent) -> Dict[str, Any]:
     """Increase volume by 10%"""
@@ -170,7 +179,9 @@ def handle_volume_up(intent: Intent) -> Dict[str, Any]:
 @skill(
     IntentCategory.VOLUME,
     ["down"],
-    "Decrease volume"
+    "Decrease volume",
+    timeout=3.0,
+    lane="express"
 )
 def handle_volume_down(intent: Intent) -> Dict[str, Any]:
     """Decrease volume by 10%"""
@@ -198,7 +209,9 @@ def handle_volume_down(intent: Intent) -> Dict[str, Any]:
 @skill(
     IntentCategory.VOLUME,
     ["mute"],
-    "Mute volume"
+    "Mute volume",
+    timeout=3.0,
+    lane="express"
 )
 def handle_volume_mute(intent: Intent) -> Dict[str, Any]:
     """Mute system volume"""
@@ -220,7 +233,9 @@ def handle_volume_mute(intent: Intent) -> Dict[str, Any]:
 @skill(
     IntentCategory.VOLUME,
     ["unmute"],
-    "Unmute volume"
+    "Unmute volume",
+    timeout=3.0,
+    lane="express"
 )
 def handle_volume_unmute(intent: Intent) -> Dict[str, Any]:
     """Unmute system volume"""
@@ -242,7 +257,9 @@ def handle_volume_unmute(intent: Intent) -> Dict[str, Any]:
 @skill(
     IntentCategory.VOLUME,
     ["set"],
-    "Set volume to specific level"
+    "Set volume to specific level",
+    timeout=3.0,
+    lane="express"
 )
 def handle_volume_set(intent: Intent) -> Dict[str, Any]:
     """Set volume to specific level"""
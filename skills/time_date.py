@@ -54,7 +54,10 @@ def handle_time(intent: Intent) -> Dict[str, Any]:
 @skill(
     IntentCategory.TIME_DATE,
     ["date", "today", "day"],
-    "Get current date"
+    "Get current date",
+    cache_ttl=3600.0,
+    # Keyed by the date itself, so the cache never outlives midnight
+    cache_key=lambda entities: datetime.now().date()
 )
 def handle_date(intent: Intent) -> Dict[str, Any]:
     """Get current date"""
@@ -10,6 +10,7 @@ from typing import Dict, Any
 
 from core.dispatcher import skill, get_dispatcher
 from core.brain import IntentCategory, Intent
+from core.entities import extract_slot
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +18,8 @@ logger = logging.getLogger(__name__)
 @skill(
     IntentCategory.WEB,
     ["search"],
-    "Search the web"
+    "Search the web",
+    timeout=5.0
 )
 def handle_web_search(intent: Intent) -> Dict[str, Any]:
     """Perform a web search"""
@@ -25,11 +27,7 @@ def handle_web_search(intent: Intent) -> Dict[str, Any]:
     
     if not query:
         # Use the raw text if no query extracted
-        raw = intent.raw_text.lower()
-        for trigger in ["search for", "search", "google", "look up", "find"]:
-            if trigger in raw:
-                query = raw.split(trigger, 1)[-1].strip()
-                break
+        query = extract_slot("web.search", "query", intent.raw_text.lower()) or ""
     
     if not query:
         return {
@@ -60,7 +58,8 @@ def handle_web_search(intent: Intent) -> Dict[str, Any]:
 @skill(
     IntentCategory.WEB,
     ["open", "website", "site"],
-    "Open a website"
+    "Open a website",
+    timeout=5.0
 )
 def handle_web_open(intent: Intent) -> Dict[str, Any]:
     """Open a website"""
@@ -130,20 +129,17 @@ def handle_web_open(intent: Intent) -> Dict[str, Any]:
 @skill(
     IntentCategory.WEB,
     ["youtube"],
-    "Search or play YouTube"
+    "Search or play YouTube",
+    timeout=5.0
 )
 def handle_youtube(intent: Intent) -> Dict[str, Any]:
     """Search or play YouTube"""
     query = intent.entities.get("query", "").strip()
     
     if not query:
-        raw = intent.raw_text.lower()
-        for trigger in ["play", "youtube", "watch", "search youtube for"]:
-            if trigger in raw:
-                query = raw.split(trigger, 1)[-1].strip()
-                # Clean up common phrases
-                query = query.replace("on youtube", "").replace("video", "").strip()
-                break
+        query = extract_slot("web.youtube", "query", intent.raw_text.lower()) or ""
+        # Clean up common phrases
+        query = query.replace("on youtube", "").replace("video", "").strip()
     
     if not query:
         # Just open YouTube
@@ -175,18 +171,15 @@ def handle_youtube(intent: Intent) -> Dict[str, Any]:
 @skill(
     IntentCategory.WEB,
     ["weather"],
-    "Check weather"
+    "Check weather",
+    timeout=5.0
 )
 def handle_weather(intent: Intent) -> Dict[str, Any]:
     """Check weather (opens weather website)"""
     raw_text = intent.raw_text.lower()
     
     # Try to extract location
-    location = ""
-    for trigger in ["weather in", "weather for", "weather at"]:
-        if trigger in raw_text:
-            location = raw_text.split(trigger, 1)[-1].strip()
-            break
+    location = extract_slot("web.weather", "location", raw_text) or ""
     
     if location:
         encoded_loc = urllib.parse.quote_plus(location)
@@ -7,6 +7,7 @@ Browser-based interface with speech recognition
 from flask import Flask, render_template, request, jsonify
 from flask_cors import CORS
 import logging
+import math
 import sys
 from pathlib import Path
 
@@ -15,7 +16,7 @@ JARVIS_ROOT = Path(__file__).parent
 sys.path.insert(0, str(JARVIS_ROOT))
 
 from core.brain import get_brain
-from core.dispatcher import get_dispatcher
+from core.dispatcher import get_dispatcher, load_skills
 from core.memory import get_memory
 from config import ASSISTANT_NAME, USER_NAME
 
@@ -35,8 +36,8 @@ brain = get_brain()
 dispatcher = get_dispatcher()
 memory = get_memory()
 
-# Load all skills
-from skills import system, apps, time_date, web, conversation
+# Register all skills (each module is imported on first use)
+load_skills()
 
 logger.info("JARVIS Web Server initialized")
 
@@ -54,7 +55,9 @@ def chat():
     
     Expected JSON:
     {
-        "message": "user's message"
+        "message": "user's message",
+        "session_id": "conversation id for follow-ups like \"close it\"; without
+                       one, follow-ups are not resolved"
     }
     
     Returns JSON:
@@ -66,6 +69,10 @@ def chat():
     try:
         data = request.get_json()
         user_message = data.get('message', '').strip()
+        # Never derived from the client address: every browser behind one
+        # NAT or proxy would share (and resolve against) one conversation
+        session_id = data.get('session_id')
+        session_id = str(session_id) if session_id else None
         
         if not user_message:
             return jsonify({
@@ -75,24 +82,45 @@ def chat():
         
         logger.info(f"User: {user_message}")
         
-        # Classify intent
-        intent = brain.classify_intent(user_message)
-        logger.debug(f"Intent: {intent.category.name}.{intent.action} (confidence: {intent.confidence})")
+        # Classify intents (compound commands yield several)
+        intents = brain.classify_compound(user_message, session_id)
+        for intent in intents:
+            logger.debug(f"Intent: {intent.category.name}.{intent.action} (confidence: {intent.confidence})")
         
-        # Dispatch to appropriate handler
-        result = dispatcher.dispatch(intent)
+        # Dispatch to appropriate handlers, independent commands concurrently
+        results = dispatcher.dispatch_many(intents)
+        # A runner-up intent may have been dispatched instead
+        intents = [result.get('intent', intent) for intent, result in zip(intents, results)]
         
-        # Extract response
-        if result.get('success'):
-            handler_result = result.get('result', {})
-            
-            if isinstance(handler_result, dict):
-                response_text = handler_result.get('response', 'Done.')
+        # Every command was turned away by a skill at its concurrency
+        # limit: tell the client to back off rather than queue more work
+        if all(result.get('error') == 'busy' for result in results):
+            retry_after = max(result.get('retry_after', 1) for result in results)
+            logger.warning(f"Busy, rejected: {user_message}")
+            response = jsonify({
+                'success': False,
+                'error': 'busy',
+                'response': "I'm handling too many requests right now. Please try again in a moment."
+            })
+            response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+            return response, 429
+        
+        # Extract responses
+        responses = []
+        for result in results:
+            if result.get('success'):
+                handler_result = result.get('result', {})
+                
+                if isinstance(handler_result, dict):
+                    responses.append(handler_result.get('response', 'Done.'))
+                else:
+                    responses.append(str(handler_result))
+            elif result.get('error') == 'busy':
+                responses.append("I'm too busy for that one right now, please try it again shortly.")
             else:
-                response_text = str(handler_result)
-        else:
-            response_text = "I apologize, I encountered an issue processing that request."
-            logger.error(f"Dispatch failed: {result.get('error')}")
+                responses.append("I apologize, I encountered an issue processing that request.")
+                logger.error(f"Dispatch failed: {result.get('error')}")
+        response_text = " ".join(responses)
         
         logger.info(f"JARVIS: {response_text}")
         
@@ -100,12 +128,20 @@ def chat():
             'success': True,
             'response': response_text,
             'intent': {
-                'category': intent.category.name,
-                'action': intent.action,
-                'confidence': intent.confidence
-            }
+                'category': intents[0].category.name,
+                'action': intents[0].action,
+                'confidence': intents[0].confidence
+            },
+            'intents': [
+                {
+                    'category': intent.category.name,
+                    'action': intent.action,
+                    'confidence': intent.confidence
+                }
+                for intent in intents
+            ]
         })
-        
+    
     except Exception as e:
         logger.error(f"Chat error: {e}", exc_info=True)
         return jsonify({
@@ -127,7 +163,8 @@ def status():
             'name': ASSISTANT_NAME,
             'user': USER_NAME,
             'ai_enabled': ai.is_available(),
-            'skills_loaded': len(dispatcher._handlers)
+            'skills_loaded': len(dispatcher._handlers),
+            'brain_startup': brain.get_startup_stats()
         })
     except Exception as e:
         logger.error(f"Status error: {e}")
@@ -144,7 +181,13 @@ def get_skills():
         skills = dispatcher.get_registered_skills()
         return jsonify({
             'success': True,
-            'skills': skills
+            'skills': skills,
+            'stats': dispatcher.get_skill_stats(),
+            'breakers': dispatcher.get_breaker_stats(),
+            'result_cache': dispatcher.get_result_cache_stats(),
+            'lanes': dispatcher.get_lane_stats(),
+            'concurrency': dispatcher.get_concurrency_stats(),
+            'middleware': dispatcher.get_middleware_stats()
         })
     except Exception as e:
         logger.error(f"Skills error: {e}")